@@ -0,0 +1,119 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark the strategies used to list the versions of a package.
+
+For each package, the script compares:
+
+- ``legacy``: the full ``/pypi/<pkg>/json`` document decoded with ``json.loads``.
+- ``legacy-stream``: the same document, pulling only the ``releases`` keys
+  out of the stream.
+- ``simple-stream``: the PEP 691 simple JSON index, pulling only the
+  ``versions`` items out of the stream.
+
+Bytes transferred are the (possibly compressed) bytes read from the socket.
+Elapsed time covers reading and parsing the response body.
+
+Usage::
+
+    python scripts/benchmark_pkg_versions.py pyaedt ansys-dpf-core
+
+"""
+
+import json
+import re
+import sys
+import time
+
+import requests
+
+from ansys.tools.installer.common import JSON_CHUNK_SIZE, SIMPLE_JSON_CONTENT_TYPE
+from ansys.tools.installer.json_stream import iter_member_strings
+
+DEFAULT_PACKAGES = ["pyaedt", "ansys-dpf-core", "ansys-mapdl-core", "pyansys"]
+
+
+def legacy(session, pkg_name):
+    """List versions from the legacy JSON API using ``json.loads``."""
+    response = session.get(f"https://pypi.org/pypi/{pkg_name}/json", stream=True)
+    response.raise_for_status()
+    tstart = time.perf_counter()
+    versions = list(json.loads(response.content)["releases"])
+    return response, versions, time.perf_counter() - tstart
+
+
+def legacy_stream(session, pkg_name):
+    """List versions from the legacy JSON API using the streaming parser."""
+    response = session.get(f"https://pypi.org/pypi/{pkg_name}/json", stream=True)
+    response.raise_for_status()
+    tstart = time.perf_counter()
+    chunks = response.iter_content(JSON_CHUNK_SIZE)
+    versions = list(iter_member_strings(chunks, "releases"))
+    return response, versions, time.perf_counter() - tstart
+
+
+def simple_stream(session, pkg_name):
+    """List versions from the PEP 691 simple JSON API."""
+    name = re.sub(r"[-_.]+", "-", pkg_name).lower()
+    response = session.get(
+        f"https://pypi.org/simple/{name}/",
+        headers={"Accept": SIMPLE_JSON_CONTENT_TYPE},
+        stream=True,
+    )
+    response.raise_for_status()
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith(SIMPLE_JSON_CONTENT_TYPE):
+        raise ValueError(f"Index replied with {content_type}")
+    tstart = time.perf_counter()
+    chunks = response.iter_content(JSON_CHUNK_SIZE)
+    versions = list(iter_member_strings(chunks, "versions"))
+    return response, versions, time.perf_counter() - tstart
+
+
+STRATEGIES = {
+    "legacy": legacy,
+    "legacy-stream": legacy_stream,
+    "simple-stream": simple_stream,
+}
+
+
+def main(packages):
+    """Run all strategies for each package and print a table."""
+    session = requests.Session()
+    print(f"{'package':<24}{'strategy':<16}{'versions':>9}{'bytes':>12}{'ms':>10}")
+    for pkg_name in packages:
+        for name, strategy in STRATEGIES.items():
+            try:
+                response, versions, elapsed = strategy(session, pkg_name)
+            except (requests.exceptions.RequestException, ValueError) as err:
+                print(f"{pkg_name:<24}{name:<16} failed: {err}")
+                continue
+            nbytes = response.raw.tell()
+            response.close()
+            print(
+                f"{pkg_name:<24}{name:<16}{len(versions):>9}"
+                f"{nbytes:>12}{elapsed * 1000:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or DEFAULT_PACKAGES)
@@ -0,0 +1,130 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark the discovery of virtual environments.
+
+A synthetic tree of about ``DIRECTORIES`` directories is created in a
+temporary directory, split over ``ROOTS`` search paths. Each search path
+holds environments directly, and projects with an environment in a
+``.venv`` subdirectory one level down. The script compares:
+
+- ``listdir``: the former discovery, ``os.listdir`` and one
+  ``os.path.isfile``/``isdir`` call per check, one level deep.
+- ``depth-1``: ``discover_venvs`` one level deep.
+- ``depth-3``: ``discover_venvs`` three levels deep.
+- ``depth-3-cached``: the same, with the inventory already filled.
+
+Usage::
+
+    python scripts/benchmark_venv_discovery.py [DIRECTORIES] [ROOTS]
+
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from ansys.tools.installer.inventory import Inventory
+from ansys.tools.installer.venv_discovery import discover_venvs
+
+DIRECTORIES = 10000
+ROOTS = 4
+REPEAT = 5
+
+
+def make_tree(base, directories, roots):
+    """Create the synthetic tree and return its search paths."""
+    search_paths = [os.path.join(base, f"root{i}") for i in range(roots)]
+    created = 0
+    i = 0
+    while created < directories:
+        root = search_paths[i % roots]
+        if i % 2:
+            # Project with sources, tests, docs and an environment
+            project = os.path.join(root, f"project{i}")
+            for sub in ("src", "tests", "docs"):
+                os.makedirs(os.path.join(project, sub))
+            env = os.path.join(project, ".venv")
+            created += 4
+        else:
+            env = os.path.join(root, f"env{i}")
+        os.makedirs(os.path.join(env, "bin"))
+        with open(os.path.join(env, "bin", "activate"), "w"):
+            pass
+        with open(os.path.join(env, "pyvenv.cfg"), "w") as f:
+            f.write("home = /usr/bin\nversion = 3.12.1\n")
+        created += 2
+        i += 1
+    return search_paths, created
+
+
+def listdir(search_paths):
+    """Find environments the way the former discovery did."""
+    names = []
+    for venv_dir in search_paths:
+        for name in os.listdir(venv_dir):
+            path = os.path.join(venv_dir, name)
+            if os.path.isfile(os.path.join(path, "bin", "activate")) or (
+                not os.path.isdir(os.path.join(path, "condabin"))
+                and os.path.isdir(os.path.join(path, "conda-meta"))
+            ):
+                names.append(name)
+    return names
+
+
+def timed(function):
+    """Get the fastest run of a function, and its result."""
+    best = None
+    for _ in range(REPEAT):
+        tstart = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - tstart
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main(directories, roots):
+    """Run all strategies and print a table."""
+    with tempfile.TemporaryDirectory() as base:
+        search_paths, created = make_tree(base, directories, roots)
+        inventory = Inventory(os.path.join(base, "inventory.json"))
+        discover_venvs(search_paths, 3, inventory=inventory)
+
+        strategies = {
+            "listdir": lambda: listdir(search_paths),
+            "depth-1": lambda: discover_venvs(search_paths, 1),
+            "depth-3": lambda: discover_venvs(search_paths, 3),
+            "depth-3-cached": lambda: discover_venvs(
+                search_paths, 3, inventory=inventory
+            ),
+        }
+        print(f"{created} directories in {roots} search paths")
+        print(f"{'strategy':<16}{'environments':>13}{'ms':>10}")
+        for name, strategy in strategies.items():
+            found, elapsed = timed(strategy)
+            print(f"{name:<16}{len(found):>13}{elapsed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args) if args else main(DIRECTORIES, ROOTS)
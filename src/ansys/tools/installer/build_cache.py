@@ -0,0 +1,410 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cache of Python versions built from source."""
+
+import fnmatch
+import functools
+import json
+import logging
+import os
+import platform
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from ansys.tools.installer import CACHE_DIR
+from ansys.tools.installer.commands import run_command
+from ansys.tools.installer.configure_json import get_configure_json
+from ansys.tools.installer.constants import (
+    BUILD_CACHE_DIR,
+    BUILD_CACHE_MAX_SIZE,
+    BUILD_PROFILE_DEFAULT,
+)
+from ansys.tools.installer.linux_functions import get_os_version
+from ansys.tools.installer.python_build import c_compiler
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+# Written at the root of each cached build to relocate it when installed
+BUILD_MANIFEST = ".ansys-build.json"
+
+_ARTIFACT_SUFFIX = ".tar.gz"
+# Anything else is replaced in artifact names, ``*`` being kept for lookups
+_UNSAFE_CHARACTERS = re.compile(r"[^\w.*-]+")
+
+_BUILD_CACHE = None
+_BUILD_CACHE_LOCK = threading.Lock()
+
+
+class BuildCache:
+    """Cache of Python versions built from source, packed as tarballs.
+
+    A successful build is packed with its ``--prefix`` directory as the
+    single root of a ``.tar.gz`` artifact, named after the Python version,
+    the OS id of ``get_os_version``, the machine, the compiler and the
+    build profile. Artifacts are written to a local cache, and published to
+    a shared directory when one is configured, so that a version compiled
+    once can be installed on every other machine of a team by extracting it.
+
+    Scripts and configuration files refer to the directory Python was built
+    in. They are rewritten when an artifact is installed in another one.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory holding the local artifacts. Defaults to
+        ``CACHE_DIR/builds``.
+    shared_dir : str, optional
+        Directory shared with other machines, looked up after the local
+        cache and where new artifacts are published.
+    max_size : int, optional
+        Maximum size in bytes of the local artifacts. The least recently
+        used ones are removed beyond it.
+
+    """
+
+    def __init__(self, cache_dir=None, shared_dir=None, max_size=BUILD_CACHE_MAX_SIZE):
+        """Instantiate the cache."""
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, "builds")
+        self.shared_dir = shared_dir
+        self.max_size = max_size
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def artifact_name(self, version, profile=BUILD_PROFILE_DEFAULT, compiler=None):
+        """Get the file name of the artifact of a build.
+
+        Parameters
+        ----------
+        version : str
+            Python version, for example ``"3.12.0"``.
+        profile : str, default: BUILD_PROFILE_DEFAULT
+            Build profile.
+        compiler : str, optional
+            Compiler id. Defaults to the one of ``compiler_id()``.
+
+        Returns
+        -------
+        str
+            File name of the artifact.
+
+        Examples
+        --------
+        >>> BuildCache().artifact_name("3.12.0")
+        'python-3.12.0-22.04-x86_64-gcc-11.4.0-standard.tar.gz'
+
+        """
+        parts = [
+            "python",
+            version,
+            get_os_version() or "unknown",
+            platform.machine() or "unknown",
+            compiler or compiler_id() or "unknown",
+            profile,
+        ]
+        return "-".join(_UNSAFE_CHARACTERS.sub("_", part) for part in parts) + (
+            _ARTIFACT_SUFFIX
+        )
+
+    def lookup(self, version, profile=BUILD_PROFILE_DEFAULT):
+        """Find the artifact of a build, locally first.
+
+        Without a compiler to build with, artifacts made with any compiler
+        are accepted.
+
+        Parameters
+        ----------
+        version : str
+            Python version, for example ``"3.12.0"``.
+        profile : str, default: BUILD_PROFILE_DEFAULT
+            Build profile.
+
+        Returns
+        -------
+        str or None
+            Path of the artifact, or ``None`` if it was never built.
+
+        """
+        compiler = None if compiler_id() else "*"
+        pattern = self.artifact_name(version, profile, compiler=compiler)
+        for directory in (self.cache_dir, self.shared_dir):
+            if not directory:
+                continue
+            try:
+                names = sorted(fnmatch.filter(os.listdir(directory), pattern))
+            except OSError:
+                continue
+            if names:
+                path = os.path.join(directory, names[0])
+                if directory == self.cache_dir:
+                    # Recently used artifacts are the last ones evicted
+                    os.utime(path)
+                LOG.debug("Found build of Python %s in %s", version, path)
+                return path
+        return None
+
+    def store(self, prefix, version, profile=BUILD_PROFILE_DEFAULT):
+        """Pack a build into the cache and publish it.
+
+        Parameters
+        ----------
+        prefix : str
+            Directory Python was installed in.
+        version : str
+            Python version, for example ``"3.12.0"``.
+        profile : str, default: BUILD_PROFILE_DEFAULT
+            Build profile.
+
+        Returns
+        -------
+        str
+            Path of the local artifact.
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the build cannot be packed.
+
+        """
+        prefix = os.path.abspath(prefix)
+        name = self.artifact_name(version, profile)
+        with open(os.path.join(prefix, BUILD_MANIFEST), "w") as f:
+            json.dump(
+                {
+                    "version": version,
+                    "profile": profile,
+                    "prefix": prefix,
+                    "created": time.time(),
+                },
+                f,
+            )
+
+        start = time.perf_counter()
+        path = os.path.join(self.cache_dir, name)
+        staging = f"{path}.{os.getpid()}.tmp"
+        try:
+            run_command(
+                [
+                    "tar",
+                    "czf",
+                    staging,
+                    "-C",
+                    os.path.dirname(prefix),
+                    os.path.basename(prefix),
+                ],
+                check=True,
+            )
+            os.replace(staging, path)
+        finally:
+            if os.path.exists(staging):
+                os.remove(staging)
+        LOG.info(
+            "Cached build of Python %s in %s in %.1fs",
+            version,
+            path,
+            time.perf_counter() - start,
+        )
+        self._evict(keep=path)
+
+        if self.shared_dir:
+            try:
+                _copy_atomic(path, os.path.join(self.shared_dir, name))
+            except OSError as err:
+                LOG.warning(
+                    "Unable to publish %s to %s: %s", name, self.shared_dir, err
+                )
+        return path
+
+    def install(self, artifact, prefix):
+        """Install a cached build in a directory.
+
+        Parameters
+        ----------
+        artifact : str
+            Path of the artifact returned by :meth:`lookup`.
+        prefix : str
+            Directory to install Python in. It is replaced if it exists.
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the artifact cannot be extracted.
+
+        """
+        prefix = os.path.abspath(prefix)
+        parent = os.path.dirname(prefix)
+        os.makedirs(parent, exist_ok=True)
+        start = time.perf_counter()
+        staging = tempfile.mkdtemp(prefix=".unpack-", dir=parent)
+        try:
+            run_command(["tar", "xzf", artifact, "-C", staging], check=True)
+            (name,) = os.listdir(staging)
+            root = os.path.join(staging, name)
+            manifest_path = os.path.join(root, BUILD_MANIFEST)
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            _relocate(root, manifest["prefix"], prefix)
+            manifest["prefix"] = prefix
+            with open(manifest_path, "w") as f:
+                json.dump(manifest, f)
+
+            if os.path.isdir(prefix):
+                shutil.rmtree(prefix)
+            os.replace(root, prefix)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        LOG.info(
+            "Installed %s in %s in %.1fs",
+            os.path.basename(artifact),
+            prefix,
+            time.perf_counter() - start,
+        )
+
+    def _evict(self, keep):
+        """Remove the least recently used artifacts beyond the maximum size."""
+        artifacts = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(_ARTIFACT_SUFFIX) and entry.path != keep:
+                stat = entry.stat()
+                artifacts.append((stat.st_mtime, stat.st_size, entry.path))
+        size = os.path.getsize(keep) + sum(size for _, size, _ in artifacts)
+        for _, artifact_size, path in sorted(artifacts):
+            if size <= self.max_size:
+                break
+            LOG.debug("Evicting %s from the build cache", path)
+            os.remove(path)
+            size -= artifact_size
+
+
+def get_build_cache():
+    """Get the build cache shared by the whole application.
+
+    The shared directory of the cache follows the configuration.
+
+    Returns
+    -------
+    BuildCache
+        Shared build cache.
+
+    """
+    global _BUILD_CACHE
+    with _BUILD_CACHE_LOCK:
+        if _BUILD_CACHE is None:
+            config = get_configure_json()
+            _BUILD_CACHE = BuildCache(shared_dir=config.build_cache_dir)
+            config.signals.changed.connect(_on_setting_changed)
+    return _BUILD_CACHE
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_id():
+    """Get the name and version of the C compiler used to build Python.
+
+    Returns
+    -------
+    str or None
+        Compiler id, or ``None`` if there is no compiler.
+
+    Examples
+    --------
+    >>> compiler_id()
+    'gcc-11.4.0'
+
+    """
+    compiler = c_compiler().split()[0]
+    try:
+        output = run_command([compiler, "--version"], timeout=10).output
+    except OSError:
+        return None
+    first_line = output.partition("\n")[0]
+    version = re.search(r"\d+\.\d+(?:\.\d+)?", first_line)
+    if version is None:
+        return None
+    if "clang" in first_line:
+        name = "clang"
+    elif "gcc" in first_line.lower() or "Free Software Foundation" in output:
+        name = "gcc"
+    else:
+        name = os.path.basename(compiler)
+    return f"{name}-{version.group(0)}"
+
+
+def _on_setting_changed(key):
+    """Follow the shared directory of the configuration."""
+    if key == BUILD_CACHE_DIR:
+        get_build_cache().shared_dir = get_configure_json().build_cache_dir
+
+
+def _relocate(root, old_prefix, new_prefix):
+    """Rewrite the scripts and configuration files referring to the old prefix."""
+    if old_prefix == new_prefix:
+        return
+    old, new = old_prefix.encode(), new_prefix.encode()
+    candidates = []
+    for directory in ("bin", os.path.join("lib", "pkgconfig")):
+        for entry in _scandir(os.path.join(root, directory)):
+            candidates.append(entry.path)
+    for lib in _scandir(os.path.join(root, "lib")):
+        if not lib.name.startswith("python"):
+            continue
+        for entry in _scandir(lib.path):
+            if entry.name.startswith("_sysconfigdata"):
+                candidates.append(entry.path)
+            elif entry.name.startswith("config-"):
+                candidates.extend(e.path for e in _scandir(entry.path))
+
+    for path in candidates:
+        if os.path.islink(path) or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            content = f.read()
+        if old not in content or b"\0" in content:
+            # binaries find their prefix from their own location
+            continue
+        mode = os.stat(path).st_mode
+        with open(path, "wb") as f:
+            f.write(content.replace(old, new))
+        os.chmod(path, mode)
+
+
+def _scandir(path):
+    """List a directory, which may not exist."""
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _copy_atomic(src, dst):
+    """Copy a file so that readers never see it partially written."""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    staging = f"{dst}.{os.getpid()}.tmp"
+    try:
+        shutil.copyfile(src, staging)
+        os.replace(staging, dst)
+    finally:
+        if os.path.exists(staging):
+            os.remove(staging)
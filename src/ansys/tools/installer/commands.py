@@ -0,0 +1,409 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run commands without a terminal."""
+
+import collections
+import logging
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import threading
+import time
+
+from ansys.tools.installer.constants import COMMAND_KILL_DELAY, COMMAND_OUTPUT_TAIL
+from ansys.tools.installer.jobs import current_job
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+# Terminal emulators tried in order, with the arguments running a command
+TERMINALS = (
+    ("gnome-terminal", ["--"]),
+    ("x-terminal-emulator", ["-e"]),
+    ("konsole", ["-e"]),
+    ("xfce4-terminal", ["-x"]),
+    ("xterm", ["-e"]),
+)
+
+
+class CommandResult:
+    """Result of a command.
+
+    Attributes
+    ----------
+    args : str or list
+        Command run.
+    returncode : int
+        Exit code of the command. Negative for a command killed by a signal.
+    output : str
+        Last lines of the output of the command.
+    duration : float
+        Seconds taken by the command.
+    timeout : float or None
+        Timeout of the command.
+    timed_out : bool
+        Whether the command was stopped because it ran out of time.
+    cancelled : bool
+        Whether the command was cancelled.
+
+    """
+
+    __slots__ = (
+        "args",
+        "returncode",
+        "output",
+        "duration",
+        "timeout",
+        "timed_out",
+        "cancelled",
+    )
+
+    def __init__(
+        self, args, returncode, output, duration, timeout, timed_out, cancelled
+    ):
+        """Instantiate a result."""
+        self.args = args
+        self.returncode = returncode
+        self.output = output
+        self.duration = duration
+        self.timeout = timeout
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+
+    def __repr__(self):
+        """Represent the result."""
+        return (
+            f"CommandResult({self.args!r}, returncode={self.returncode}, "
+            f"duration={self.duration:.2f})"
+        )
+
+    def check_returncode(self):
+        """Raise an error if the command failed.
+
+        Raises
+        ------
+        subprocess.TimeoutExpired
+            If the command ran out of time.
+        subprocess.CalledProcessError
+            If the command exited with an error, or was cancelled.
+
+        """
+        if self.timed_out:
+            raise subprocess.TimeoutExpired(self.args, self.timeout, output=self.output)
+        if self.returncode:
+            raise subprocess.CalledProcessError(
+                self.returncode, self.args, output=self.output
+            )
+
+
+class Command:
+    """Command running in the background, with its output streamed.
+
+    The standard output and error of the command are merged and read line
+    by line in a thread. Each line is passed to ``on_output``, appended to
+    ``log_path``, added to the output of the job running the command, if
+    any, and logged. The last ones are kept for the result.
+    On POSIX systems, the command runs in its own process group so that
+    cancelling it also stops the processes it started.
+
+    Parameters
+    ----------
+    args : str or list
+        Command to run. A string is run by the shell.
+    cwd : str, optional
+        Working directory of the command.
+    env : dict, optional
+        Environment of the command. Defaults to the one of this process.
+    timeout : float, optional
+        Seconds after which the command is stopped.
+    on_output : callable, optional
+        Called from the reading thread with each line of output.
+    log_path : str, optional
+        File the command and its output are appended to.
+    tail : int, default: COMMAND_OUTPUT_TAIL
+        Number of lines of output kept for the result.
+
+    Examples
+    --------
+    >>> command = Command(["python", "-m", "pip", "list"]).start()
+    >>> command.wait().returncode
+    0
+
+    """
+
+    def __init__(
+        self,
+        args,
+        cwd=None,
+        env=None,
+        timeout=None,
+        on_output=None,
+        log_path=None,
+        tail=COMMAND_OUTPUT_TAIL,
+    ):
+        """Instantiate the command."""
+        self.args = args
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self.on_output = on_output
+        self.log_path = log_path
+
+        self._tail = collections.deque(maxlen=tail)
+        self._job = None
+        self._lock = threading.Lock()
+        self._process = None
+        self._reader = None
+        self._timer = None
+        self._start = None
+        self._timed_out = False
+        self._cancelled = False
+
+    @property
+    def display(self):
+        """Command as it would be typed in a shell."""
+        if isinstance(self.args, str):
+            return self.args
+        return shlex.join(str(arg) for arg in self.args)
+
+    @property
+    def running(self):
+        """Whether the command was started and is not finished."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """Start the command.
+
+        Returns
+        -------
+        Command
+            This command.
+
+        Raises
+        ------
+        OSError
+            If the command cannot be started.
+
+        """
+        job = current_job()
+        with self._lock:
+            if self._process is not None:
+                raise RuntimeError(f"{self.display} was already started")
+            self._job = job
+            LOG.debug("Running %s", self.display)
+            if self.log_path is not None:
+                with open(self.log_path, "a") as log:
+                    log.write(f"$ {self.display}\n")
+            self._start = time.perf_counter()
+            self._process = subprocess.Popen(
+                self.args,
+                shell=isinstance(self.args, str),
+                cwd=self.cwd,
+                env=self.env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                start_new_session=os.name == "posix",
+            )
+            self._reader = threading.Thread(target=self._read, daemon=True)
+            self._reader.start()
+            if self.timeout is not None:
+                self._timer = threading.Timer(self.timeout, self._expire)
+                self._timer.daemon = True
+                self._timer.start()
+        if job is not None:
+            # Cancelling the job running this command stops it
+            job.add_cancel_callback(self.cancel)
+        return self
+
+    def wait(self):
+        """Wait for the command to finish.
+
+        Returns
+        -------
+        CommandResult
+            Result of the command.
+
+        """
+        self._reader.join()
+        returncode = self._process.wait()
+        if self._timer is not None:
+            self._timer.cancel()
+        result = CommandResult(
+            self.args,
+            returncode,
+            "".join(self._tail),
+            time.perf_counter() - self._start,
+            self.timeout,
+            self._timed_out,
+            self._cancelled,
+        )
+        LOG.debug(
+            "%s exited with %d in %.2fs", self.display, returncode, result.duration
+        )
+        return result
+
+    def cancel(self):
+        """Stop the command, and the processes it started."""
+        with self._lock:
+            self._cancelled = True
+        LOG.debug("Cancelling %s", self.display)
+        self._terminate()
+
+    def _read(self):
+        """Stream the output of the command until it is closed."""
+        log = open(self.log_path, "a") if self.log_path is not None else None
+        try:
+            for line in self._process.stdout:
+                self._tail.append(line)
+                LOG.debug("| %s", line.rstrip())
+                if log is not None:
+                    log.write(line)
+                if self._job is not None:
+                    self._job.add_output(line)
+                if self.on_output is not None:
+                    try:
+                        self.on_output(line)
+                    except Exception:
+                        LOG.exception("Unable to handle the output of a command")
+        finally:
+            if log is not None:
+                log.close()
+
+    def _expire(self):
+        """Stop the command once it ran out of time."""
+        if not self.running:
+            return
+        LOG.warning("%s timed out after %ss", self.display, self.timeout)
+        self._timed_out = True
+        self._terminate()
+
+    def _terminate(self):
+        """Ask the command to stop, then kill it if it does not."""
+        process = self._process
+        if process is None or process.poll() is not None:
+            return
+        _signal(process, signal.SIGTERM)
+        killer = threading.Timer(COMMAND_KILL_DELAY, _kill, args=(process,))
+        killer.daemon = True
+        killer.start()
+
+
+def run_command(args, check=False, **kwargs):
+    """Run a command without a terminal and wait for it to finish.
+
+    Parameters
+    ----------
+    args : str or list
+        Command to run. A string is run by the shell.
+    check : bool, default: False
+        Whether to raise an error if the command fails.
+    **kwargs
+        Options of ``Command``.
+
+    Returns
+    -------
+    CommandResult
+        Result of the command.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If ``check`` is set and the command fails.
+    subprocess.TimeoutExpired
+        If ``check`` is set and the command runs out of time.
+
+    Examples
+    --------
+    >>> run_command("ls ~ | wc -l", check=True).returncode
+    0
+
+    """
+    result = Command(args, **kwargs).start().wait()
+    if check:
+        result.check_returncode()
+    return result
+
+
+def open_terminal(command, cwd=None, wait=False):
+    """Run a command in a new terminal window.
+
+    Only for commands interacting with the user, such as consoles or
+    scripts asking for permissions.
+
+    Parameters
+    ----------
+    command : str
+        Shell command to run.
+    cwd : str, optional
+        Working directory of the command.
+    wait : bool, default: False
+        Whether to wait for the terminal to be closed.
+
+    Returns
+    -------
+    subprocess.Popen
+        Terminal process.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no terminal emulator is installed.
+
+    """
+    for terminal, options in TERMINALS:
+        path = shutil.which(terminal)
+        if path is None:
+            continue
+        args = [path]
+        if wait and terminal == "gnome-terminal":
+            args.append("--wait")
+        args += options + ["sh", "-c", command]
+        LOG.debug("Opening %s", shlex.join(args))
+        process = subprocess.Popen(args, cwd=cwd)
+        if wait:
+            process.wait()
+        return process
+    raise FileNotFoundError("No terminal emulator found to run " + command)
+
+
+def _kill(process):
+    """Kill a process which did not stop when asked to."""
+    if process.poll() is None:
+        LOG.debug("Killing process %d", process.pid)
+        _signal(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+
+def _signal(process, signum):
+    """Send a signal to a process and the processes of its group."""
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signum)
+        else:
+            process.send_signal(signum)
+    except (ProcessLookupError, PermissionError):
+        pass
@@ -25,17 +25,27 @@
 from functools import wraps
 import json
 import logging
+import re
 import sys
-from threading import Thread
+from threading import Lock, Thread
 import traceback
 
-import certifi
+from packaging.version import InvalidVersion
 from packaging.version import parse as parse_version
 import requests
 
+from ansys.tools.installer.json_stream import iter_member_strings
+from ansys.tools.installer.metadata_cache import MetadataCache
+
 LOG = logging.getLogger(__name__)
 LOG.setLevel("DEBUG")
 
+SIMPLE_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+JSON_CHUNK_SIZE = 64 * 1024
+
+_METADATA_CACHE = None
+_METADATA_CACHE_LOCK = Lock()
+
 
 def threaded(fn):
     """Call a function using a thread."""
@@ -79,6 +89,66 @@ def protected(fn):
     return wrapper
 
 
+def get_metadata_cache():
+    """Get the metadata cache shared by the whole application.
+
+    Returns
+    -------
+    ansys.tools.installer.metadata_cache.MetadataCache
+        Persistent cache of PyPI metadata stored in ``CACHE_DIR``.
+    """
+    global _METADATA_CACHE
+    with _METADATA_CACHE_LOCK:
+        if _METADATA_CACHE is None:
+            _METADATA_CACHE = MetadataCache()
+    return _METADATA_CACHE
+
+
+def _sort_versions(versions):
+    """Sort versions in descending order, dropping invalid ones."""
+    parsed = []
+    for ver in versions:
+        try:
+            parsed.append((parse_version(ver), ver))
+        except InvalidVersion:
+            LOG.debug(f"Ignoring invalid version {ver}")
+    return [ver for _, ver in sorted(parsed, reverse=True)]
+
+
+def _parse_simple_versions(response):
+    """Extract the versions from a PEP 691 simple JSON response.
+
+    Returns ``None`` when the index does not provide the JSON API with
+    the ``versions`` key (PEP 700), so that the caller falls back to the
+    legacy JSON API.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith(SIMPLE_JSON_CONTENT_TYPE):
+        return None
+    try:
+        return _sort_versions(
+            iter_member_strings(response.iter_content(JSON_CHUNK_SIZE), "versions")
+        )
+    except KeyError:
+        return None
+
+
+def _parse_releases(response):
+    """Extract the released versions from a legacy PyPI JSON response.
+
+    Only the keys of ``releases`` are pulled out of the stream. The
+    response is not read any further.
+    """
+    return _sort_versions(
+        iter_member_strings(response.iter_content(JSON_CHUNK_SIZE), "releases")
+    )
+
+
+def _parse_extras(response):
+    """Extract the extras of a release from a PyPI JSON response."""
+    return json.loads(response.content)["info"].get("provides_extra") or []
+
+
 def get_pkg_versions(pkg_name):
     """
     Get the available versions of a package.
@@ -95,37 +165,42 @@ def get_pkg_versions(pkg_name):
 
     Notes
     -----
-    This function fetches the package information from the PyPI API
-    and filters the package versions based on specific criteria
-    for the 'pyansys' package.
+    This function fetches the package versions from the PyPI simple JSON
+    API (PEP 691), falling back to the legacy JSON API, and filters the
+    package versions based on specific criteria for the 'pyansys'
+    package. Responses are kept in the persistent metadata cache, see
+    :func:`get_metadata_cache`.
 
     Examples
     --------
     >>> get_pkg_versions("numpy")
     ['1.22.1', '1.22.0', '1.21.2', ...]
     """
-    session = requests.Session()
-    session.verify = False
-    urls = [
-        f"https://pypi.python.org/pypi/{pkg_name}/json",
-        f"https://pypi.org/pypi/{pkg_name}/json",
+    simple_name = re.sub(r"[-_.]+", "-", pkg_name).lower()
+    sources = [
+        (
+            f"https://pypi.org/simple/{simple_name}/",
+            {"Accept": SIMPLE_JSON_CONTENT_TYPE},
+            _parse_simple_versions,
+        ),
+        (f"https://pypi.python.org/pypi/{pkg_name}/json", None, _parse_releases),
+        (f"https://pypi.org/pypi/{pkg_name}/json", None, _parse_releases),
     ]
     all_versions = [""]
 
-    for url in urls:
+    for url, headers, parse in sources:
         try:
-            releases = json.loads(requests.get(url, verify=certifi.where()).content)[
-                "releases"
-            ]
-            all_versions = sorted(releases, key=parse_version, reverse=True)
+            versions = get_metadata_cache().get(url, parse, headers=headers)
+            if versions is None:
+                LOG.debug(f"{url} does not provide the JSON API.")
+                continue
+            all_versions = versions
             if pkg_name == "pyansys":
                 all_versions = [x for x in all_versions if int(x.split(".")[0]) > 0]
             break
-        except (requests.exceptions.SSLError, requests.exceptions.ConnectionError):
+        except (requests.exceptions.RequestException, KeyError, ValueError):
             LOG.warning(f"Cannot connect to {url}... No version listed.")
 
-    session.verify = True
-
     return all_versions
 
 
@@ -155,8 +230,6 @@ def get_targets(pkg_name, version, exclude_tests_and_docs=True):
     >>> get_targets("pyansys", "0.1.0")
     ['target1', 'target2', ...]
     """
-    session = requests.Session()
-    session.verify = False
     urls = [
         f"https://pypi.python.org/pypi/{pkg_name}/{version}/json",
         f"https://pypi.org/pypi/{pkg_name}/{version}/json",
@@ -165,18 +238,11 @@ def get_targets(pkg_name, version, exclude_tests_and_docs=True):
 
     for url in urls:
         try:
-            targets = json.loads(requests.get(url, verify=certifi.where()).content)[
-                "info"
-            ]
-            # Check if targets are available
-            if targets.get("provides_extra"):
-                all_targets = targets["provides_extra"]
+            all_targets = list(get_metadata_cache().get(url, _parse_extras))
             break
-        except (requests.exceptions.SSLError, requests.exceptions.ConnectionError):
+        except (requests.exceptions.RequestException, KeyError, ValueError):
             LOG.warning(f"Cannot connect to {url}... No target listed.")
 
-    session.verify = True
-
     # Ensure the first element is an empty string
     all_targets.insert(0, "")
 
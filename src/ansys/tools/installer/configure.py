@@ -27,10 +27,22 @@ import os
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtGui import QStandardItem, QStandardItemModel
 
-from ansys.tools.installer.configure_json import ConfigureJson
+from ansys.tools.installer.configure_json import get_configure_json
 from ansys.tools.installer.constants import (
     ANSYS_FAVICON,
+    BUILD_CACHE_DIR,
+    BUILD_INCREMENTAL,
+    BUILD_PROFILE,
+    BUILD_PROFILES,
+    CA_BUNDLE,
+    HTTP_PROXY,
+    PACKAGE_MANAGERS_MAX_AGE,
+    PACKAGE_MANAGERS_MAX_AGE_LIMIT,
+    PREFETCH_METADATA,
     VENV_DEFAULT_PATH,
+    VENV_DISCOVERY_MAX_DEPTH,
+    VENV_IGNORE,
+    VENV_SEARCH_DEPTH,
     VENV_SEARCH_PATH,
 )
 
@@ -43,7 +55,7 @@ class Configure(QtWidgets.QWidget):
         try:
             super().__init__()
             self._parent = parent
-            self.configure_json = ConfigureJson()
+            self.configure_json = get_configure_json()
             self._parent.configure_window = QtWidgets.QWidget()
             self._parent.configure_window.move(
                 self._parent.configure_window.frameGeometry().center()
@@ -120,9 +132,171 @@ class Configure(QtWidgets.QWidget):
                 configure_window_search_venv_Hlayout
             )
 
+            # ---> Add search depth and ignored directories
+            configure_window_search_options_layout = QtWidgets.QHBoxLayout()
+            configure_window_search_options_layout.addWidget(QtWidgets.QLabel("Depth:"))
+            self.configure_window_search_depth_spin = QtWidgets.QSpinBox()
+            self.configure_window_search_depth_spin.setRange(
+                1, VENV_DISCOVERY_MAX_DEPTH
+            )
+            self.configure_window_search_depth_spin.setValue(
+                self.configure_json.venv_search_depth
+            )
+            configure_window_search_options_layout.addWidget(
+                self.configure_window_search_depth_spin
+            )
+            configure_window_search_options_layout.addWidget(
+                QtWidgets.QLabel("Ignore in this path:")
+            )
+            self._venv_ignore = self.configure_json.venv_ignore
+            self.configure_window_search_ignore_edit = QtWidgets.QLineEdit()
+            self.configure_window_search_ignore_edit.setPlaceholderText(
+                "Glob patterns separated by commas, for example build, old-*"
+            )
+            self.configure_window_search_ignore_edit.textEdited.connect(
+                self._change_ignore_search_venv
+            )
+            configure_window_search_options_layout.addWidget(
+                self.configure_window_search_ignore_edit
+            )
+            configure_window_search_venv_layout.addLayout(
+                configure_window_search_options_layout
+            )
+
             # Finally, add all the previous widgets to the global layout
             configure_options_layout.addWidget(configure_window_search_venv)
 
+            # Group 3: Network options
+            configure_window_network = QtWidgets.QGroupBox("Network:")
+            configure_window_network_layout = QtWidgets.QVBoxLayout()
+            configure_window_network_layout.setContentsMargins(10, 20, 10, 20)
+            configure_window_network.setLayout(configure_window_network_layout)
+
+            # ---> Add check box
+            self.configure_window_prefetch_checkbox = QtWidgets.QCheckBox(
+                "Fetch all PyAnsys package versions in the background at startup"
+            )
+            self.configure_window_prefetch_checkbox.setChecked(
+                self.configure_json.prefetch_metadata
+            )
+            configure_window_network_layout.addWidget(
+                self.configure_window_prefetch_checkbox
+            )
+
+            # ---> Add proxy and certificate boxes
+            configure_window_proxy_layout = QtWidgets.QHBoxLayout()
+            configure_window_proxy_layout.addWidget(QtWidgets.QLabel("Proxy:"))
+            self.configure_window_proxy_edit = QtWidgets.QLineEdit()
+            self.configure_window_proxy_edit.setPlaceholderText(
+                "http://proxy.example.com:8080"
+            )
+            self.configure_window_proxy_edit.setText(
+                self.configure_json.http_proxy or ""
+            )
+            configure_window_proxy_layout.addWidget(self.configure_window_proxy_edit)
+            configure_window_network_layout.addLayout(configure_window_proxy_layout)
+
+            configure_window_ca_bundle_layout = QtWidgets.QHBoxLayout()
+            configure_window_ca_bundle_layout.addWidget(QtWidgets.QLabel("CA bundle:"))
+            self.configure_window_ca_bundle_edit = QtWidgets.QLineEdit()
+            self.configure_window_ca_bundle_edit.setPlaceholderText(
+                "Path to a certificate bundle (.pem)"
+            )
+            self.configure_window_ca_bundle_edit.setText(
+                self.configure_json.ca_bundle or ""
+            )
+            configure_window_ca_bundle_layout.addWidget(
+                self.configure_window_ca_bundle_edit
+            )
+            configure_window_network_layout.addLayout(configure_window_ca_bundle_layout)
+
+            # ---> Add maximum age of pip and uv
+            configure_window_pip_age_layout = QtWidgets.QHBoxLayout()
+            configure_window_pip_age_layout.addWidget(
+                QtWidgets.QLabel("Upgrade pip and uv every:")
+            )
+            self.configure_window_pip_age_spin = QtWidgets.QSpinBox()
+            self.configure_window_pip_age_spin.setRange(
+                0, PACKAGE_MANAGERS_MAX_AGE_LIMIT
+            )
+            self.configure_window_pip_age_spin.setSuffix(" hours")
+            self.configure_window_pip_age_spin.setSpecialValueText("command")
+            self.configure_window_pip_age_spin.setValue(
+                self.configure_json.package_managers_max_age
+            )
+            configure_window_pip_age_layout.addWidget(
+                self.configure_window_pip_age_spin
+            )
+            configure_window_pip_age_layout.addStretch()
+            configure_window_network_layout.addLayout(configure_window_pip_age_layout)
+
+            # Finally, add all the previous widgets to the global layout
+            configure_options_layout.addWidget(configure_window_network)
+
+            # Group 4: Build options
+            configure_window_build = QtWidgets.QGroupBox(
+                "Python built from source (Linux):"
+            )
+            configure_window_build_layout = QtWidgets.QVBoxLayout()
+            configure_window_build_layout.setContentsMargins(10, 20, 10, 20)
+            configure_window_build.setLayout(configure_window_build_layout)
+
+            # ---> Add profile selection
+            configure_window_build_profile_layout = QtWidgets.QHBoxLayout()
+            configure_window_build_profile_layout.addWidget(
+                QtWidgets.QLabel("Profile:")
+            )
+            self.configure_window_build_profile_select = QtWidgets.QComboBox()
+            for profile, options in BUILD_PROFILES.items():
+                self.configure_window_build_profile_select.addItem(profile, profile)
+                self.configure_window_build_profile_select.setItemData(
+                    self.configure_window_build_profile_select.count() - 1,
+                    " ".join(options) or "No optimization options",
+                    QtCore.Qt.ToolTipRole,
+                )
+            self.configure_window_build_profile_select.setCurrentIndex(
+                self.configure_window_build_profile_select.findData(
+                    self.configure_json.build_profile
+                )
+            )
+            configure_window_build_profile_layout.addWidget(
+                self.configure_window_build_profile_select
+            )
+            configure_window_build_profile_layout.addStretch()
+            configure_window_build_layout.addLayout(
+                configure_window_build_profile_layout
+            )
+
+            # ---> Add incremental build check box
+            self.configure_window_build_incremental_checkbox = QtWidgets.QCheckBox(
+                "Reuse the compiled files and configure results of previous "
+                "builds (requires ccache)"
+            )
+            self.configure_window_build_incremental_checkbox.setChecked(
+                self.configure_json.build_incremental
+            )
+            configure_window_build_layout.addWidget(
+                self.configure_window_build_incremental_checkbox
+            )
+
+            # ---> Add shared cache box
+            configure_window_build_cache_layout = QtWidgets.QHBoxLayout()
+            configure_window_build_cache_layout.addWidget(
+                QtWidgets.QLabel("Shared cache:")
+            )
+            self.configure_window_build_cache_edit = QtWidgets.QLineEdit()
+            self.configure_window_build_cache_edit.setPlaceholderText(
+                "Directory where builds are shared with other machines"
+            )
+            self.configure_window_build_cache_edit.setText(
+                self.configure_json.build_cache_dir or ""
+            )
+            configure_window_build_cache_layout.addWidget(
+                self.configure_window_build_cache_edit
+            )
+            configure_window_build_layout.addLayout(configure_window_build_cache_layout)
+            configure_options_layout.addWidget(configure_window_build)
+
             configure_window_button_save = QtWidgets.QPushButton("Save")
             configure_window_button_save.clicked.connect(
                 lambda x: self._pop_up("Do you want to save?", self._save_configuration)
@@ -223,6 +397,19 @@ class Configure(QtWidgets.QWidget):
         self.configure_window_search_venv_edit.setText(
             self.configure_window_search_venv_combo.currentText()
         )
+        patterns = self._venv_ignore.get(
+            os.path.normpath(self.configure_window_search_venv_combo.currentText()), []
+        )
+        self.configure_window_search_ignore_edit.setText(", ".join(patterns))
+
+    def _change_ignore_search_venv(self, text):
+        """Change the ignore patterns of the venv path in the text box."""
+        path = os.path.normpath(self.configure_window_search_venv_edit.text())
+        patterns = [pattern.strip() for pattern in text.split(",") if pattern.strip()]
+        if patterns:
+            self._venv_ignore[path] = patterns
+        else:
+            self._venv_ignore.pop(path, None)
 
     def _save_configuration(self):
         """Save the configuration."""
@@ -245,10 +432,45 @@ class Configure(QtWidgets.QWidget):
                 os.path.normpath(self.configure_window_create_venv_edit.text())
             )
         self.configure_json.rewrite_config(VENV_SEARCH_PATH, venv_search_paths)
-        i = 0
+        self.configure_json.rewrite_option(
+            VENV_SEARCH_DEPTH, self.configure_window_search_depth_spin.value()
+        )
+        self.configure_json.rewrite_option(
+            VENV_IGNORE,
+            {
+                path: patterns
+                for path, patterns in self._venv_ignore.items()
+                if path in venv_search_paths
+            },
+        )
+        self.configure_json.rewrite_option(
+            PREFETCH_METADATA, self.configure_window_prefetch_checkbox.isChecked()
+        )
+        self.configure_json.rewrite_option(
+            HTTP_PROXY, self.configure_window_proxy_edit.text().strip()
+        )
+        self.configure_json.rewrite_option(
+            CA_BUNDLE, self.configure_window_ca_bundle_edit.text().strip()
+        )
+        self.configure_json.rewrite_option(
+            PACKAGE_MANAGERS_MAX_AGE, self.configure_window_pip_age_spin.value()
+        )
+        self.configure_json.rewrite_option(
+            BUILD_PROFILE, self.configure_window_build_profile_select.currentData()
+        )
+        self.configure_json.rewrite_option(
+            BUILD_INCREMENTAL,
+            self.configure_window_build_incremental_checkbox.isChecked(),
+        )
+        build_cache_dir = self.configure_window_build_cache_edit.text().strip()
+        self.configure_json.rewrite_option(
+            BUILD_CACHE_DIR,
+            os.path.normpath(build_cache_dir) if build_cache_dir else "",
+        )
 
-        self.configure_json._write_config_file()
-        self._parent.venv_table_tab.update_table()
+        # Services listening to ``configure_json.signals.changed`` follow the
+        # new settings; the search paths only trigger a rescan when changed.
+        self.configure_json.save()
 
         self.user_confirmation_form.close()
         self._parent.configure_window.close()
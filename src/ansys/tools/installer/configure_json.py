@@ -22,95 +22,215 @@
 
 """Configure json file."""
 
+import atexit
+import contextlib
 import json
+import logging
 import os
+import threading
+
+from PySide6 import QtCore
 
 from ansys.tools.installer.constants import (
     ANSYS_VENVS,
+    BUILD_CACHE_DIR,
+    BUILD_INCREMENTAL,
+    BUILD_PROFILE,
+    BUILD_PROFILE_DEFAULT,
+    BUILD_PROFILES,
+    CA_BUNDLE,
+    CONFIG_WRITE_DELAY,
+    HTTP_PROXY,
+    PACKAGE_MANAGERS_DEFAULT_MAX_AGE,
+    PACKAGE_MANAGERS_MAX_AGE,
+    PACKAGE_MANAGERS_MAX_AGE_LIMIT,
+    PREFETCH_METADATA,
     VENV_DEFAULT_PATH,
+    VENV_DISCOVERY_DEPTH,
+    VENV_DISCOVERY_MAX_DEPTH,
+    VENV_IGNORE,
+    VENV_SEARCH_DEPTH,
     VENV_SEARCH_PATH,
 )
 from ansys.tools.installer.linux_functions import ansys_linux_path, is_linux_os
 
+try:
+    import fcntl
+except ModuleNotFoundError:
+    # only used on windows
+    fcntl = None
+    import msvcrt
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+_CONFIGURE_JSON = None
+_CONFIGURE_JSON_LOCK = threading.Lock()
+
+
+class ConfigureSignals(QtCore.QObject):
+    """Signals emitted by a ``ConfigureJson``.
+
+    ``changed`` is emitted in the thread of the application once it exists,
+    also for changes made by worker threads or read by the delayed write.
+    Its receivers, including plain functions, therefore run in the GUI
+    thread.
+    """
+
+    #: Emitted with the key of a setting or option whose value changed
+    changed = QtCore.Signal(str)
+    _queued_changed = QtCore.Signal(str)
+
+    def __init__(self, parent=None):
+        """Instantiate the signals in the thread of the application."""
+        super().__init__(parent)
+        app = QtCore.QCoreApplication.instance()
+        if parent is None and app is not None and self.thread() != app.thread():
+            self.moveToThread(app.thread())
+        self._queued_changed.connect(
+            self.changed, QtCore.Qt.ConnectionType.QueuedConnection
+        )
+
+    def emit_changed(self, key):
+        """Emit ``changed`` in the thread of the application.
+
+        Parameters
+        ----------
+        key : str
+            Key of the setting or option whose value changed.
+
+        """
+        app = QtCore.QCoreApplication.instance()
+        if app is None or QtCore.QThread.currentThread() == self.thread():
+            self.changed.emit(key)
+        else:
+            self._queued_changed.emit(key)
+
 
 class ConfigureJson:
-    """Configuration json class."""
+    """Configuration json class.
 
-    def __init__(self):
+    Changes made with ``rewrite_config`` and ``rewrite_option`` are kept in
+    memory until ``save`` writes them, after ``write_delay`` seconds so
+    that several saves in a row write the files once. Files are replaced
+    atomically, under an advisory lock shared with other instances of the
+    manager. Changes made on disk by another instance in the meantime are
+    read again before the pending changes are written on top of them.
+
+    ``signals.changed`` is emitted with the key of each setting or option
+    whose value changes, whether from this instance or from the files
+    changed by another instance. It is emitted in the GUI thread, whichever
+    thread made or read the change.
+
+    Use ``get_configure_json`` to get the instance shared by the whole
+    application.
+
+    Parameters
+    ----------
+    config_dir : str, optional
+        Directory of the configuration files. Defaults to
+        ``~/.ansys/ansys_python_manager``.
+    write_delay : float, default: CONFIG_WRITE_DELAY
+        Seconds between a call to ``save`` and the write of the files.
+
+    """
+
+    def __init__(self, config_dir=None, write_delay=CONFIG_WRITE_DELAY):
         """Instantiate Configuration class."""
-        self.config_dir = os.path.join(
-            os.path.expanduser("~"), ".ansys", "ansys_python_manager"
-        )
+        if config_dir is None:
+            config_dir = os.path.join(
+                os.path.expanduser("~"), ".ansys", "ansys_python_manager"
+            )
+        self.config_dir = config_dir
         self.config_file_path = os.path.join(self.config_dir, "config.json")
-
         self.history_file_path = os.path.join(self.config_dir, "history.json")
+        self.lock_file_path = os.path.join(self.config_dir, "config.lock")
+        self.write_delay = write_delay
+
+        self.signals = ConfigureSignals()
+        self._lock = threading.RLock()
+        self._changes = []
+        self._save_timer = None
+        self._signature = None
+        if not self._read_config_file():
+            with _locked(self.lock_file_path):
+                self._write_config_file()
+
+    def _read_config_file(self):
+        """Read the configuration files.
+
+        Returns
+        -------
+        bool
+            Whether both files are valid. Defaults are used otherwise.
+        """
         self.default_path = os.path.join(
             ansys_linux_path if is_linux_os() else os.path.expanduser("~"), ANSYS_VENVS
         )
         self.venv_search_path = [self.default_path]
-        self._create_config_file_if_not_exist()
-        self._read_config_file()
-
-    def _create_config_file_if_not_exist(self):
-        """Create Configuration file if not exist."""
-        if not os.path.exists(self.config_file_path) or (
-            not os.path.getsize(self.config_file_path)
-        ):
-            os.makedirs(os.path.dirname(self.config_file_path), exist_ok=True)
-            self.configs = {
-                "path": {
-                    VENV_DEFAULT_PATH: self.default_path,
-                    VENV_SEARCH_PATH: [self.default_path],
-                }
-            }
-            self._create_history_file_if_not_exist()
-            self._write_config_file()
-
-    def _create_history_file_if_not_exist(self):
-        """Create Configuration file if not exist."""
-        if not os.path.exists(self.history_file_path) or (
-            not os.path.getsize(self.history_file_path)
-        ):
-            os.makedirs(os.path.dirname(self.history_file_path), exist_ok=True)
-            self.history = {"path": [self.default_path]}
-        else:
-            self._read_history_file()
+        self.options = {
+            PREFETCH_METADATA: False,
+            HTTP_PROXY: "",
+            CA_BUNDLE: "",
+            VENV_SEARCH_DEPTH: VENV_DISCOVERY_DEPTH,
+            VENV_IGNORE: {},
+        }
+        self._signature = self._file_signature()
 
-    def _read_config_file(self):
-        """Read configuration file."""
+        configs = _read_json(self.config_file_path)
         try:
-            with open(self.config_file_path) as f:
-                paths = json.load(f)
-                self.default_path = paths["path"][VENV_DEFAULT_PATH]
-                self.venv_search_path = paths["path"][VENV_SEARCH_PATH]
-                self.configs = paths
-        except:
+            self.default_path = configs["path"][VENV_DEFAULT_PATH]
+            self.venv_search_path = configs["path"][VENV_SEARCH_PATH]
+            self.options.update(configs.get("options", {}))
+            self.configs = configs
+            valid_configs = True
+        except (KeyError, TypeError, ValueError, AttributeError):
             self.configs = {
                 "path": {
                     VENV_DEFAULT_PATH: self.default_path,
                     VENV_SEARCH_PATH: [self.default_path],
                 }
             }
-            self._write_config_file()
+            valid_configs = False
 
-        self._read_history_file()
-
-    def _read_history_file(self):
-        """Read Configuration file."""
-        try:
-            with open(self.history_file_path) as f:
-                paths = json.load(f)
-                # Verify it is a dictionary with a key "path"
-                if "path" not in paths:
-                    raise ValueError("Invalid history file")
-                self.history = paths
-        except:
+        self.history = _read_json(self.history_file_path)
+        # Verify it is a dictionary with a key "path"
+        valid_history = isinstance(self.history, dict) and "path" in self.history
+        if not valid_history:
             self.history = {"path": [self.default_path]}
-            self._write_history_file()
+
+        return valid_configs and valid_history
+
+    def reload_if_changed(self):
+        """Read the files again if another instance changed them.
+
+        Pending changes are applied again on top of the new content.
+
+        Returns
+        -------
+        bool
+            Whether the files were read again.
+
+        """
+        with self._lock:
+            if self._file_signature() == self._signature:
+                return False
+            LOG.debug("Configuration changed on disk, reading it again")
+            old_values = self._values()
+            self._read_config_file()
+            for change in self._changes:
+                self._apply(*change)
+            new_values = self._values()
+        for key in sorted(set(old_values) | set(new_values)):
+            if old_values.get(key) != new_values.get(key):
+                self.signals.emit_changed(key)
+        return True
 
     def rewrite_config(self, key, value):
         """Rewrite configuration file.
 
+        The change is written by the next ``save``.
+
         Parameters
         ----------
         key : str
@@ -118,18 +238,236 @@ class ConfigureJson:
         value : str
             value to save the configuration
         """
+        self._change("path", key, value)
+
+    def rewrite_option(self, key, value):
+        """Rewrite an application option.
+
+        The change is written by the next ``save``.
+
+        Parameters
+        ----------
+        key : str
+            key of the option, for example ``PREFETCH_METADATA``
+        value : bool or str
+            value of the option
+        """
+        self._change("options", key, value)
+
+    def save(self):
+        """Write the pending changes after ``write_delay`` seconds.
+
+        Saves requested before the files are written are served by the
+        same write.
+        """
+        with self._lock:
+            if self._save_timer is not None or not self._changes:
+                return
+            if self.write_delay <= 0:
+                self.flush()
+                return
+            self._save_timer = threading.Timer(self.write_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write the pending changes now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._changes:
+                return
+            with _locked(self.lock_file_path):
+                self.reload_if_changed()
+                self._write_config_file()
+            self._changes = []
+
+    def _change(self, section, key, value):
+        """Apply a change in memory and keep it until it is written."""
+        with self._lock:
+            old_value = self._values().get(key)
+            self._changes.append((section, key, value))
+            self._apply(section, key, value)
+        if value != old_value:
+            self.signals.emit_changed(key)
+
+    def _values(self):
+        """Get the current value of each setting and option."""
+        return {**self.configs.get("path", {}), **self.options}
+
+    def _apply(self, section, key, value):
+        """Apply a change to the content of the files."""
+        if section == "options":
+            self.options[key] = value
+            self.configs.setdefault("options", {})[key] = value
+            return
+
         if key == VENV_DEFAULT_PATH and value not in self.history["path"]:
             self.history["path"].append(value)
         self.configs["path"][key] = value
+        if key == VENV_DEFAULT_PATH:
+            self.default_path = value
+        elif key == VENV_SEARCH_PATH:
+            self.venv_search_path = value
+
+    @property
+    def prefetch_metadata(self):
+        """Whether to prefetch PyAnsys package metadata at startup."""
+        return bool(self.options.get(PREFETCH_METADATA, False))
+
+    @property
+    def http_proxy(self):
+        """Proxy used for all HTTP and HTTPS requests, if any."""
+        return self.options.get(HTTP_PROXY) or None
+
+    @property
+    def ca_bundle(self):
+        """Certificate authority bundle used to verify servers, if any."""
+        return self.options.get(CA_BUNDLE) or None
+
+    @property
+    def build_profile(self):
+        """Optimization profile used to build Python from source."""
+        profile = self.options.get(BUILD_PROFILE)
+        return profile if profile in BUILD_PROFILES else BUILD_PROFILE_DEFAULT
+
+    @property
+    def build_cache_dir(self):
+        """Directory where Python builds are shared with other machines, if any."""
+        return self.options.get(BUILD_CACHE_DIR) or None
+
+    @property
+    def build_incremental(self):
+        """Whether to reuse the work of previous builds of Python with ccache."""
+        return bool(self.options.get(BUILD_INCREMENTAL, False))
+
+    @property
+    def package_managers_max_age(self):
+        """Hours before pip and uv of an interpreter are upgraded again."""
+        try:
+            hours = int(
+                self.options.get(
+                    PACKAGE_MANAGERS_MAX_AGE, PACKAGE_MANAGERS_DEFAULT_MAX_AGE
+                )
+            )
+        except (TypeError, ValueError):
+            return PACKAGE_MANAGERS_DEFAULT_MAX_AGE
+        return min(max(hours, 0), PACKAGE_MANAGERS_MAX_AGE_LIMIT)
+
+    @property
+    def venv_search_depth(self):
+        """Depth of the directories searched for environments.
+
+        Environments directly in a search path are at depth 1.
+        """
+        try:
+            depth = int(self.options.get(VENV_SEARCH_DEPTH, VENV_DISCOVERY_DEPTH))
+        except (TypeError, ValueError):
+            return VENV_DISCOVERY_DEPTH
+        return min(max(depth, 1), VENV_DISCOVERY_MAX_DEPTH)
+
+    @property
+    def venv_ignore(self):
+        """Glob patterns of the directories skipped, by search path."""
+        ignore = self.options.get(VENV_IGNORE)
+        if not isinstance(ignore, dict):
+            return {}
+        return {path: list(patterns) for path, patterns in ignore.items()}
 
     def _write_config_file(self):
-        """Write config json file."""
-        with open(self.config_file_path, "w+") as f:
-            f.write(json.dumps(self.configs, indent=4))
+        """Write config json file, with the caller holding the file lock."""
+        _write_json(self.config_file_path, self.configs)
         self._write_history_file()
-        self._read_config_file()
+        self._signature = self._file_signature()
 
     def _write_history_file(self):
         """Write history json file."""
-        with open(self.history_file_path, "w+") as f:
-            f.write(json.dumps(self.history, indent=4))
+        _write_json(self.history_file_path, self.history)
+
+    def _file_signature(self):
+        """Get the modification times of the files."""
+        signature = []
+        for path in (self.config_file_path, self.history_file_path):
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return signature
+
+
+def get_configure_json():
+    """Get the configuration shared by the whole application.
+
+    The configuration is read once, and read again only when its files
+    were modified, for example by another instance of the manager. Pending
+    changes are written when the application exits.
+
+    Returns
+    -------
+    ConfigureJson
+        Shared configuration.
+
+    """
+    global _CONFIGURE_JSON
+    with _CONFIGURE_JSON_LOCK:
+        if _CONFIGURE_JSON is None:
+            _CONFIGURE_JSON = ConfigureJson()
+            atexit.register(_CONFIGURE_JSON.flush)
+        else:
+            _CONFIGURE_JSON.reload_if_changed()
+    return _CONFIGURE_JSON
+
+
+def _read_json(path):
+    """Read a JSON file, or get ``None`` if it is missing or invalid."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    """Replace a JSON file atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(json.dumps(data, indent=4))
+    os.replace(tmp_path, path)
+
+
+@contextlib.contextmanager
+def _locked(path):
+    """Hold the advisory lock shared by the instances of the manager.
+
+    The files are still written without the lock if it cannot be taken,
+    for example on read-only or network file systems.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        f = open(path, "a+")
+    except OSError as err:
+        LOG.debug("Unable to open the lock file %s: %s", path, err)
+        yield
+        return
+
+    with f:
+        try:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            locked = True
+        except OSError as err:
+            LOG.debug("Unable to lock %s: %s", path, err)
+            locked = False
+        try:
+            yield
+        finally:
+            if locked and fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            elif locked:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
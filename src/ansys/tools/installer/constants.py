@@ -68,13 +68,13 @@ PYTHON_VERSION_TEXT = """Choose the version of Python to install.
 While choosing the latest version of Python is generally recommended, some third-party libraries and applications may not yet be fully compatible with the newest release. Therefore, it is recommended to try the second newest version, as it will still have most of the latest features and improvements while also having broader support among third-party packages."""
 
 PRE_COMPILED_PYTHON_WARNING = """
-<b>NOTE:</b> Only 'Python 3.11' version is readily available. Other Python versions are compiled from source and it takes approximately 2-3 minutes."""
+<b>NOTE:</b> Only 'Python 3.11' version is readily available. Other Python versions are compiled from source using all the processor cores, which takes a few minutes. The optimization profile used can be changed in File >> Configure."""
 
 PYTHON_VERSION_SELECTION_FOR_VENV = """Choose the version of Python to use for your virtual environment.
 
 Please select the Python version from the table below to create its respective virtual environment."""
 
-NAME_FOR_VENV = f"""Provide the name for your virtual environment.
+NAME_FOR_VENV = f"""Provide the name for your virtual environment. Separate several names with commas to create the environments in one go.
 
 <br><br>Virtual environments are created under user directory /<i>{ANSYS_LINUX_PATH + "/" + ANSYS_VENVS if os.name == "posix" else ANSYS_VENVS}</i> by default. To configure the default path, go to File >> Configure (Ctrl + D) and provide your preferred path.
 
@@ -217,8 +217,86 @@ PYANSYS_LIBS = {
     "PyMaterials Manager": "ansys-materials-manager",
 }
 
+DOWNLOAD_CACHE_MAX_SIZE = 2 * 1024**3  # 2GB
+DOWNLOAD_CACHE_REVALIDATE_AFTER = 24 * 60 * 60  # 1 day
+DOWNLOAD_CACHE_USE_RESOLUTION = 60 * 60  # time of use of an artifact saved hourly
+
+METADATA_CACHE_TTL = 60 * 60  # 1 hour
+METADATA_CACHE_STALE_TTL = 7 * 24 * 60 * 60  # 1 week
+
+PREFETCH_MAX_WORKERS = 8
+
+PYTHON_PROBE_MAX_WORKERS = 8
+PYTHON_PROBE_TIMEOUT = 10  # seconds
+
+INVENTORY_MAX_AGE = 30 * 24 * 60 * 60  # 30 days
+INVENTORY_USE_RESOLUTION = 24 * 60 * 60  # time of use of a record saved daily
+
+CONFIG_WRITE_DELAY = 0.5  # seconds
+
+VENV_DISCOVERY_DEPTH = 1
+VENV_DISCOVERY_MAX_DEPTH = 8
+VENV_DISCOVERY_MAX_WORKERS = 4
+VENV_DISCOVERY_IGNORE = (
+    ".git",
+    ".hg",
+    ".svn",
+    ".cache",
+    "__pycache__",
+    "node_modules",
+    "site-packages",
+)
+
+WATCHER_POLL_INTERVAL = 5000  # ms
+WATCHER_DEBOUNCE = 200  # ms
+REFRESH_DEBOUNCE = 50  # ms
+VENV_METADATA_MAX_WORKERS = 2
+VENV_METADATA_DEBOUNCE = 200  # ms
+
+# ``configure`` options of each profile available to build Python from source
+BUILD_PROFILES = {
+    "standard": (),
+    "optimized": ("--enable-optimizations", "--with-lto"),
+    "debug": ("--with-pydebug",),
+}
+BUILD_PROFILE_DEFAULT = "standard"
+# share of the overall build progress taken by each stage, in order
+BUILD_STAGE_WEIGHTS = {"extract": 5, "configure": 15, "build": 70, "install": 10}
+BUILD_CACHE_MAX_SIZE = 4 * 1024**3  # 4GB
+BUILD_LOG_TAIL = 40  # lines of output kept to report a failure
+
+COMMAND_OUTPUT_TAIL = 200  # lines of output kept in the result of a command
+COMMAND_KILL_DELAY = 5  # seconds given to a command to stop before killing it
+PIP_UPGRADE_TIMEOUT = 300  # seconds
+# hours before pip and uv of an interpreter are upgraded again
+PACKAGE_MANAGERS_DEFAULT_MAX_AGE = 24
+PACKAGE_MANAGERS_MAX_AGE_LIMIT = 30 * 24
+
+# Maximum number of jobs using each resource at the same time
+JOB_RESOURCE_LIMITS = {"network": 4, "disk": 2, "cpu": 1}
+JOB_MAX_THREADS = 8
+JOB_RETRY_DELAY = 2  # seconds, doubled after each attempt
+JOB_HISTORY_SIZE = 500
+JOB_DOWNLOAD_RETRIES = 2
+JOB_OUTPUT_LINES = 1000  # lines of output of a job shown in the queue
+
+HTTP_MAX_HOSTS = 16
+HTTP_MAX_CONNECTIONS_PER_HOST = 8
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 VENV_DEFAULT_PATH = "venv_default_path"
 VENV_SEARCH_PATH = "venv_search_path"
+PREFETCH_METADATA = "prefetch_metadata"
+HTTP_PROXY = "http_proxy"
+CA_BUNDLE = "ca_bundle"
+VENV_SEARCH_DEPTH = "venv_search_depth"
+VENV_IGNORE = "venv_ignore"
+BUILD_PROFILE = "build_profile"
+BUILD_CACHE_DIR = "build_cache_dir"
+BUILD_INCREMENTAL = "build_incremental"
+PACKAGE_MANAGERS_MAX_AGE = "package_managers_max_age"
 
 
 ###############################################################################
@@ -28,13 +28,20 @@ from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from ansys.tools.installer.configure_json import ConfigureJson
+from ansys.tools.installer.configure_json import get_configure_json
 from ansys.tools.installer.constants import (
     ANSYS_FAVICON,
     NAME_FOR_VENV,
     PYTHON_VERSION_SELECTION_FOR_VENV,
 )
 from ansys.tools.installer.installed_table import DataComboBox
+from ansys.tools.installer.jobs import (
+    DONE,
+    FAILED,
+    FINISHED_STATES,
+    Job,
+    get_job_scheduler,
+)
 from ansys.tools.installer.linux_functions import (
     create_venv_linux,
     create_venv_linux_conda,
@@ -116,22 +123,48 @@ class CreateVenvTab(QtWidgets.QWidget):
         self.installEventFilter(self)
 
     def create_venv(self):
-        """Create virtual environment at selected directory."""
-        configure_json = ConfigureJson()
+        """Queue the creation of virtual environments at the selected directory.
+
+        Several environments, with names separated by commas, are submitted
+        as one batch of jobs run in parallel.
+        """
+        configure_json = get_configure_json()
         create_venv_path = configure_json.default_path
-        venv_dir = os.path.join(create_venv_path, self.venv_name.text())
-        if self.venv_name.text() == "":
+        names = [name.strip() for name in self.venv_name.text().split(",")]
+        venv_dirs = [os.path.join(create_venv_path, name) for name in names if name]
+        if not venv_dirs:
             self.failed_to_create_dialog(case_1=True)
-        elif os.path.exists(venv_dir):
+        elif any(os.path.exists(venv_dir) for venv_dir in venv_dirs):
             self.failed_to_create_dialog(case_2=True)
         else:
-            Path(venv_dir).mkdir(parents=True, exist_ok=True)
-            try:
-                self.cmd_create_venv(venv_dir)
-            except:
-                self.failed_to_create_dialog()
-
-            self.update_table()
+            py_path = self.table.active_path
+            version = self.table.active_version
+            jobs = []
+            for venv_dir in venv_dirs:
+                Path(venv_dir).mkdir(parents=True, exist_ok=True)
+                jobs.append(
+                    Job(
+                        f"Create {os.path.basename(venv_dir)}",
+                        lambda job, venv_dir=venv_dir: self.cmd_create_venv(
+                            venv_dir, py_path, version
+                        ),
+                        kind="venv",
+                        resource="disk",
+                        on_done=lambda job: self._venv_created(job, jobs),
+                    )
+                )
+            get_job_scheduler().submit(*jobs)
+
+    def _venv_created(self, job, batch):
+        """Report the creation of a batch of environments once all are done."""
+        if job.state == FAILED:
+            LOG.error(f"Failed to {job.name.lower()}: {job.error}")
+        if any(other.state not in FINISHED_STATES for other in batch):
+            return
+        self.update_table()
+        if any(other.state == FAILED for other in batch):
+            self.failed_to_create_dialog()
+        elif len(batch) == 1 and job.state == DONE:
             self.venv_success_dialog()
 
     def venv_success_dialog(self):
@@ -189,19 +222,26 @@ class CreateVenvTab(QtWidgets.QWidget):
             self.table.setFocus()
         return super().eventFilter(source, event)
 
-    def cmd_create_venv(self, venv_dir):
-        """Create a virtual environment in a new command prompt.
+    def cmd_create_venv(self, venv_dir, py_path=None, version=None):
+        """Create a virtual environment.
 
         Parameters
         ----------
         venv_dir : str
             The location for the virtual environment.
+        py_path : str, optional
+            Path of the Python installation. Defaults to the selected one.
+        version : str, optional
+            Version of the Python installation, for example
+            ``"Python 3.12.0"``. Defaults to the selected one.
         """
         # Get the selected Python environment
-        py_path = self.table.active_path
+        if py_path is None:
+            py_path = self.table.active_path
+            version = self.table.active_version
 
         LOG.debug(f"Requesting creation of {venv_dir}")
-        if "Python" in self.table.active_version:
+        if "Python" in version:
             if is_linux_os():
                 create_venv_linux(venv_dir, py_path)
             else:
@@ -0,0 +1,340 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Content-addressed cache of downloaded artifacts."""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+from ansys.tools.installer import CACHE_DIR
+from ansys.tools.installer.constants import (
+    DOWNLOAD_CACHE_MAX_SIZE,
+    DOWNLOAD_CACHE_REVALIDATE_AFTER,
+    DOWNLOAD_CACHE_USE_RESOLUTION,
+)
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+# Artifacts stored flat in ``CACHE_DIR`` by previous versions of the manager
+LEGACY_DOWNLOAD_PATTERNS = [
+    "Python-*.tar.xz",
+    "python-*-amd64.exe",
+    "Miniforge3-*",
+    "Ansys-Python-Manager-Setup-*",
+]
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class DownloadCache:
+    """Cache of downloaded files stored by their SHA-256 digest.
+
+    Each artifact is kept as ``objects/<sha256>/<filename>`` so callers
+    receive a path with the original file name. A small JSON index maps
+    every URL to its artifact along with the ``ETag``, ``Last-Modified``,
+    size, digest and last time it was used. Lookups only touch the local
+    disk, and the least recently used artifacts are evicted once the cache
+    grows beyond ``max_size``. Entries that were not validated against the
+    server for ``revalidate_after`` seconds are reported as stale.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory holding the cache. Defaults to ``CACHE_DIR/downloads``.
+    max_size : int, optional
+        Maximum size in bytes of all cached artifacts.
+    revalidate_after : float, optional
+        Number of seconds after which an entry must be revalidated with a
+        conditional request before being used.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir=None,
+        max_size=DOWNLOAD_CACHE_MAX_SIZE,
+        revalidate_after=DOWNLOAD_CACHE_REVALIDATE_AFTER,
+    ):
+        """Instantiate the cache."""
+        self.root = cache_dir or os.path.join(CACHE_DIR, "downloads")
+        self.max_size = max_size
+        self.revalidate_after = revalidate_after
+        self.index_path = os.path.join(self.root, "index.json")
+        self._objects_dir = os.path.join(self.root, "objects")
+        self._staging_dir = os.path.join(self.root, "staging")
+        self._lock = threading.RLock()
+
+        first_use = not os.path.isfile(self.index_path)
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._staging_dir, exist_ok=True)
+        self._index = self._read_index()
+        if first_use:
+            if cache_dir is None:
+                self._remove_legacy_downloads()
+            # The index marks the legacy downloads as removed
+            with self._lock:
+                self._write_index()
+
+    @property
+    def size(self):
+        """Total size in bytes of the cached artifacts."""
+        with self._lock:
+            sizes = {e["sha256"]: e["size"] for e in self._index.values()}
+        return sum(sizes.values())
+
+    def staging_path(self, filename):
+        """Return the path where a new download of ``filename`` is written.
+
+        Partial downloads stay in this location until they are complete,
+        which allows them to be resumed.
+        """
+        return os.path.join(self._staging_dir, filename)
+
+    def lookup(self, url):
+        """Return the cached entry of a URL without any network access.
+
+        The artifact is verified against the index. If its size or
+        modification time changed, its digest is recomputed and the entry
+        is dropped on mismatch.
+
+        Parameters
+        ----------
+        url : str
+            URL the artifact was downloaded from.
+
+        Returns
+        -------
+        dict or None
+            Index entry, including the ``"path"`` of the artifact, or
+            ``None`` if the URL is not cached.
+
+        """
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+
+            path = self._object_path(entry["sha256"], entry["filename"])
+            changed = False
+            try:
+                stat = os.stat(path)
+            except OSError:
+                LOG.debug("Cached artifact for %s is missing", url)
+                self._drop(url)
+                return None
+
+            if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime"]:
+                if _sha256(path) != entry["sha256"]:
+                    LOG.warning("Checksum mismatch for cached %s. Discarding.", path)
+                    self._remove_object(entry["sha256"])
+                    return None
+                entry["mtime"] = stat.st_mtime_ns
+                changed = True
+
+            # The time of use only needs to order the artifacts to evict, so
+            # hits do not rewrite the index each time
+            last_used = _use_time()
+            if last_used != entry["last_used"]:
+                entry["last_used"] = last_used
+                changed = True
+            if changed:
+                self._write_index()
+            return {**entry, "path": path}
+
+    def is_stale(self, entry):
+        """Return whether an entry must be revalidated before being used.
+
+        Parameters
+        ----------
+        entry : dict
+            Entry returned by :meth:`lookup`.
+
+        Returns
+        -------
+        bool
+            ``True`` if the entry was last validated more than
+            ``revalidate_after`` seconds ago.
+
+        """
+        validated = entry.get("validated", 0)
+        return time.time() - validated > self.revalidate_after
+
+    def mark_validated(self, url):
+        """Record that the server confirmed the entry of a URL is current."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is not None:
+                entry["validated"] = time.time()
+                self._write_index()
+
+    def invalidate(self, url):
+        """Forget the entry of a URL whose remote file changed."""
+        with self._lock:
+            if url in self._index:
+                self._drop(url)
+
+    def add(self, url, path, etag=None, last_modified=None):
+        """Move a downloaded file into the cache.
+
+        Parameters
+        ----------
+        url : str
+            URL the file was downloaded from.
+        path : str
+            Path of the downloaded file. The file is moved into the cache.
+        etag : str, optional
+            ``ETag`` returned by the server.
+        last_modified : str, optional
+            ``Last-Modified`` header returned by the server.
+
+        Returns
+        -------
+        str
+            Path of the cached artifact.
+
+        """
+        filename = os.path.basename(path)
+        digest = _sha256(path)
+        target = self._object_path(digest, filename)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(path, target)
+
+        with self._lock:
+            self._index[url] = {
+                "url": url,
+                "filename": filename,
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": os.path.getsize(target),
+                "sha256": digest,
+                "mtime": os.stat(target).st_mtime_ns,
+                "last_used": _use_time(),
+                "validated": time.time(),
+            }
+            self.evict(keep=digest)
+            self._write_index()
+
+        LOG.debug("Cached %s as %s", url, target)
+        return target
+
+    def evict(self, max_size=None, keep=None):
+        """Remove least recently used artifacts until the cache fits.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Size limit in bytes. Defaults to ``self.max_size``.
+        keep : str, optional
+            Digest of an artifact that must not be evicted.
+
+        """
+        max_size = self.max_size if max_size is None else max_size
+        with self._lock:
+            objects = {}
+            for entry in self._index.values():
+                size, last_used = objects.get(entry["sha256"], (0, 0))
+                objects[entry["sha256"]] = (
+                    entry["size"],
+                    max(last_used, entry["last_used"]),
+                )
+
+            total = sum(size for size, _ in objects.values())
+            for digest, (size, _) in sorted(objects.items(), key=lambda x: x[1][1]):
+                if total <= max_size:
+                    break
+                if digest == keep:
+                    continue
+                LOG.debug("Evicting %s from the download cache", digest)
+                self._remove_object(digest)
+                total -= size
+
+    def clear(self):
+        """Remove every cached artifact."""
+        self.evict(max_size=0)
+
+    def _object_path(self, digest, filename):
+        return os.path.join(self._objects_dir, digest, filename)
+
+    def _remove_object(self, digest):
+        """Remove an artifact and all the index entries pointing to it."""
+        for url in [u for u, e in self._index.items() if e["sha256"] == digest]:
+            del self._index[url]
+        shutil.rmtree(os.path.join(self._objects_dir, digest), ignore_errors=True)
+        self._write_index()
+
+    def _drop(self, url):
+        """Remove the entry of a URL and its artifact once unreferenced."""
+        digest = self._index.pop(url)["sha256"]
+        if not any(e["sha256"] == digest for e in self._index.values()):
+            shutil.rmtree(os.path.join(self._objects_dir, digest), ignore_errors=True)
+        self._write_index()
+
+    def _read_index(self):
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+            if not isinstance(index, dict):
+                raise ValueError("Invalid download cache index")
+            return index
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f, indent=4)
+        os.replace(tmp_path, self.index_path)
+
+    def _remove_legacy_downloads(self):
+        """Remove artifacts left in the root of ``CACHE_DIR``."""
+        for name in os.listdir(CACHE_DIR):
+            path = os.path.join(CACHE_DIR, name)
+            if os.path.isfile(path) and any(
+                fnmatch.fnmatch(name, pattern) for pattern in LEGACY_DOWNLOAD_PATTERNS
+            ):
+                LOG.debug("Removing legacy cached download %s", path)
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def _use_time():
+    """Get the current time, rounded to ``DOWNLOAD_CACHE_USE_RESOLUTION``."""
+    now = time.time()
+    return now - now % DOWNLOAD_CACHE_USE_RESOLUTION
+
+
+def _sha256(path):
+    """Compute the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
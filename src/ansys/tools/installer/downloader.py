@@ -0,0 +1,458 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Parallel, resumable file downloader."""
+
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+import json
+import logging
+import os
+import re
+import threading
+from urllib.parse import urlparse
+
+import requests
+
+from ansys.tools.installer.http_client import get_http_client
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB per ranged request
+DEFAULT_WORKERS = 4
+STREAM_BLOCK_SIZE = 200 * 1024  # 200kb
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+class DownloadCancelled(Exception):
+    """Raised by ``Downloader.download`` when the download is cancelled."""
+
+
+class Downloader:
+    """Download files using parallel HTTP range requests.
+
+    When the server honors ``Range`` requests, the file is split into
+    fixed-size chunks that are fetched concurrently over a single pooled
+    session. Chunks are written in place into a ``<output>.part`` file and
+    the completed ones are recorded in ``<output>.part.json``, so an
+    interrupted download resumes from where it stopped. Servers without
+    range support are read as a single stream. ``cancel`` stops a download
+    from another thread.
+
+    Parameters
+    ----------
+    session : requests.Session, optional
+        Session used for all requests. Defaults to the session of the
+        shared HTTP client.
+    workers : int, default: 4
+        Maximum number of concurrent range requests.
+    chunk_size : int, default: 8388608
+        Size in bytes of each range request.
+    retries : int, default: 3
+        Number of times a failed chunk is retried before giving up.
+    timeout : float, default: 30
+        Connect and read timeout in seconds of each request.
+
+    Examples
+    --------
+    >>> downloader = Downloader(workers=8)
+    >>> downloader.download(
+    ...     "https://www.python.org/ftp/python/3.12.0/Python-3.12.0.tar.xz",
+    ...     "/tmp/Python-3.12.0.tar.xz",
+    ... )
+    {'path': '/tmp/Python-3.12.0.tar.xz', 'size': 20576112, ...}
+
+    """
+
+    def __init__(
+        self,
+        session=None,
+        workers=DEFAULT_WORKERS,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        retries=3,
+        timeout=30,
+    ):
+        """Instantiate the downloader."""
+        if session is None:
+            session = get_http_client().session
+        self._session = session
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.retries = retries
+        self.timeout = timeout
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop the download in progress, from any thread.
+
+        ``download`` then raises ``DownloadCancelled``. The chunks already
+        fetched are kept, so that downloading the file again resumes.
+        """
+        self._cancelled.set()
+
+    def download(self, url, output_path, headers=None, progress=None):
+        """Download a file.
+
+        If ``output_path`` already exists and has the same size as the
+        remote file, it is reused and nothing is downloaded.
+
+        Parameters
+        ----------
+        url : str
+            File to download.
+        output_path : str
+            Full path of the downloaded file.
+        headers : dict, optional
+            Extra request headers, such as ``Authorization``.
+        progress : callable, optional
+            Function called with ``(downloaded_bytes, total_bytes)`` while
+            the download is in progress. ``total_bytes`` is ``None`` when
+            unknown. Always called from the calling thread.
+
+        Returns
+        -------
+        dict
+            Information on the downloaded file with the keys ``"path"``,
+            ``"size"``, ``"etag"``, ``"last_modified"`` and ``"cached"``.
+
+        Raises
+        ------
+        requests.exceptions.HTTPError
+            If the server replies with an error status.
+        DownloadCancelled
+            If the download was cancelled.
+
+        """
+        self._check_cancelled(url)
+        headers = dict(headers or {})
+        response = self._session.get(
+            url,
+            headers={**headers, "Range": "bytes=0-0"},
+            allow_redirects=True,
+            stream=True,
+            timeout=self.timeout,
+        )
+        if not response.ok:
+            # Return the connection to the pool before raising
+            response.close()
+            response.raise_for_status()
+
+        total = None
+        ranged = False
+        if response.status_code == 206:
+            match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+            if match and match.group(3) != "*":
+                total = int(match.group(3))
+                ranged = True
+        elif "Content-Length" in response.headers:
+            total = int(response.headers["Content-Length"])
+
+        info = {
+            "path": output_path,
+            "size": total,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "cached": False,
+        }
+
+        if total and os.path.isfile(output_path):
+            if os.path.getsize(output_path) == total:
+                LOG.debug("Sizes match. Using cached file from %s", output_path)
+                response.close()
+                info["cached"] = True
+                return info
+            LOG.debug("Sizes do not match. Ignoring cached file.")
+
+        if ranged:
+            response.close()
+            # Range requests go straight to the final location. Do not leak
+            # credentials of the original host to the redirect target.
+            if urlparse(response.url).netloc != urlparse(url).netloc:
+                headers.pop("Authorization", None)
+            self._download_ranges(url, response.url, headers, info, progress)
+        else:
+            LOG.debug("Server does not support ranges. Using a single stream.")
+            self._download_stream(response, info, progress)
+
+        return info
+
+    def revalidate(self, url, etag=None, last_modified=None, size=None, headers=None):
+        """Check whether a previously downloaded file is still current.
+
+        Sends a conditional ``HEAD`` request using ``If-None-Match`` and
+        ``If-Modified-Since``. If the server does not accept ``HEAD``, for
+        example on presigned redirect targets, a conditional ``GET`` is sent
+        and closed before reading its body.
+
+        Parameters
+        ----------
+        url : str
+            URL of the file.
+        etag : str, optional
+            ``ETag`` returned when the file was downloaded.
+        last_modified : str, optional
+            ``Last-Modified`` header returned when the file was downloaded.
+        size : int, optional
+            Size of the downloaded file. Only used when the server provides
+            no validators.
+        headers : dict, optional
+            Extra request headers, such as ``Authorization``.
+
+        Returns
+        -------
+        bool
+            ``True`` if the file is unchanged or the server cannot be
+            reached, ``False`` if it changed.
+
+        """
+        headers = dict(headers or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = self._session.head(
+                url, headers=headers, allow_redirects=True, timeout=self.timeout
+            )
+            if response.status_code not in (200, 304):
+                response = self._session.get(
+                    url,
+                    headers=headers,
+                    allow_redirects=True,
+                    stream=True,
+                    timeout=self.timeout,
+                )
+                response.close()
+        except requests.exceptions.RequestException as err:
+            LOG.warning("Unable to revalidate %s: %s. Using cached file.", url, err)
+            return True
+
+        if response.status_code == 304:
+            return True
+        if response.status_code != 200:
+            LOG.warning(
+                "Received %s while revalidating %s. Using cached file.",
+                response.status_code,
+                url,
+            )
+            return True
+
+        remote_etag = response.headers.get("ETag")
+        if etag and remote_etag:
+            return remote_etag == etag
+        remote_modified = response.headers.get("Last-Modified")
+        if last_modified and remote_modified:
+            return remote_modified == last_modified
+        remote_size = response.headers.get("Content-Length")
+        if size is not None and remote_size is not None:
+            return int(remote_size) == size
+        return False
+
+    def _download_stream(self, response, info, progress):
+        """Read the whole response body in a single stream."""
+        part_path = f"{info['path']}.part"
+        _remove(f"{part_path}.json")
+
+        downloaded = 0
+        with response, open(part_path, "wb") as f:
+            for block in response.iter_content(STREAM_BLOCK_SIZE):
+                f.write(block)
+                downloaded += len(block)
+                if progress is not None:
+                    progress(downloaded, info["size"])
+                self._check_cancelled(info["path"])
+
+        os.replace(part_path, info["path"])
+        info["size"] = downloaded
+
+    def _download_ranges(self, url, final_url, headers, info, progress):
+        """Fetch all missing chunks of the file concurrently."""
+        total = info["size"]
+        part_path = f"{info['path']}.part"
+        state_path = f"{part_path}.json"
+
+        chunks = [
+            (start, min(start + self.chunk_size, total) - 1)
+            for start in range(0, total, self.chunk_size)
+        ]
+        state = {
+            "url": url,
+            "size": total,
+            "chunk_size": self.chunk_size,
+            "etag": info["etag"],
+            "last_modified": info["last_modified"],
+            "done": [],
+        }
+
+        previous = _read_state(state_path)
+        if (
+            previous is not None
+            and all(previous.get(key) == state[key] for key in state if key != "done")
+            and os.path.isfile(part_path)
+            and os.path.getsize(part_path) == total
+        ):
+            state["done"] = sorted(set(previous["done"]))
+            LOG.debug("Resuming %s with %d chunks done", url, len(state["done"]))
+        else:
+            with open(part_path, "wb") as f:
+                f.truncate(total)
+            _write_state(state_path, state)
+
+        if info["etag"]:
+            # Fail instead of mixing two versions of the file
+            headers["If-Range"] = info["etag"]
+
+        lock = threading.Lock()
+        stop = threading.Event()
+        done = set(state["done"])
+        downloaded = [
+            sum(end - start + 1 for i, (start, end) in enumerate(chunks) if i in done)
+        ]
+
+        def on_bytes(nbytes):
+            with lock:
+                downloaded[0] += nbytes
+
+        def on_chunk_done(index):
+            with lock:
+                done.add(index)
+                state["done"] = sorted(done)
+                _write_state(state_path, state)
+
+        pending = [i for i in range(len(chunks)) if i not in done]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(
+                    self._fetch_range,
+                    final_url,
+                    headers,
+                    part_path,
+                    index,
+                    chunks[index],
+                    stop,
+                    on_bytes,
+                    on_chunk_done,
+                )
+                for index in pending
+            ]
+            not_done = set(futures)
+            try:
+                while not_done:
+                    finished, not_done = wait(
+                        not_done, timeout=0.1, return_when=FIRST_EXCEPTION
+                    )
+                    if progress is not None:
+                        progress(downloaded[0], total)
+                    self._check_cancelled(url)
+                    for future in finished:
+                        future.result()  # raise any exception
+            except BaseException:
+                stop.set()
+                for future in not_done:
+                    future.cancel()
+                raise
+
+        os.replace(part_path, info["path"])
+        _remove(state_path)
+
+    def _check_cancelled(self, name):
+        """Raise ``DownloadCancelled`` if the download was cancelled."""
+        if self._cancelled.is_set():
+            raise DownloadCancelled(f"Download of {name} was cancelled")
+
+    def _fetch_range(
+        self, url, headers, part_path, index, chunk, stop, on_bytes, on_chunk_done
+    ):
+        """Download one chunk, retrying from the last byte written."""
+        start, end = chunk
+        offset = start
+        attempt = 0
+        while True:
+            try:
+                response = self._session.get(
+                    url,
+                    headers={**headers, "Range": f"bytes={offset}-{end}"},
+                    stream=True,
+                    timeout=self.timeout,
+                )
+                with response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise requests.exceptions.HTTPError(
+                            f"Expected a partial response for {url}, "
+                            f"received {response.status_code}. "
+                            "The file may have changed on the server.",
+                            response=response,
+                        )
+                    with open(part_path, "r+b") as f:
+                        f.seek(offset)
+                        for block in response.iter_content(STREAM_BLOCK_SIZE):
+                            if stop.is_set():
+                                return
+                            block = block[: end + 1 - offset]
+                            f.write(block)
+                            offset += len(block)
+                            on_bytes(len(block))
+                            if offset > end:
+                                break
+                if offset <= end:
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f"Connection closed at byte {offset} of chunk {index}"
+                    )
+                on_chunk_done(index)
+                return
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.Timeout,
+            ) as err:
+                attempt += 1
+                if attempt > self.retries or stop.is_set():
+                    raise
+                LOG.debug("Retrying chunk %d of %s after: %s", index, url, err)
+
+
+def _read_state(state_path):
+    """Read the resume state of a partial download."""
+    try:
+        with open(state_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(state_path, state):
+    """Write the resume state of a partial download."""
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, state_path)
+
+
+def _remove(path):
+    """Remove a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
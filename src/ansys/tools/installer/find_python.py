@@ -22,19 +22,28 @@
 
 """Search for Python or miniforge installations within the Windows registry."""
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
-import subprocess
+import re
 
 from ansys.tools.common.path import get_available_ansys_installations
 
-from ansys.tools.installer.configure_json import ConfigureJson
-from ansys.tools.installer.constants import ANSYS_SUPPORTED_PYTHON_VERSIONS
+from ansys.tools.installer.configure_json import get_configure_json
+from ansys.tools.installer.constants import (
+    ANSYS_SUPPORTED_PYTHON_VERSIONS,
+    PYTHON_PROBE_MAX_WORKERS,
+    VENV_DISCOVERY_DEPTH,
+    VENV_DISCOVERY_IGNORE,
+)
+from ansys.tools.installer.inventory import get_inventory
 from ansys.tools.installer.linux_functions import (
+    ansys_linux_path,
     find_ansys_installed_python_linux,
     find_miniforge_linux,
-    is_linux_os,
 )
+from ansys.tools.installer.python_version import get_python_version
+from ansys.tools.installer.venv_discovery import discover_venvs, scan_root
 
 # only used on windows
 try:
@@ -46,6 +55,8 @@ except ModuleNotFoundError:
 LOG = logging.getLogger(__name__)
 LOG.setLevel("DEBUG")
 
+_PYTHON_NAME = re.compile(r"^python(3(\.\d+)?)?$")
+
 
 def find_miniforge():
     """Find all installations of miniforge within the Windows registry.
@@ -61,7 +72,13 @@ def find_miniforge():
         paths = _find_miniforge_win(True)
         paths.update(_find_miniforge_win(False))
     else:
-        paths = find_miniforge_linux()
+        conda_path = os.path.join(ansys_linux_path, "conda")
+        paths = _cached_paths(
+            f"miniforge:{os.environ.get('CONDA_PYTHON_EXE', '')}",
+            find_miniforge_linux,
+            [conda_path, os.path.join(conda_path, "conda-meta")],
+        )
+    get_inventory().save()
     return paths
 
 
@@ -141,15 +158,11 @@ def _find_installed_ansys_python_win():
                 f"commonfiles\\CPython\\{ansys_py_ver}\\winx64\\Release\\python",
             )
             if os.path.exists(path):
-                try:
-                    version_output = subprocess.check_output(
-                        [f"{path}\\python.exe", "--version"], text=True
-                    ).strip()
-                    version = version_output.split()[1]
+                version = _cached_python_version(os.path.join(path, "python.exe"))
+                if version is not None:
                     paths[path] = (version, False)
-                except Exception as err:
-                    LOG.error(f"Failed to retrieve Python version: {str(err)}")
-                    pass
+                else:
+                    LOG.error(f"Failed to retrieve Python version of {path}")
 
     return paths
 
@@ -158,6 +171,12 @@ def _find_installed_python_linux():
     """
     Find all installed Python versions on Linux.
 
+    The directories of ``PATH`` are scanned in order for Python
+    executables, so the first match of each name wins as with ``which``.
+    Names resolving to the same interpreter are reported once, and the
+    versions of the distinct interpreters are read concurrently from their
+    installation files.
+
     Returns
     -------
     dict
@@ -168,35 +187,109 @@ def _find_installed_python_linux():
     --------
     >>> installed_pythons = find_installed_python_linux()
     >>> installed_pythons
-    {'/home/user/python/py311/bin/python': ('3.11.3', False),
-     '/home/user/python/py311/bin/python3': ('3.11.3', False),
+    {'/usr/bin/python3': ('3.10.12', True),
+     '/home/user/python/py311/bin/python3.11': ('3.11.3', False)}
 
     """
     LOG.debug("Identifying all installed versions of python on Linux")
 
-    pythons = {}
-    version_names = ["python", "python3"] + [f"python3.{i}" for i in range(7, 13)]
-    previous_found_version = ""
+    interpreters = {}
+    for path in _find_python_executables_linux():
+        interpreters.setdefault(os.path.realpath(path), path)
+    paths = list(interpreters.values())
 
-    for version_name in version_names:
-        try:
-            path = subprocess.check_output(["which", version_name], text=True).strip()
-            version_output = subprocess.check_output(
-                [path, "--version"], text=True
-            ).strip()
-            version = version_output.split()[1]
-            admin = path.startswith("/usr")
-            if version != previous_found_version:
-                pythons[path] = (version, admin)
+    pythons = {}
+    with ThreadPoolExecutor(max_workers=PYTHON_PROBE_MAX_WORKERS) as executor:
+        versions = executor.map(_cached_python_version, paths)
+        for path, version in zip(paths, versions):
+            if version is not None:
+                pythons[path] = (version, path.startswith("/usr"))
                 LOG.debug("Identified %s at %s", version, path)
-                previous_found_version = version
-        except:
-            # Ignore if the command fails (e.g., if the Python version is not installed)
-            pass
 
     return pythons
 
 
+def _find_python_executables_linux():
+    """Find the first executable of each Python name on ``PATH``.
+
+    The result is kept in the inventory until one of the directories of
+    ``PATH`` changes.
+
+    Returns
+    -------
+    list of str
+        Paths of the executables named ``python``, ``python3`` or
+        ``python3.X``, sorted by name.
+
+    """
+    directories = [
+        os.path.abspath(directory or os.curdir)
+        for directory in os.environ.get("PATH", "").split(os.pathsep)
+    ]
+    return get_inventory().get(
+        f"path:{os.pathsep.join(directories)}",
+        lambda: (_scan_path(directories), directories),
+    )
+
+
+def _scan_path(directories):
+    """Find the first executable of each Python name in directories."""
+    found = {}
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in found or not _PYTHON_NAME.match(entry.name):
+                        continue
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            found[entry.name] = entry.path
+                    except OSError:
+                        pass
+        except OSError:
+            # Missing or unreadable PATH entry
+            continue
+
+    return [found[name] for name in sorted(found, key=_python_name_key)]
+
+
+def _cached_python_version(path):
+    """Get the version of an interpreter, reading it only if it changed."""
+    real_path = os.path.realpath(path)
+    return get_inventory().get(
+        f"python:{path}",
+        lambda: (get_python_version(path), [os.path.dirname(path), real_path]),
+    )
+
+
+def _cached_paths(key, find, watch):
+    """Get the result of a ``find_*`` function from the inventory.
+
+    Parameters
+    ----------
+    key : str
+        Key of the result in the inventory.
+    find : callable
+        Function returning a ``{path: (version, admin)}`` dictionary.
+    watch : list of str
+        Paths whose modification invalidates the result.
+
+    Returns
+    -------
+    dict
+        Result of ``find``.
+
+    """
+    paths = get_inventory().get(key, lambda: (find(), watch))
+    return {path: tuple(info) for path, info in paths.items()}
+
+
+def _python_name_key(name):
+    """Sort ``python`` before ``python3`` before ``python3.X``, by minor version."""
+    parts = name[len("python") :].split(".")
+    return [int(part) for part in parts if part]
+
+
 def _get_python_info_win(key, root_key):
     """For a given windows key, read the install path and python version."""
     with winreg.OpenKey(root_key, key, access=winreg.KEY_READ) as reg_key:
@@ -232,7 +325,14 @@ def find_all_python():
         paths.update(_find_installed_ansys_python_win())
     else:
         paths = _find_installed_python_linux()
-        paths.update(find_ansys_installed_python_linux())
+        paths.update(
+            _cached_paths(
+                "ansys-python",
+                find_ansys_installed_python_linux,
+                [ansys_linux_path],
+            )
+        )
+    get_inventory().save()
 
     return paths
 
@@ -240,32 +340,54 @@ def find_all_python():
 def get_all_python_venv():
     """Get a list of all created python virtual environments.
 
+    The search paths are scanned up to the configured depth, skipping the
+    configured ignore patterns. The environments of each search path are
+    kept in the inventory, and only listed again when a directory scanned
+    within it changes.
+
     Returns
     -------
     dict
         Dictionary containing a key for each path and a ``tuple``
         containing ``(version_str, is_admin)``.
     """
-    paths = {}
-    script_path = "bin" if is_linux_os() else "Scripts"
-    configure = ConfigureJson()
-    for venv_dir in configure.venv_search_path:
-        try:
-            for venv_dir_name in os.listdir(venv_dir):
-                if os.path.isfile(
-                    os.path.join(venv_dir, venv_dir_name, script_path, "activate")
-                ) or (
-                    not os.path.isdir(os.path.join(venv_dir, venv_dir_name, "condabin"))
-                    and os.path.isdir(
-                        os.path.join(venv_dir, venv_dir_name, "conda-meta")
-                    )
-                ):
-
-                    path = os.path.join(venv_dir, venv_dir_name, script_path)
-                    paths[path] = (
-                        venv_dir_name,
-                        False,
-                    )  # venvs will always be user-like, hence False
-        except:
-            pass
-    return paths
+    configure = get_configure_json()
+    records = discover_venvs(
+        configure.venv_search_path,
+        configure.venv_search_depth,
+        configure.venv_ignore,
+        inventory=get_inventory(),
+    )
+    get_inventory().save()
+    # venvs will always be user-like, hence False
+    return {record.scripts: (record.name, False) for record in records}
+
+
+def scan_venv_dir(
+    venv_dir, script_path, max_depth=VENV_DISCOVERY_DEPTH, ignore=VENV_DISCOVERY_IGNORE
+):
+    """List the virtual environments of a search path.
+
+    Parameters
+    ----------
+    venv_dir : str
+        Directory holding virtual environments.
+    script_path : str
+        Directory of the scripts of an environment, ``"bin"`` or
+        ``"Scripts"``.
+    max_depth : int, default: VENV_DISCOVERY_DEPTH
+        Depth of the directories searched. Environments directly in
+        ``venv_dir`` are at depth 1.
+    ignore : sequence of str, default: VENV_DISCOVERY_IGNORE
+        Glob patterns of the directories to skip.
+
+    Returns
+    -------
+    tuple
+        Names of the environments, relative to ``venv_dir``, and the paths
+        whose modification changes them. Directories that are not
+        environments yet are watched, so environments being created are
+        picked up.
+    """
+    records, watch = scan_root(venv_dir, max_depth, ignore, script_path=script_path)
+    return [record.name for record in records], watch
@@ -0,0 +1,197 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pooled HTTP client shared by the whole application."""
+
+import atexit
+import logging
+import threading
+
+import certifi
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ansys.tools.installer.configure_json import get_configure_json
+from ansys.tools.installer.constants import (
+    CA_BUNDLE,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_MAX_HOSTS,
+    HTTP_PROXY,
+    HTTP_RETRIES,
+    HTTP_RETRY_STATUSES,
+)
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+class HttpClient:
+    """HTTP client keeping connections alive across requests.
+
+    All requests go through a single ``requests.Session``, so connections
+    to a host are reused instead of paying a new TCP and TLS handshake for
+    every request. Connection errors and transient server errors are
+    retried with an exponential backoff.
+
+    Parameters
+    ----------
+    proxy : str, optional
+        URL of the proxy used for HTTP and HTTPS requests. Defaults to the
+        ``HTTP_PROXY`` and ``HTTPS_PROXY`` environment variables.
+    ca_bundle : str, optional
+        Certificate authority bundle used to verify servers. Defaults to
+        the bundle of ``certifi``.
+    max_connections : int, optional
+        Maximum number of connections open to each host. Further requests
+        to the same host wait for a connection to be free.
+    retries : int, optional
+        Number of times a failed request is retried.
+    backoff_factor : float, optional
+        Backoff factor in seconds between retries.
+
+    Examples
+    --------
+    >>> client = HttpClient()
+    >>> client.session.get("https://pypi.org/simple/pyansys/")
+    <Response [200]>
+    >>> client.stats()
+    {'https://pypi.org:443': {'connections': 1, 'requests': 1, 'reused': 0}}
+
+    """
+
+    def __init__(
+        self,
+        proxy=None,
+        ca_bundle=None,
+        max_connections=HTTP_MAX_CONNECTIONS_PER_HOST,
+        retries=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+    ):
+        """Instantiate the client."""
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            # Let the callers handle the last error response
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_MAX_HOSTS,
+            pool_maxsize=max_connections,
+            pool_block=True,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.configure(proxy=proxy, ca_bundle=ca_bundle)
+
+    def configure(self, proxy=None, ca_bundle=None):
+        """Set the proxy and the certificate authority bundle.
+
+        Parameters
+        ----------
+        proxy : str, optional
+            URL of the proxy used for HTTP and HTTPS requests.
+        ca_bundle : str, optional
+            Certificate authority bundle used to verify servers.
+
+        """
+        self.session.proxies = {"http": proxy, "https": proxy} if proxy else {}
+        self.session.verify = ca_bundle or certifi.where()
+
+    def stats(self):
+        """Get the connection reuse statistics of each host.
+
+        Returns
+        -------
+        dict
+            Number of ``connections`` opened, ``requests`` sent and requests
+            that ``reused`` an open connection, keyed by host.
+
+        """
+        stats = {}
+        for adapter in set(self.session.adapters.values()):
+            managers = [adapter.poolmanager, *adapter.proxy_manager.values()]
+            for manager in managers:
+                for key in list(manager.pools.keys()):
+                    pool = manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    host = f"{pool.scheme}://{pool.host}:{pool.port}"
+                    stats[host] = {
+                        "connections": pool.num_connections,
+                        "requests": pool.num_requests,
+                        "reused": max(0, pool.num_requests - pool.num_connections),
+                    }
+        return stats
+
+    def log_stats(self):
+        """Log the connection reuse statistics."""
+        for host, host_stats in self.stats().items():
+            LOG.debug(
+                "%s: %d requests over %d connections",
+                host,
+                host_stats["requests"],
+                host_stats["connections"],
+            )
+
+    def close(self):
+        """Close all open connections."""
+        self.session.close()
+
+
+def get_http_client():
+    """Get the HTTP client shared by the whole application.
+
+    The client is created on first use with the proxy and certificate
+    authority bundle of the configuration, and follows their changes.
+
+    Returns
+    -------
+    HttpClient
+        Shared HTTP client.
+
+    """
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            config = get_configure_json()
+            _HTTP_CLIENT = HttpClient(
+                proxy=config.http_proxy, ca_bundle=config.ca_bundle
+            )
+            atexit.register(_HTTP_CLIENT.log_stats)
+            config.signals.changed.connect(_on_setting_changed)
+    return _HTTP_CLIENT
+
+
+def _on_setting_changed(key):
+    """Apply the network settings of the configuration when they change."""
+    if key in (HTTP_PROXY, CA_BUNDLE):
+        config = get_configure_json()
+        get_http_client().configure(proxy=config.http_proxy, ca_bundle=config.ca_bundle)
@@ -33,34 +33,80 @@ from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import QComboBox
 
 from ansys.tools.installer.common import get_pkg_versions, get_targets
-from ansys.tools.installer.configure_json import ConfigureJson
+from ansys.tools.installer.configure_json import get_configure_json
 from ansys.tools.installer.constants import (
     PYANSYS_LIBS,
+    REFRESH_DEBOUNCE,
     SELECT_VENV_MANAGE_TAB,
     USER_PATH,
+    VENV_METADATA_DEBOUNCE,
+    VENV_METADATA_MAX_WORKERS,
 )
 from ansys.tools.installer.find_python import (
     find_all_python,
     find_miniforge,
     get_all_python_venv,
 )
+from ansys.tools.installer.inventory import get_inventory
+from ansys.tools.installer.inventory_model import (
+    PLACEHOLDER_PATH,
+    InventoryFilterModel,
+    InventoryModel,
+)
+from ansys.tools.installer.jobs import Job, get_job_scheduler
 from ansys.tools.installer.linux_functions import (
     delete_venv_conda,
     is_linux_os,
     run_linux_command,
     run_linux_command_conda,
 )
+from ansys.tools.installer.venv_metadata import get_venv_metadata
 from ansys.tools.installer.vscode import VSCode
+from ansys.tools.installer.watcher import get_inventory_watcher
+from ansys.tools.installer.windows_functions import upgrade_package_managers_windows
+from ansys.tools.installer.workers import RequestDispatcher
 
 ALLOWED_FOCUS_EVENTS = [QtCore.QEvent.Type.WindowActivate, QtCore.QEvent.Type.Show]
 LOG = logging.getLogger(__name__)
 LOG.setLevel("DEBUG")
 
 
+def _discover_entries(interpreters, venvs):
+    """Find the entries of a dropdown.
+
+    Run in a worker thread, so it must not touch any widget.
+
+    Parameters
+    ----------
+    interpreters : bool
+        Find the Python and miniforge installations.
+    venvs : bool
+        Find the virtual environments.
+
+    Returns
+    -------
+    list of tuple
+        ``(path, version, admin)`` of each entry.
+
+    """
+    entries = []
+    if interpreters:
+        LOG.debug("Populating the dropdown with python and conda forge versions.")
+        for path, (version, admin) in find_all_python().items():
+            entries.append((path, f"Python {version}", admin))
+        for path, (version, admin) in find_miniforge().items():
+            entries.append((path, f"Conda {version}", admin))
+    elif venvs:
+        LOG.debug("Populating the dropdown with virtual environments.")
+        for path, (version, admin) in get_all_python_venv().items():
+            entries.append((path, version, admin))
+    return entries
+
+
 class DataComboBox(QtWidgets.QComboBox):
     """Dropdown list of locally installed Python environments/Virtual Environments."""
 
-    signal_update = QtCore.Signal()
+    refreshed = QtCore.Signal()
 
     def __init__(
         self,
@@ -69,93 +115,268 @@ class DataComboBox(QtWidgets.QComboBox):
         installed_forge=False,
         created_venv=False,
     ):
-        """Initialize the dropdown by populating it."""
+        """Initialize the dropdown and start populating it."""
         super().__init__(parent)
 
         self.installed_python = installed_python
         self.installed_forge = installed_forge
         self.created_venv = created_venv
 
+        self._model = InventoryModel(self, placeholder=created_venv)
+        self._filter_model = InventoryFilterModel(self._model, self)
+        self.setModel(self._filter_model)
+        self._filter_model.modelAboutToBeReset.connect(self._remember_selection)
+        self._filter_model.modelReset.connect(self._restore_selection)
+        self._selected_path = None
+
         self._destroyed = False
-        self._locked = True
-        self.populate()
-        self.signal_update.connect(self.populate)
+        self.destroyed.connect(self.stop)
 
-    def update(self, timeout=1.0):
-        """Update this dropdown.
+        # Refreshes requested in a burst are coalesced into one discovery
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE)
+        self._refresh_timer.timeout.connect(self._start_refresh)
+        self._requests = RequestDispatcher(self, max_threads=1)
+        self._requested_at = None
+        self._metrics = {
+            "requests": 0,
+            "refreshes": 0,
+            "coalesced": 0,
+            "last_latency": 0.0,
+            "max_latency": 0.0,
+            "total_latency": 0.0,
+        }
+
+        # Metadata of the environments is collected in worker threads, and
+        # applied in batches
+        self._metadata_requests = RequestDispatcher(
+            self, max_threads=VENV_METADATA_MAX_WORKERS
+        )
+        self._metadata = {}
+        self._metadata_timer = QtCore.QTimer(self)
+        self._metadata_timer.setSingleShot(True)
+        self._metadata_timer.setInterval(VENV_METADATA_DEBOUNCE)
+        self._metadata_timer.timeout.connect(self._apply_metadata)
+
+        # The first discovery also runs in the worker thread, the placeholder
+        # row being shown until it is done
+        self._model.set_loading(True)
+        self._start_refresh()
+
+        # Follow environments and interpreters added or removed on disk
+        watcher = get_inventory_watcher()
+        if self.created_venv:
+            watcher.venv_added.connect(self.add_entry)
+            watcher.venv_removed.connect(self.remove_entry)
+        else:
+            watcher.interpreter_added.connect(self.add_entry)
+            watcher.interpreter_removed.connect(self.remove_entry)
 
-        Respects a lock to ensure no race conditions or multiple calls on the widget.
+    def update(self):
+        """Schedule a refresh of this dropdown.
 
-        """
-        tstart = time.time()
-        while self._locked:
-            time.sleep(0.001)
-            if time.time() - tstart > timeout:
-                return
+        Discovery runs in a worker thread, and its result is applied to the
+        entries in one step once it is done. Requests made while a refresh
+        is scheduled are served by that refresh. Requests made while a
+        refresh is running schedule a single new one once it is done.
 
-        self.signal_update.emit()
+        """
+        self._metrics["requests"] += 1
+        if self._requested_at is None:
+            self._requested_at = time.perf_counter()
+        else:
+            self._metrics["coalesced"] += 1
+        if not self._requests.is_pending("populate"):
+            self._refresh_timer.start()
 
     def populate(self):
-        """Populate the dropdown."""
-        self._locked = True
-        self.clear()
+        """Populate the dropdown in the calling thread."""
+        if self._destroyed:
+            return
+        self._apply_entries(
+            _discover_entries(
+                self.installed_python or self.installed_forge, self.created_venv
+            )
+        )
+
+    @property
+    def refresh_metrics(self):
+        """Statistics of the refreshes requested with ``update``.
+
+        Returns
+        -------
+        dict
+            Number of ``requests``, of ``refreshes`` run and of requests
+            ``coalesced`` into another one, as well as the ``last_latency``,
+            ``max_latency`` and ``mean_latency`` in seconds between the first
+            request served by a refresh and the update of the entries.
 
+        """
+        metrics = dict(self._metrics)
+        total_latency = metrics.pop("total_latency")
+        refreshes = metrics["refreshes"]
+        metrics["mean_latency"] = total_latency / refreshes if refreshes else 0.0
+        return metrics
+
+    def _start_refresh(self):
+        """Run the discovery of the entries in a worker thread."""
         if self._destroyed:
             return
+        requested_at, self._requested_at = self._requested_at, None
+        self._requests.submit(
+            "populate",
+            _discover_entries,
+            self.installed_python or self.installed_forge,
+            self.created_venv,
+            on_result=lambda entries: self._finish_refresh(entries, requested_at),
+            on_error=lambda err: self._finish_refresh(None, requested_at),
+        )
 
-        # Check for python & conda forge versions
-        if self.installed_python or self.installed_forge:
-            LOG.debug("Populating the dropdown with python and conda forge versions.")
-            python_lst = find_all_python()
-            conda_lst = find_miniforge()
-
-            for path, (version, admin) in python_lst.items():
-                admin_badge = "  [admin]" if admin else ""
-                label = f"Python {version}{admin_badge}  —  {path}"
-                self.addItem(label)
-                idx = self.count() - 1
-                self.setItemData(
-                    idx,
-                    {"version": f"Python {version}", "admin": str(admin), "path": path},
-                )
-                self.setItemData(idx, path, QtCore.Qt.ItemDataRole.ToolTipRole)
-
-            for path, (version, admin) in conda_lst.items():
-                admin_badge = "  [admin]" if admin else ""
-                label = f"Conda {version}{admin_badge}  —  {path}"
-                self.addItem(label)
-                idx = self.count() - 1
-                self.setItemData(
-                    idx,
-                    {"version": f"Conda {version}", "admin": str(admin), "path": path},
-                )
-                self.setItemData(idx, path, QtCore.Qt.ItemDataRole.ToolTipRole)
-
-        elif self.created_venv:
-            LOG.debug("Populating the dropdown with virtual environments.")
-            venv_lst = get_all_python_venv()
-            if not venv_lst:
-                self.addItem("None")
-                self.setItemData(
-                    0, {"version": "None", "admin": "None", "path": "None"}
-                )
-            else:
-                for path, (version, admin) in venv_lst.items():
-                    label = f"{version}  —  {path}"
-                    self.addItem(label)
-                    idx = self.count() - 1
-                    self.setItemData(
-                        idx, {"version": version, "admin": str(admin), "path": path}
-                    )
-                    self.setItemData(idx, path, QtCore.Qt.ItemDataRole.ToolTipRole)
+    def _finish_refresh(self, entries, requested_at):
+        """Apply the result of a refresh and start the next one, if requested.
 
-        self.destroyed.connect(self.stop)
-        self._locked = False
+        ``requested_at`` is ``None`` for the first discovery, which is not
+        counted in the metrics.
+        """
+        if entries is not None:
+            self._apply_entries(entries)
+        else:
+            LOG.warning("Unable to refresh the dropdown")
+            self._model.set_loading(False)
+        if requested_at is not None:
+            self._record_latency(requested_at)
+        self.refreshed.emit()
+
+        if self._requested_at is not None:
+            self._refresh_timer.start()
+
+    def _record_latency(self, requested_at):
+        """Record the latency of a refresh requested with ``update``."""
+        latency = time.perf_counter() - requested_at
+        self._metrics["refreshes"] += 1
+        self._metrics["last_latency"] = latency
+        self._metrics["max_latency"] = max(self._metrics["max_latency"], latency)
+        self._metrics["total_latency"] += latency
+        LOG.debug(
+            "Refreshed the dropdown in %.1f ms (%d requests coalesced so far)",
+            latency * 1000,
+            self._metrics["coalesced"],
+        )
+
+    def _apply_entries(self, entries):
+        """Update the entries, keeping the current selection."""
+        self._model.set_entries(entries)
+        self._model.set_loading(False)
+        self.collect_metadata([path for path, version, admin in entries])
+
+    def collect_metadata(self, paths):
+        """Collect the metadata of environments in worker threads.
+
+        The Python version, number of packages and size on disk of each
+        environment are shown once collected. They are kept in the
+        inventory, so only environments that changed are measured again.
+
+        Parameters
+        ----------
+        paths : list of str
+            Paths of the environment scripts.
+
+        """
+        if not self.created_venv or self._destroyed:
+            return
+        for path in paths:
+            if path == PLACEHOLDER_PATH:
+                continue
+            self._metadata_requests.submit(
+                f"metadata:{path}",
+                get_venv_metadata,
+                os.path.dirname(path),
+                on_result=lambda metadata, path=path: self._metadata_collected(
+                    path, metadata
+                ),
+            )
+
+    def _metadata_collected(self, path, metadata):
+        """Keep the metadata of an environment until the next batch."""
+        self._metadata[path] = metadata
+        if not self._metadata_timer.isActive():
+            self._metadata_timer.start()
+
+    def _apply_metadata(self):
+        """Show the metadata collected since the last batch."""
+        metadata, self._metadata = self._metadata, {}
+        self._model.set_metadata(metadata)
+        get_inventory().save()
+
+    def set_filter_text(self, text):
+        """Show only the entries matching a search text.
+
+        The selection is kept if it still matches, otherwise the first match
+        is selected.
+
+        Parameters
+        ----------
+        text : str
+            Words to find, in order, in the name, path or version of the
+            entries. All entries are shown if it is empty.
+
+        """
+        self._filter_model.set_filter_text(text)
+
+    def sort_by(self, key):
+        """Sort the entries, keeping the selection.
+
+        Parameters
+        ----------
+        key : str or None
+            One of the ``SORT_KEYS`` of ``InventoryFilterModel``, or
+            ``None`` for the discovery order.
+
+        """
+        self._filter_model.sort_by(key)
+
+    def _remember_selection(self):
+        """Remember the selected path before the rows are reset."""
+        self._selected_path = self.active_path
+
+    def _restore_selection(self):
+        """Select the remembered path again, or the first row."""
+        row = self.findData(self._selected_path, QtCore.Qt.ItemDataRole.ToolTipRole)
+        self.setCurrentIndex(row if row >= 0 else 0)
 
     def stop(self):
         """Flag that this object is gone."""
         self._destroyed = True
 
+    def add_entry(self, path, version, admin):
+        """Add an entry, unless its path is already listed.
+
+        Parameters
+        ----------
+        path : str
+            Path of the interpreter or of the environment scripts.
+        version : str
+            Version shown, for example ``"Python 3.12.0"``, or name of the
+            environment.
+        admin : bool
+            Whether the entry is installed for all users.
+
+        """
+        self._model.add(path, version, admin)
+        self.collect_metadata([path])
+
+    def remove_entry(self, path):
+        """Remove the entry of a path, if listed.
+
+        Parameters
+        ----------
+        path : str
+            Path of the interpreter or of the environment scripts.
+
+        """
+        self._model.remove(path)
+
     @property
     def active_version(self):
         """Version of the active selection."""
@@ -182,7 +403,6 @@ class InstalledTab(QtWidgets.QWidget):
         """Initialize this tab."""
         super().__init__()
         self._parent = parent
-        self._cached_versions = {}
 
         layout = QtWidgets.QVBoxLayout()
         self.setLayout(layout)
@@ -201,8 +421,30 @@ class InstalledTab(QtWidgets.QWidget):
         available_venv_box_text.setWordWrap(True)
         available_venv_box_layout.addWidget(available_venv_box_text, 0)
 
-        # --> Add the virtual environment dropdown
+        # --> Add the virtual environment search box, sorting and dropdown
+        venv_search_layout = QtWidgets.QHBoxLayout()
+        self.venv_search = QtWidgets.QLineEdit()
+        self.venv_search.setPlaceholderText("Search by name, path or Python version")
+        self.venv_search.setClearButtonEnabled(True)
+        venv_search_layout.addWidget(self.venv_search)
+        venv_search_layout.addWidget(QtWidgets.QLabel("Sort by:"))
+        self.venv_sort = QtWidgets.QComboBox()
+        for text, key in (
+            ("Discovery order", None),
+            ("Name", "name"),
+            ("Python version", "python_version"),
+            ("Packages", "packages"),
+            ("Disk size", "size"),
+        ):
+            self.venv_sort.addItem(text, key)
+        venv_search_layout.addWidget(self.venv_sort)
+        available_venv_box_layout.addLayout(venv_search_layout)
+
         self.venv_table = DataComboBox(created_venv=True)
+        self.venv_search.textChanged.connect(self.venv_table.set_filter_text)
+        self.venv_sort.currentIndexChanged.connect(
+            lambda index: self.venv_table.sort_by(self.venv_sort.itemData(index))
+        )
 
         available_venv_box_layout.addWidget(self.venv_table)
         self.venv_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -333,6 +575,7 @@ class InstalledTab(QtWidgets.QWidget):
         install_button_layout.addWidget(self.button_launch_cmd)
 
         self.button_launch_cmd.clicked.connect(self.install_pyansys_packages)
+        self._requests = RequestDispatcher(self)
         for library in PYANSYS_LIBS:
             self.model.appendRow(QStandardItem(library))
         self.packages_combo.currentIndexChanged.connect(self.update_package_combo)
@@ -460,36 +703,71 @@ class InstalledTab(QtWidgets.QWidget):
         self.launch_cmd(cmd, always_use_pip=True)
 
     def update_package_combo(self, index):
-        """Update the dropdown of available versions based on the package chosen."""
+        """Update the dropdown of available versions based on the package chosen.
+
+        Versions are fetched in the background. Changing the package again
+        before they arrive supersedes the pending request.
+        """
         package_name = PYANSYS_LIBS[self.packages_combo.currentText()]
-        if package_name not in self._cached_versions:
-            self._cached_versions[package_name] = get_pkg_versions(package_name)
 
+        # Outdated targets must not be applied to the new package
+        self._requests.cancel("targets")
+        self.version_target_combo.clear()
+        self.versions_combo.setEnabled(False)
+        self.version_target_combo.setEnabled(False)
+
+        self._requests.submit(
+            "versions",
+            get_pkg_versions,
+            package_name,
+            on_result=self._set_package_versions,
+        )
+
+    def _set_package_versions(self, versions):
+        """Populate the dropdown of versions. Called in the GUI thread."""
         # Populate the model with the fetched package versions and
-        # set the model as the active model for the version dropdown
+        # set the model as the active model for the version dropdown.
+        # Versions are served from the persistent metadata cache.
         versions_model = QStandardItemModel()
-        for version in self._cached_versions[package_name]:
+        for version in versions:
             versions_model.appendRow(QStandardItem(version))
 
         self.versions_combo.setModel(versions_model)
+        self.versions_combo.setEnabled(True)
         self.versions_combo.setCurrentIndex(0)
 
     def update_package_target_combo(self, index):
-        """Depending on the version chosen for a package, update the available list of targets."""
+        """Depending on the version chosen for a package, update the available list of targets.
+
+        Targets are fetched in the background. Changing the version again
+        before they arrive supersedes the pending request.
+        """
         package_name = PYANSYS_LIBS[self.packages_combo.currentText()]
         version = self.versions_combo.currentText()
 
         # Clear the previous targets
         self.version_target_combo.clear()
+        self.version_target_combo.setEnabled(False)
 
         # Get the available targets for the selected package version
-        targets = get_targets(package_name, version)
+        self._requests.submit(
+            "targets",
+            get_targets,
+            package_name,
+            version,
+            on_result=self._set_package_targets,
+        )
+
+    def _set_package_targets(self, targets):
+        """Populate the dropdown of targets. Called in the GUI thread."""
+        self.version_target_combo.clear()
 
         # Populate the target combo box with the available targets
         for target in targets:
             self.version_target_combo.addItem(target)
 
         # Set the first target as the current selection
+        self.version_target_combo.setEnabled(True)
         self.version_target_combo.setCurrentIndex(0)
 
     def list_packages(self):
@@ -501,13 +779,12 @@ class InstalledTab(QtWidgets.QWidget):
 
         Notes
         -----
-        Only working on base Python installations, for now.
+        Only working on base Python installations, for now. pip and uv
+        are upgraded by ``launch_cmd`` when they are outdated, so only
+        conda is updated here.
         """
-        if self.is_chk_box_active():
-            if "Python" in self.table.active_version:
-                cmd = "python -m pip install -U pip uv && exit"
-            else:  # Otherwise, conda
-                cmd = "conda update conda --yes && exit"
+        if self.is_chk_box_active() and "Python" not in self.table.active_version:
+            cmd = "conda update conda --yes && exit"
             self.launch_cmd(cmd, minimized_window=True)
 
     def find_env_type(self, table_name):
@@ -562,7 +839,7 @@ class InstalledTab(QtWidgets.QWidget):
 
     def delete_virtual_environment(self, point):
         """Delete virtual environments using right click."""
-        configure_json = ConfigureJson()
+        configure_json = get_configure_json()
         # Nothing to delete if no valid environment is selected
         if self.venv_table.count() == 0 or self.venv_table.active_path == "None":
             return
@@ -579,13 +856,15 @@ class InstalledTab(QtWidgets.QWidget):
             "venv_table"
         )
 
-        if is_vanilla_python and action == delete_action:
-            try:
+        if action != delete_action:
+            return
+
+        def delete(job):
+            """Delete the environment, in a job."""
+            if is_vanilla_python:
                 # Delete the python virtual environment
-                shutil.rmtree(parent_path)
-            except:
-                pass
-        elif not is_vanilla_python and action == delete_action:
+                shutil.rmtree(parent_path, ignore_errors=True)
+                return
             try:
                 # Delete the conda environment
                 if is_linux_os():
@@ -598,8 +877,16 @@ class InstalledTab(QtWidgets.QWidget):
             except:
                 pass
 
-        # Finally, update the venv table
-        self.venv_table.update()
+        # Finally, update the venv table once deleted
+        get_job_scheduler().submit(
+            Job(
+                f"Delete {os.path.basename(parent_path)}",
+                delete,
+                kind="delete-venv",
+                resource="disk",
+                on_done=lambda job: self.venv_table.update(),
+            )
+        )
 
     def launch_cmd(
         self,
@@ -674,9 +961,10 @@ class InstalledTab(QtWidgets.QWidget):
             if is_linux_os():
                 run_linux_command(py_path, extra, working_dir=working_dir)
             else:
-                # Update the package managers
-                shell_cmd = f"set PATH={new_path} && python -m pip install --upgrade pip uv && exit"
-                subprocess.call(f'start /w /min cmd /K "{shell_cmd}"', shell=True)
+                # Update the package managers, unless they are current
+                upgrade_package_managers_windows(
+                    os.path.join(py_path, "python.exe"), path=new_path
+                )
 
                 shell_cmd = f'set PATH={new_path} && cd /d ""{working_dir}"" {cmd}'
                 subprocess.call(f'start {min_win} cmd /K "{shell_cmd}"', shell=True)
@@ -22,14 +22,36 @@
 
 """Installer module for Ansys Python Manager."""
 
+import subprocess
+
+from ansys.tools.installer.build_cache import get_build_cache
+from ansys.tools.installer.configure_json import get_configure_json
 from ansys.tools.installer.linux_functions import install_python_linux, is_linux_os
 from ansys.tools.installer.windows_functions import install_python_windows
 
 
-def install_python(filename, wait=True):
-    """Install "vanilla" python for a single user."""
+def install_python(filename, wait=True, progress=None):
+    """Install "vanilla" python for a single user.
+
+    On Linux, Python is built from source with the build profile of the
+    configuration, and ``progress`` is called with the stage and the
+    percentage done while it is built, incrementally if configured. The
+    build is then added to the build cache.
+    """
     if is_linux_os():
-        install_python_linux(filename)
+        config = get_configure_json()
+        try:
+            install_python_linux(
+                filename,
+                profile=config.build_profile,
+                progress=progress,
+                build_cache=get_build_cache(),
+                incremental=config.build_incremental,
+            )
+        except subprocess.CalledProcessError as err:
+            return f"{err}\n\n{err.output}", err.returncode
+        except OSError as err:
+            return str(err), 1
         return "Success", None
     else:
         return install_python_windows(filename, wait)
@@ -0,0 +1,198 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Persistent inventory of interpreters and environments."""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from ansys.tools.installer.configure_json import get_configure_json
+from ansys.tools.installer.constants import (
+    INVENTORY_MAX_AGE,
+    INVENTORY_USE_RESOLUTION,
+)
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+INVENTORY_FORMAT = 1
+
+_INVENTORY = None
+_INVENTORY_LOCK = threading.Lock()
+
+
+class Inventory:
+    """Results of interpreter and environment discovery, kept across runs.
+
+    Each record holds a value, such as the version of an interpreter or the
+    environments of a search path, together with the modification times of
+    the files and directories it was computed from. A record is reused as
+    long as none of these modification times changed, so a refresh only
+    probes what changed on disk.
+
+    Parameters
+    ----------
+    path : str
+        JSON file holding the records.
+    max_age : float, optional
+        Number of seconds after which a record that was not used is
+        dropped.
+
+    Examples
+    --------
+    >>> inventory = Inventory("/tmp/inventory.json")
+    >>> def probe():
+    ...     return get_python_version("/usr/bin/python3"), ["/usr/bin/python3"]
+    >>> inventory.get("python:/usr/bin/python3", probe)
+    '3.12.3'
+    >>> inventory.save()
+
+    """
+
+    def __init__(self, path, max_age=INVENTORY_MAX_AGE):
+        """Instantiate the inventory."""
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._records = self._load()
+
+    def get(self, key, compute):
+        """Get a value, computing it again only if its files changed.
+
+        Parameters
+        ----------
+        key : str
+            Key of the record.
+        compute : callable
+            Function called without arguments when the record is missing
+            or outdated. It returns the value, which must be serializable
+            to JSON, and the list of paths whose modification times
+            invalidate it. Missing paths may be listed, so the record is
+            invalidated when they are created.
+
+        Returns
+        -------
+        object
+            Value of the record.
+
+        """
+        now = time.time()
+        with self._lock:
+            record = self._records.get(key)
+        if record is not None and _signature(record["paths"]) == record["signature"]:
+            # The time of use only needs to be precise enough to drop old
+            # records, so hits do not rewrite the inventory each time
+            if now - record["used"] >= INVENTORY_USE_RESOLUTION:
+                with self._lock:
+                    record["used"] = now
+                    self._dirty = True
+            return record["value"]
+
+        LOG.debug("Inventory record %s is outdated", key)
+        value, paths = compute()
+        record = {
+            "value": value,
+            "paths": list(paths),
+            "signature": _signature(paths),
+            "used": now,
+        }
+        with self._lock:
+            self._records[key] = record
+            self._dirty = True
+        return value
+
+    def invalidate(self, key=None):
+        """Drop a record, or all records if ``key`` is ``None``."""
+        with self._lock:
+            if key is None:
+                self._records.clear()
+            else:
+                self._records.pop(key, None)
+            self._dirty = True
+
+    def save(self):
+        """Write the records to disk if they changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            limit = time.time() - self.max_age
+            self._records = {
+                key: record
+                for key, record in self._records.items()
+                if record["used"] >= limit
+            }
+            data = {"format": INVENTORY_FORMAT, "records": self._records}
+            self._dirty = False
+            tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError as err:
+                LOG.debug("Unable to write the inventory %s: %s", self.path, err)
+
+    def _load(self):
+        """Read the records from disk."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != INVENTORY_FORMAT:
+            return {}
+        return data.get("records", {})
+
+
+def _signature(paths):
+    """Get the modification times of paths, ``None`` for missing ones."""
+    signature = []
+    for path in paths:
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return signature
+
+
+def get_inventory():
+    """Get the inventory shared by the whole application.
+
+    The inventory is stored in ``inventory.json``, next to the
+    ``config.json`` configuration file.
+
+    Returns
+    -------
+    Inventory
+        Shared inventory.
+
+    """
+    global _INVENTORY
+    with _INVENTORY_LOCK:
+        if _INVENTORY is None:
+            config_dir = get_configure_json().config_dir
+            _INVENTORY = Inventory(os.path.join(config_dir, "inventory.json"))
+    return _INVENTORY
@@ -0,0 +1,520 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Item models of the interpreters and environments found on disk."""
+
+from itertools import compress, repeat
+import re
+
+from PySide6 import QtCore
+
+from ansys.tools.installer.venv_metadata import format_size
+
+PLACEHOLDER_PATH = "None"
+
+
+def _metadata_value(entry, name):
+    """Get a metadata value of an entry, or ``None``."""
+    return None if entry.metadata is None else entry.metadata.get(name)
+
+
+def _sort_value(value):
+    """Sort value placing missing values last when sorting in reverse."""
+    return (False, 0) if value is None else (True, value)
+
+
+def _version_value(entry):
+    """Sort value of the Python version of an entry."""
+    version = _metadata_value(entry, "python_version")
+    if version is None:
+        return _sort_value(None)
+    return _sort_value(tuple(int(part) for part in re.findall(r"\d+", version)))
+
+
+#: Sort keys of ``InventoryFilterModel.sort_by``: key function and reverse
+SORT_KEYS = {
+    "name": (lambda entry: entry.version.lower(), False),
+    "python_version": (_version_value, True),
+    "packages": (lambda entry: _sort_value(_metadata_value(entry, "packages")), True),
+    "size": (lambda entry: _sort_value(_metadata_value(entry, "size")), True),
+}
+
+
+class InventoryEntry:
+    """Row of an ``InventoryModel``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the interpreter or of the environment scripts.
+    version : str
+        Version shown, for example ``"Python 3.12.0"``, or name of the
+        environment.
+    admin : bool
+        Whether the entry is installed for all users.
+    metadata : dict, optional
+        Python version, number of packages and size on disk of an
+        environment, as returned by ``get_venv_metadata``.
+
+    """
+
+    __slots__ = ("path", "version", "admin", "metadata", "label", "search_key")
+
+    def __init__(self, path, version, admin, metadata=None):
+        """Instantiate the entry."""
+        self.path = path
+        self.version = version
+        self.admin = admin
+        self.metadata = metadata
+        admin_badge = "  [admin]" if admin else ""
+        self.label = f"{version}{admin_badge}  —  {path}{_metadata_label(metadata)}"
+        self.search_key = f"{version} {path}".lower()
+
+    def same_as(self, other):
+        """Whether another entry shows the same data."""
+        return (
+            self.version == other.version
+            and self.admin == other.admin
+            and self.metadata == other.metadata
+        )
+
+    def to_dict(self):
+        """Get the data of the entry, as stored by dropdowns before."""
+        return {"version": self.version, "admin": str(self.admin), "path": self.path}
+
+
+class InventoryModel(QtCore.QAbstractListModel):
+    """List of interpreters or environments, updated in place.
+
+    Updates only insert, remove or change the rows that differ, so views
+    keep their selection and do not redraw unchanged rows.
+
+    Parameters
+    ----------
+    parent : QtCore.QObject, optional
+        Parent object.
+    placeholder : bool, default: False
+        Show a ``"None"`` row when there is no entry.
+
+    """
+
+    def __init__(self, parent=None, placeholder=False):
+        """Instantiate the model."""
+        super().__init__(parent)
+        self._placeholder = placeholder
+        self._loading = False
+        self._rows = []
+        self._rows_by_path = {}
+        self._sync_placeholder()
+
+    def set_loading(self, loading):
+        """Show the placeholder row, even without ``placeholder``, while loading.
+
+        Parameters
+        ----------
+        loading : bool
+            Whether the entries are being discovered.
+
+        """
+        self._loading = loading
+        self._sync_placeholder()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Get the number of rows."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Get the data of a row."""
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        return _entry_data(self._rows[index.row()], role)
+
+    @property
+    def entries(self):
+        """Entries of all the rows."""
+        return list(self._rows)
+
+    def entry(self, row):
+        """Get the entry of a row.
+
+        Parameters
+        ----------
+        row : int
+            Row of the entry.
+
+        Returns
+        -------
+        InventoryEntry
+            Entry of the row.
+
+        """
+        return self._rows[row]
+
+    def row_of(self, path):
+        """Get the row of a path, or -1 if it is not listed."""
+        entry = self._rows_by_path.get(path)
+        return -1 if entry is None else self._rows.index(entry)
+
+    def add(self, path, version, admin):
+        """Add an entry, or update the entry of the same path.
+
+        Parameters
+        ----------
+        path : str
+            Path of the interpreter or of the environment scripts.
+        version : str
+            Version shown, or name of the environment.
+        admin : bool
+            Whether the entry is installed for all users.
+
+        """
+        old = self._rows_by_path.get(path)
+        new = InventoryEntry(
+            path, version, admin, None if old is None else old.metadata
+        )
+        if old is not None and path != PLACEHOLDER_PATH:
+            if not old.same_as(new):
+                self._replace(self._rows.index(old), new)
+            return
+        self._insert([new])
+        self._sync_placeholder()
+
+    def remove(self, path):
+        """Remove the entry of a path, if listed."""
+        if path == PLACEHOLDER_PATH or path not in self._rows_by_path:
+            return
+        self._remove_rows([self.row_of(path)])
+        self._sync_placeholder()
+
+    def set_metadata(self, metadata):
+        """Set the metadata of entries.
+
+        Parameters
+        ----------
+        metadata : dict
+            Metadata of the entries, by path. Paths not listed are ignored.
+
+        """
+        changed = []
+        for path, entry_metadata in metadata.items():
+            old = self._rows_by_path.get(path)
+            if old is None or old.metadata == entry_metadata:
+                continue
+            new = InventoryEntry(path, old.version, old.admin, entry_metadata)
+            row = self._rows.index(old)
+            self._rows[row] = new
+            self._rows_by_path[path] = new
+            changed.append(row)
+        # One signal for the whole batch, as proxies update per signal
+        if changed:
+            self.dataChanged.emit(self.index(min(changed)), self.index(max(changed)))
+
+    def set_entries(self, entries):
+        """Replace the entries, updating only the rows that differ.
+
+        Rows of paths already listed keep their position, and new paths are
+        appended in the given order.
+
+        Parameters
+        ----------
+        entries : list of tuple
+            ``(path, version, admin)`` of each entry.
+
+        """
+        new_entries = {}
+        for path, version, admin in entries:
+            old = self._rows_by_path.get(path)
+            metadata = None if old is None else old.metadata
+            new_entries.setdefault(path, InventoryEntry(path, version, admin, metadata))
+
+        self._remove_rows(
+            [
+                row
+                for row, entry in enumerate(self._rows)
+                if entry.path not in new_entries
+                and (entry.path != PLACEHOLDER_PATH or new_entries)
+            ]
+        )
+        for row, entry in enumerate(self._rows):
+            new = new_entries.pop(entry.path, None)
+            if new is not None and not entry.same_as(new):
+                self._replace(row, new)
+        self._insert(list(new_entries.values()))
+        self._sync_placeholder()
+
+    def _insert(self, entries):
+        """Append entries."""
+        if not entries:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(entries) - 1)
+        self._rows.extend(entries)
+        for entry in entries:
+            self._rows_by_path[entry.path] = entry
+        self.endInsertRows()
+
+    def _remove_rows(self, rows):
+        """Remove rows, one contiguous range at a time from the end."""
+        ranges = []
+        for row in sorted(rows, reverse=True):
+            if ranges and ranges[-1][0] == row + 1:
+                ranges[-1][0] = row
+            else:
+                ranges.append([row, row])
+        for first, last in ranges:
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            for entry in self._rows[first : last + 1]:
+                del self._rows_by_path[entry.path]
+            del self._rows[first : last + 1]
+            self.endRemoveRows()
+
+    def _replace(self, row, entry):
+        """Replace the entry of a row with the same path."""
+        self._rows[row] = entry
+        self._rows_by_path[entry.path] = entry
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def _sync_placeholder(self):
+        """Show the placeholder row only when there is no other row."""
+        shown = self._placeholder or self._loading
+        if shown and not self._rows:
+            placeholder = InventoryEntry(PLACEHOLDER_PATH, "None", None)
+            placeholder.label = "None"
+            self._insert([placeholder])
+        elif PLACEHOLDER_PATH in self._rows_by_path and (
+            len(self._rows) > 1 or not shown
+        ):
+            self._remove_rows([self.row_of(PLACEHOLDER_PATH)])
+
+
+class InventoryFilterModel(QtCore.QAbstractListModel):
+    """Rows of an ``InventoryModel`` matching a search text.
+
+    Each word of the search text must be found, in order but not
+    necessarily contiguous, in the lowercase version, name or path of an
+    entry. For example, ``"pyd311"`` matches ``.../pydyna-py311/bin``.
+
+    Matching is incremental: for every prefix of the search text, the
+    matching entries are kept with the position where their match ended.
+    Typing a character only searches for it from these positions, and
+    erasing one goes back to the state of the shorter prefix.
+
+    Rows follow the order of the source, unless they are sorted by one of
+    the ``SORT_KEYS`` with ``sort_by``.
+
+    Parameters
+    ----------
+    source : InventoryModel
+        Model holding all the entries.
+    parent : QtCore.QObject, optional
+        Parent object.
+
+    """
+
+    def __init__(self, source, parent=None):
+        """Instantiate the model."""
+        super().__init__(parent)
+        self._source = source
+        self._text = ""
+        self._sort_key = None
+        # (text, entries, search keys, match ends) of each prefix of the text
+        self._states = []
+        self._rows = []
+        source.rowsInserted.connect(self._source_changed)
+        source.rowsRemoved.connect(self._source_changed)
+        source.dataChanged.connect(self._source_changed)
+        source.modelReset.connect(self._source_changed)
+        self._source_changed()
+
+    @property
+    def filter_text(self):
+        """Current search text."""
+        return self._text
+
+    @property
+    def sort_key(self):
+        """Key the rows are sorted by, or ``None`` for the source order."""
+        return self._sort_key
+
+    def set_loading(self, loading):
+        """Show the placeholder row, even without ``placeholder``, while loading.
+
+        Parameters
+        ----------
+        loading : bool
+            Whether the entries are being discovered.
+
+        """
+        self._loading = loading
+        self._sync_placeholder()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Get the number of rows."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Get the data of a row."""
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        return _entry_data(self._rows[index.row()], role)
+
+    def set_filter_text(self, text):
+        """Show only the entries matching a search text.
+
+        Parameters
+        ----------
+        text : str
+            Search text. All entries are shown if it is empty.
+
+        """
+        text = " ".join(text.lower().split())
+        if text == self._text:
+            return
+        self._text = text
+        self.beginResetModel()
+        self._rows = self._sorted(self._match())
+        self.endResetModel()
+
+    def sort_by(self, key):
+        """Sort the rows.
+
+        Parameters
+        ----------
+        key : str or None
+            One of the ``SORT_KEYS``, or ``None`` to follow the order of the
+            source. Environments are sorted by name, and by decreasing
+            Python version, number of packages or size. Entries without the
+            value are listed last.
+
+        """
+        if key is not None and key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {key!r}")
+        if key == self._sort_key:
+            return
+        self._sort_key = key
+        self.beginResetModel()
+        self._rows = self._sorted(self._match())
+        self.endResetModel()
+
+    def _sorted(self, entries):
+        """Sort entries by the sort key."""
+        if self._sort_key is None:
+            return entries
+        key, reverse = SORT_KEYS[self._sort_key]
+        return sorted(entries, key=key, reverse=reverse)
+
+    def _match(self):
+        """Get the entries matching the search text, in source order."""
+        states = self._states
+        while not self._text.startswith(states[-1][0]):
+            states.pop()
+
+        prefix, entries, keys, ends = states[-1]
+        for char in self._text[len(prefix) :]:
+            prefix += char
+            if char == " ":
+                # Next word, searched from the start of the keys
+                ends = [0] * len(keys)
+            else:
+                positions = list(map(str.find, keys, repeat(char), ends))
+                if -1 in positions:
+                    found = list(map((0).__le__, positions))
+                    entries = list(compress(entries, found))
+                    keys = list(compress(keys, found))
+                    positions = compress(positions, found)
+                ends = list(map((1).__add__, positions))
+            states.append((prefix, entries, keys, ends))
+        return list(entries)
+
+    def _source_changed(self, *args):
+        """Update the rows after the entries of the source changed."""
+        entries = self._source.entries
+        keys = [entry.search_key for entry in entries]
+        self._states = [("", entries, keys, [0] * len(keys))]
+        new_rows = self._sorted(self._match())
+
+        # Both lists are in the same order, so removing the rows that are
+        # gone leaves a subsequence of the new rows, unless updated entries
+        # moved with the sort
+        kept = {entry.path for entry in new_rows}
+        old = {entry.path for entry in self._rows}
+        if self._sort_key is not None and [
+            entry.path for entry in self._rows if entry.path in kept
+        ] != [entry.path for entry in new_rows if entry.path in old]:
+            self.beginResetModel()
+            self._rows = new_rows
+            self.endResetModel()
+            return
+
+        removed = [i for i, entry in enumerate(self._rows) if entry.path not in kept]
+        for first, last in reversed(_ranges(removed)):
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._rows[first : last + 1]
+            self.endRemoveRows()
+
+        added = [i for i, entry in enumerate(new_rows) if entry.path not in old]
+        for first, last in _ranges(added):
+            self.beginInsertRows(QtCore.QModelIndex(), first, last)
+            self._rows[first:first] = new_rows[first : last + 1]
+            self.endInsertRows()
+
+        changed = [i for i, entry in enumerate(new_rows) if entry is not self._rows[i]]
+        self._rows = new_rows
+        for first, last in _ranges(changed):
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+
+def _metadata_label(metadata):
+    """Describe the metadata of an environment in its label."""
+    if not metadata:
+        return ""
+    parts = []
+    if metadata.get("python_version"):
+        parts.append(f"Python {metadata['python_version']}")
+    if metadata.get("packages") is not None:
+        parts.append(f"{metadata['packages']} packages")
+    if metadata.get("size") is not None:
+        parts.append(format_size(metadata["size"]))
+    return f"  ({', '.join(parts)})" if parts else ""
+
+
+def _entry_data(entry, role):
+    """Get the data of an entry for a role."""
+    if role == QtCore.Qt.ItemDataRole.DisplayRole:
+        return entry.label
+    if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+        return entry.path
+    if role == QtCore.Qt.ItemDataRole.UserRole:
+        return entry.to_dict()
+    return None
+
+
+def _ranges(rows):
+    """Group sorted row numbers into ``[first, last]`` ranges."""
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return ranges
@@ -0,0 +1,250 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Queue of the jobs run in the background."""
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from ansys.tools.installer.constants import JOB_OUTPUT_LINES
+from ansys.tools.installer.jobs import FINISHED_STATES, RUNNING, get_job_scheduler
+
+#: Headers of the columns of ``JobModel``
+COLUMNS = ("Job", "State", "Progress", "Time")
+
+
+def format_duration(seconds):
+    """Format a duration, for example ``"2m 05s"``."""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+
+class JobModel(QtCore.QAbstractTableModel):
+    """Jobs of a ``JobScheduler``, updated as they run.
+
+    Parameters
+    ----------
+    scheduler : JobScheduler
+        Scheduler of the jobs.
+    parent : QtCore.QObject, optional
+        Parent object.
+
+    """
+
+    def __init__(self, scheduler, parent=None):
+        """Instantiate the model."""
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self._jobs = scheduler.jobs
+        scheduler.job_added.connect(self._add)
+        scheduler.job_changed.connect(self._update)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Get the number of rows."""
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Get the number of columns."""
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Get the header of a column."""
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+        ):
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Get the data of a cell."""
+        if not index.isValid() or index.row() >= len(self._jobs):
+            return None
+        job = self._jobs[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._text(job, index.column())
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole and job.error is not None:
+            return str(job.error)
+        return None
+
+    def job(self, row):
+        """Get the job of a row."""
+        return self._jobs[row]
+
+    def clear_finished(self):
+        """Remove the finished jobs from the scheduler and the model."""
+        self.scheduler.clear_finished()
+        self.beginResetModel()
+        self._jobs = self.scheduler.jobs
+        self.endResetModel()
+
+    def refresh_times(self):
+        """Update the time of the running jobs."""
+        for row, job in enumerate(self._jobs):
+            if job.state == RUNNING:
+                index = self.index(row, COLUMNS.index("Time"))
+                self.dataChanged.emit(index, index)
+
+    def _text(self, job, column):
+        """Get the text of a cell."""
+        if column == 0:
+            return job.name
+        if column == 1:
+            if job.attempts > 1 and job.state not in FINISHED_STATES:
+                return f"{job.state} (attempt {job.attempts})"
+            return job.state
+        if column == 2:
+            if job.state in FINISHED_STATES or job.progress is None:
+                return job.message if job.state == RUNNING else ""
+            return f"{job.progress}% {job.message}".rstrip()
+        if job.duration is None:
+            expected = self.scheduler.expected_duration(job)
+            return "" if expected is None else f"~{format_duration(expected)}"
+        text = format_duration(job.duration)
+        if job.state == RUNNING:
+            expected = self.scheduler.expected_duration(job)
+            if expected is not None:
+                text += f" / ~{format_duration(expected)}"
+        return text
+
+    def _add(self, job):
+        """Append the row of a new job."""
+        row = len(self._jobs)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._jobs.append(job)
+        self.endInsertRows()
+
+    def _update(self, job):
+        """Update the row of a job."""
+        if job not in self._jobs:
+            return
+        row = self._jobs.index(job)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+
+
+class JobQueue(QtWidgets.QWidget):
+    """Table of the jobs queued, running and finished.
+
+    The output of the commands run by the selected job is shown below the
+    table as they run.
+
+    Parameters
+    ----------
+    parent : QtWidgets.QWidget, optional
+        Parent widget.
+    scheduler : JobScheduler, optional
+        Scheduler of the jobs shown. Defaults to the shared scheduler.
+
+    """
+
+    def __init__(self, parent=None, scheduler=None):
+        """Instantiate the queue."""
+        super().__init__(parent)
+        self.scheduler = scheduler or get_job_scheduler()
+        self.model = JobModel(self.scheduler, self)
+
+        layout = QtWidgets.QVBoxLayout()
+        self.setLayout(layout)
+
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(
+            QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.table.verticalHeader().hide()
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        for column in range(1, len(COLUMNS)):
+            header.setSectionResizeMode(
+                column, QtWidgets.QHeaderView.ResizeMode.ResizeToContents
+            )
+        splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Vertical)
+        splitter.addWidget(self.table)
+
+        # Output of the selected job
+        self.output_view = QtWidgets.QPlainTextEdit()
+        self.output_view.setReadOnly(True)
+        self.output_view.setMaximumBlockCount(JOB_OUTPUT_LINES)
+        self.output_view.setFont(
+            QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont)
+        )
+        self.output_view.setPlaceholderText("Select a job to see its output.")
+        splitter.addWidget(self.output_view)
+        layout.addWidget(splitter)
+        self._output_job = None
+        self._output_count = 0
+        self.table.selectionModel().currentRowChanged.connect(
+            lambda current, previous: self.show_output(
+                self.model.job(current.row()) if current.isValid() else None
+            )
+        )
+        self.model.modelReset.connect(lambda: self.show_output(None))
+        self.scheduler.job_output.connect(self._append_output)
+
+        buttons = QtWidgets.QHBoxLayout()
+        self.cancel_button = QtWidgets.QPushButton("Cancel")
+        self.cancel_button.setToolTip("Cancel the selected jobs")
+        self.cancel_button.clicked.connect(self.cancel_selected)
+        buttons.addWidget(self.cancel_button)
+        self.clear_button = QtWidgets.QPushButton("Clear finished")
+        self.clear_button.clicked.connect(self.model.clear_finished)
+        buttons.addWidget(self.clear_button)
+        buttons.addStretch()
+        layout.addLayout(buttons)
+
+        # Running jobs show their elapsed time
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self.model.refresh_times)
+        self._timer.start()
+
+    def cancel_selected(self):
+        """Cancel the jobs selected."""
+        rows = {index.row() for index in self.table.selectionModel().selectedRows()}
+        for row in sorted(rows):
+            self.scheduler.cancel(self.model.job(row))
+
+    def show_output(self, job):
+        """Show the output of a job, followed as it runs.
+
+        Parameters
+        ----------
+        job : Job or None
+            Job whose output is shown, or ``None`` to show none.
+
+        """
+        self._output_job = job
+        if job is None:
+            self._output_count = 0
+            self.output_view.clear()
+            return
+        lines, self._output_count = job.output
+        self.output_view.setPlainText("".join(lines).rstrip("\n"))
+        self.output_view.moveCursor(QtGui.QTextCursor.MoveOperation.End)
+
+    def _append_output(self, job, count, line):
+        """Append a line of output of the job shown, unless already shown."""
+        if job is not self._output_job or count <= self._output_count:
+            return
+        self._output_count = count
+        self.output_view.appendPlainText(line.rstrip("\n"))
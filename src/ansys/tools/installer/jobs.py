@@ -0,0 +1,556 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Schedule install, environment and package operations."""
+
+import atexit
+import collections
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+
+from PySide6 import QtCore
+
+from ansys.tools.installer import CACHE_DIR
+from ansys.tools.installer.constants import (
+    JOB_HISTORY_SIZE,
+    JOB_MAX_THREADS,
+    JOB_OUTPUT_LINES,
+    JOB_RESOURCE_LIMITS,
+    JOB_RETRY_DELAY,
+)
+from ansys.tools.installer.workers import RequestDispatcher
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+# States of a job
+PENDING = "pending"
+RUNNING = "running"
+RETRYING = "retrying"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+_JOB_IDS = itertools.count(1)
+_CURRENT = threading.local()
+
+_JOB_SCHEDULER = None
+_JOB_SCHEDULER_LOCK = threading.Lock()
+
+
+class Job:
+    """Operation run in the background by a ``JobScheduler``.
+
+    Parameters
+    ----------
+    name : str
+        Name of the job, as shown in the queue.
+    fn : callable
+        Called in a worker thread with the job as only argument. Its return
+        value is the result of the job. The results of the jobs it depends
+        on are available from ``depends_on``.
+    kind : str, default: "job"
+        Kind of operation, such as ``"download"`` or ``"build"``. The
+        duration of the next jobs of a kind is estimated from the history.
+    resource : str, default: "cpu"
+        Resource used by the job. The number of jobs using a resource at
+        the same time is limited by the scheduler.
+    depends_on : sequence of Job, optional
+        Jobs which must be done before this one starts. If one of them
+        fails or is cancelled, this job is cancelled.
+    retries : int, default: 0
+        Number of times the job is run again after failing.
+    on_done : callable, optional
+        Called in the GUI thread with the job once it is finished.
+
+    Notes
+    -----
+    The output of the commands run by the job, see ``Command``, is added to
+    the job, which keeps its last ``JOB_OUTPUT_LINES`` lines.
+
+    Examples
+    --------
+    >>> download = Job("Download", lambda job: fetch(url), resource="network")
+    >>> install = Job(
+    ...     "Install",
+    ...     lambda job: install(job.depends_on[0].result),
+    ...     depends_on=[download],
+    ... )
+    >>> get_job_scheduler().submit(download, install)
+
+    """
+
+    def __init__(
+        self,
+        name,
+        fn,
+        kind="job",
+        resource="cpu",
+        depends_on=(),
+        retries=0,
+        on_done=None,
+    ):
+        """Instantiate the job."""
+        self.id = next(_JOB_IDS)
+        self.name = name
+        self.fn = fn
+        self.kind = kind
+        self.resource = resource
+        self.depends_on = list(depends_on)
+        self.retries = retries
+        self.on_done = on_done
+
+        self.state = PENDING
+        self.result = None
+        self.error = None
+        self.progress = None
+        self.message = ""
+        self.attempts = 0
+        self.submitted = None
+        self.started = None
+        self.finished = None
+
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._cancel_callbacks = []
+        self._notify = None
+        self._output = collections.deque(maxlen=JOB_OUTPUT_LINES)
+        self._output_count = 0
+        self._notify_output = None
+
+    def __repr__(self):
+        """Represent the job."""
+        return f"Job({self.id}, {self.name!r}, state={self.state!r})"
+
+    @property
+    def cancelled(self):
+        """Whether the job was asked to stop."""
+        return self._cancelled
+
+    @property
+    def duration(self):
+        """Seconds the job ran for, or ``None`` if it did not start."""
+        if self.started is None:
+            return None
+        return (self.finished or time.time()) - self.started
+
+    def set_progress(self, percent, message=None):
+        """Report the progress of the job, from any thread.
+
+        Parameters
+        ----------
+        percent : int or None
+            Percentage done, or ``None`` if unknown.
+        message : str, optional
+            Step the job is at.
+
+        """
+        self.progress = percent
+        if message is not None:
+            self.message = message
+        notify = self._notify
+        if notify is not None:
+            notify(self)
+
+    @property
+    def output(self):
+        """Last lines of output of the job, and the number of lines added.
+
+        Returns
+        -------
+        tuple
+            List of the last lines, and number of lines added since the job
+            was created.
+
+        """
+        with self._lock:
+            return list(self._output), self._output_count
+
+    def add_output(self, line):
+        """Add a line of output to the job, from any thread.
+
+        Parameters
+        ----------
+        line : str
+            Line of output, with its end of line.
+
+        """
+        with self._lock:
+            self._output.append(line)
+            self._output_count += 1
+            count = self._output_count
+        notify = self._notify_output
+        if notify is not None:
+            notify(self, count, line)
+
+    def add_cancel_callback(self, callback):
+        """Register a function stopping the work of the job when cancelled.
+
+        It is called right away if the job is already cancelled.
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._cancel_callbacks.append(callback)
+                return
+        callback()
+
+    def _cancel(self):
+        """Flag the job as cancelled and stop its work."""
+        with self._lock:
+            self._cancelled = True
+            callbacks, self._cancel_callbacks = self._cancel_callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                LOG.exception("Unable to cancel %s", self.name)
+
+
+class JobHistory:
+    """Durations of the finished jobs, persisted in a JSON file.
+
+    Parameters
+    ----------
+    path : str, optional
+        File holding the history. Defaults to ``CACHE_DIR/job_history.json``.
+    max_entries : int, default: JOB_HISTORY_SIZE
+        Number of jobs kept, the oldest being dropped first.
+
+    """
+
+    def __init__(self, path=None, max_entries=JOB_HISTORY_SIZE):
+        """Instantiate the history."""
+        self.path = path or os.path.join(CACHE_DIR, "job_history.json")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    @property
+    def entries(self):
+        """Finished jobs, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def record(self, job):
+        """Add a finished job and write the history."""
+        entry = {
+            "name": job.name,
+            "kind": job.kind,
+            "resource": job.resource,
+            "state": job.state,
+            "attempts": job.attempts,
+            "duration": round(job.duration, 3),
+            "finished": job.finished,
+        }
+        with self._lock:
+            self._entries.append(entry)
+            del self._entries[: -self.max_entries]
+            tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError as err:
+                LOG.debug("Unable to write the job history %s: %s", self.path, err)
+
+    def average_duration(self, kind):
+        """Get the average duration of the jobs of a kind done successfully.
+
+        Returns
+        -------
+        float or None
+            Seconds, or ``None`` if no job of this kind was done.
+
+        """
+        with self._lock:
+            durations = [
+                entry["duration"]
+                for entry in self._entries
+                if entry["kind"] == kind and entry["state"] == DONE
+            ]
+        if not durations:
+            return None
+        return sum(durations) / len(durations)
+
+    def _load(self):
+        """Read the history from disk."""
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(entries, list):
+            return []
+        return [entry for entry in entries if isinstance(entry, dict)]
+
+
+class JobScheduler(QtCore.QObject):
+    """Run jobs in the background, in order, honoring their dependencies.
+
+    Jobs start in the order they were submitted, once the jobs they depend
+    on are done and fewer jobs than the limit of their resource are
+    running, so that, for example, downloads run in parallel while builds
+    do not overlap. Failed jobs are retried with an exponential backoff.
+    All the methods must be called from the GUI thread, and the signals
+    are emitted in the GUI thread.
+
+    Parameters
+    ----------
+    parent : QtCore.QObject, optional
+        Parent object.
+    limits : dict, optional
+        Maximum number of jobs running at the same time for each resource.
+        Defaults to ``JOB_RESOURCE_LIMITS``. Other resources are limited
+        to one job.
+    history : JobHistory, optional
+        History the finished jobs are recorded in.
+    retry_delay : float, default: JOB_RETRY_DELAY
+        Seconds before running a failed job again, doubled after each
+        attempt.
+
+    """
+
+    #: Emitted with a job once submitted
+    job_added = QtCore.Signal(object)
+    #: Emitted with a job when its state or progress changed
+    job_changed = QtCore.Signal(object)
+    #: Emitted with a job once done, failed or cancelled
+    job_finished = QtCore.Signal(object)
+    #: Emitted with a job, the number of lines of output it has and the last
+    #: one, when a command it runs writes a line
+    job_output = QtCore.Signal(object, int, str)
+    #: Emitted from worker threads, forwarded as ``job_changed``
+    _progress = QtCore.Signal(object)
+    #: Emitted from worker threads, forwarded as ``job_output``
+    _output = QtCore.Signal(object, int, str)
+
+    def __init__(
+        self, parent=None, limits=None, history=None, retry_delay=JOB_RETRY_DELAY
+    ):
+        """Instantiate the scheduler."""
+        super().__init__(parent)
+        self.limits = dict(JOB_RESOURCE_LIMITS if limits is None else limits)
+        self.history = history
+        self.retry_delay = retry_delay
+        self._dispatcher = RequestDispatcher(self, max_threads=JOB_MAX_THREADS)
+        self._jobs = []
+        self._queue = []
+        self._running = {}  # resource -> number of jobs running
+        self._progress.connect(self.job_changed.emit)
+        self._output.connect(self.job_output.emit)
+
+    @property
+    def jobs(self):
+        """All the jobs submitted and not cleared, in order."""
+        return list(self._jobs)
+
+    @property
+    def pending(self):
+        """Number of jobs submitted and not finished."""
+        return len(self._queue)
+
+    def submit(self, *jobs):
+        """Submit jobs, scheduled together once all are added.
+
+        Parameters
+        ----------
+        *jobs : Job
+            Jobs to run. The jobs they depend on must be submitted before
+            them, or in the same call.
+
+        Returns
+        -------
+        list
+            Jobs submitted.
+
+        """
+        for job in jobs:
+            job.submitted = time.time()
+            job._notify = self._progress.emit
+            job._notify_output = self._output.emit
+            self._jobs.append(job)
+            self._queue.append(job)
+            LOG.debug("Submitted %s", job)
+            self.job_added.emit(job)
+        self._schedule()
+        return list(jobs)
+
+    def cancel(self, job):
+        """Cancel a job, and the jobs depending on it.
+
+        A running job stops once the functions registered with
+        ``Job.add_cancel_callback`` return.
+        """
+        if job.state in FINISHED_STATES:
+            return
+        LOG.debug("Cancelling %s", job)
+        job._cancel()
+        if job.state in (PENDING, RETRYING):
+            self._finish(job, CANCELLED)
+            self._schedule()
+
+    def clear_finished(self):
+        """Forget the finished jobs."""
+        self._jobs = [job for job in self._jobs if job.state not in FINISHED_STATES]
+
+    def expected_duration(self, job):
+        """Estimate how long a job runs for from the history.
+
+        Returns
+        -------
+        float or None
+            Seconds, or ``None`` if unknown.
+
+        """
+        if self.history is None:
+            return None
+        return self.history.average_duration(job.kind)
+
+    def shutdown(self):
+        """Cancel all the jobs and wait for the running ones."""
+        for job in list(self._queue):
+            job._cancel()
+        self._dispatcher.shutdown()
+
+    def _schedule(self):
+        """Start the jobs ready to run."""
+        for job in list(self._queue):
+            if job.state != PENDING:
+                continue
+            states = [dependency.state for dependency in job.depends_on]
+            if FAILED in states or CANCELLED in states:
+                job.error = "A job it depends on did not succeed"
+                self._finish(job, CANCELLED)
+                continue
+            if any(state != DONE for state in states):
+                continue
+            if self._running.get(job.resource, 0) >= self.limits.get(job.resource, 1):
+                continue
+            self._start(job)
+
+    def _start(self, job):
+        """Run a job in the thread pool."""
+        self._running[job.resource] = self._running.get(job.resource, 0) + 1
+        job.attempts += 1
+        if job.started is None:
+            job.started = time.time()
+        job.state = RUNNING
+        LOG.debug("Starting %s, attempt %d", job, job.attempts)
+        self._dispatcher.submit(
+            job.id,
+            _execute,
+            job,
+            on_result=lambda result: self._stopped(job, result, None),
+            on_error=lambda err: self._stopped(job, None, err),
+        )
+        self.job_changed.emit(job)
+
+    def _stopped(self, job, result, error):
+        """Handle the end of a run of a job."""
+        self._running[job.resource] -= 1
+        if job.cancelled:
+            self._finish(job, CANCELLED)
+        elif error is None:
+            job.result = result
+            self._finish(job, DONE)
+        elif job.attempts <= job.retries:
+            delay = self.retry_delay * 2 ** (job.attempts - 1)
+            LOG.warning("%s failed: %s. Retrying in %ss", job.name, error, delay)
+            job.error = error
+            job.state = RETRYING
+            self.job_changed.emit(job)
+            QtCore.QTimer.singleShot(int(delay * 1000), self, lambda: self._retry(job))
+        else:
+            LOG.error("%s failed: %s", job.name, error)
+            job.error = error
+            self._finish(job, FAILED)
+        self._schedule()
+
+    def _retry(self, job):
+        """Queue a job again once its retry delay is over."""
+        if job.state == RETRYING:
+            job.state = PENDING
+            self._schedule()
+
+    def _finish(self, job, state):
+        """Record the final state of a job."""
+        job.state = state
+        job.finished = time.time()
+        job._notify = None
+        job._notify_output = None
+        self._queue.remove(job)
+        LOG.debug("%s %s", job.name, state)
+        if self.history is not None and job.started is not None:
+            self.history.record(job)
+        self.job_changed.emit(job)
+        self.job_finished.emit(job)
+        if job.on_done is not None:
+            job.on_done(job)
+
+
+def get_job_scheduler():
+    """Get the job scheduler shared by the whole application.
+
+    Returns
+    -------
+    JobScheduler
+        Shared job scheduler, recording its jobs in the job history.
+
+    """
+    global _JOB_SCHEDULER
+    with _JOB_SCHEDULER_LOCK:
+        if _JOB_SCHEDULER is None:
+            _JOB_SCHEDULER = JobScheduler(history=JobHistory())
+    return _JOB_SCHEDULER
+
+
+@atexit.register
+def _shutdown_job_scheduler():
+    """Stop the running jobs before the thread pools are shut down."""
+    if _JOB_SCHEDULER is not None:
+        try:
+            _JOB_SCHEDULER.shutdown()
+        except RuntimeError:
+            # Underlying Qt object already deleted
+            pass
+
+
+def current_job():
+    """Get the job run by the current thread, if any."""
+    return getattr(_CURRENT, "job", None)
+
+
+def _execute(job):
+    """Run a job in a worker thread."""
+    _CURRENT.job = job
+    try:
+        if job.cancelled:
+            raise RuntimeError(f"{job.name} was cancelled")
+        return job.fn(job)
+    finally:
+        _CURRENT.job = None
@@ -0,0 +1,164 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Incremental extraction of members from streamed JSON documents."""
+
+import codecs
+import json
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _StreamBuffer:
+    """Text buffer filled on demand from an iterable of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size):
+        """Read chunks until at least ``size`` characters follow ``pos``."""
+        if self.pos > 1024 * 1024:
+            # Drop the consumed part of the buffer
+            self.text = self.text[self.pos :]
+            self.pos = 0
+        parts = [self.text]
+        available = len(self.text) - self.pos
+        while available < size and not self.eof:
+            try:
+                chunk = self._decoder.decode(next(self._chunks))
+            except StopIteration:
+                chunk = self._decoder.decode(b"", final=True)
+                self.eof = True
+            parts.append(chunk)
+            available += len(chunk)
+        self.text = "".join(parts)
+        return available >= size
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill(1):
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, chars):
+        """Consume the next non-whitespace character, which must be in ``chars``."""
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} at {self.pos}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next JSON value.
+
+        The value is decoded by the C accelerated ``json`` decoder. When the
+        buffer ends before the value does, the amount of buffered text is
+        doubled before retrying so that large values are decoded in
+        amortized linear time.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                end = None
+            # A value ending with the buffer might be truncated (numbers)
+            if end is not None and (end < len(self.text) or self.eof):
+                self.pos = end
+                return value
+            if self.eof:
+                raise ValueError(f"Invalid JSON value at {self.pos}")
+            self.fill(2 * (len(self.text) - self.pos) + 1)
+
+
+def iter_member_strings(chunks, member):
+    """Yield the keys or items of a top-level member of a JSON object.
+
+    Only the top-level object is walked. Values of other members are
+    decoded and discarded as a whole, and reading stops as soon as the
+    requested member is complete, so the rest of the stream is not
+    downloaded.
+
+    Parameters
+    ----------
+    chunks : iterable of bytes
+        UTF-8 encoded JSON document, for example
+        ``response.iter_content(chunk_size)``.
+    member : str
+        Name of the top-level member. If its value is an object, its keys
+        are yielded. If it is an array, its string items are yielded.
+
+    Yields
+    ------
+    str
+        Keys or string items of the member.
+
+    Raises
+    ------
+    KeyError
+        If the document has no such member.
+    ValueError
+        If the document is not a valid JSON object.
+
+    Examples
+    --------
+    >>> doc = b'{"info": {}, "releases": {"0.1": [], "0.2": []}, "urls": []}'
+    >>> list(iter_member_strings([doc], "releases"))
+    ['0.1', '0.2']
+
+    """
+    buf = _StreamBuffer(chunks)
+    buf.expect("{")
+    if buf.peek() == "}":
+        raise KeyError(member)
+
+    while True:
+        key = buf.value()
+        buf.expect(":")
+        if key != member:
+            buf.value()
+        else:
+            opening = buf.expect("{[")
+            closing = "}" if opening == "{" else "]"
+            if buf.peek() == closing:
+                return
+            while True:
+                item = buf.value()
+                if opening == "{":
+                    buf.expect(":")
+                    buf.value()
+                    yield item
+                elif isinstance(item, str):
+                    yield item
+                if buf.expect("," + closing) == closing:
+                    return
+        if buf.expect(",}") == "}":
+            raise KeyError(member)
@@ -33,7 +33,16 @@ from github import Github
 from packaging import version
 
 from ansys.tools.installer import CACHE_DIR
-from ansys.tools.installer.constants import ANSYS_FULL_LINUX_PATH, ASSETS_PATH
+from ansys.tools.installer.commands import Command, open_terminal, run_command
+from ansys.tools.installer.constants import (
+    ANSYS_FULL_LINUX_PATH,
+    ASSETS_PATH,
+    BUILD_PROFILE_DEFAULT,
+)
+from ansys.tools.installer.jobs import Job, get_job_scheduler
+from ansys.tools.installer.package_managers import get_package_manager_tracker
+from ansys.tools.installer.python_build import PythonBuild
+from ansys.tools.installer.python_version import get_python_version
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel("DEBUG")
@@ -107,29 +116,61 @@ def get_conda_url_and_filename(version):
     return url, filename
 
 
-def install_python_linux(filename):
+def install_python_linux(
+    filename,
+    profile=BUILD_PROFILE_DEFAULT,
+    progress=None,
+    build_cache=None,
+    incremental=False,
+):
     """
     Install python on linux.
 
+    Python source archives are built with ``PythonBuild``.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the Miniforge installer or of the Python source archive.
+    profile : str, default: BUILD_PROFILE_DEFAULT
+        Optimization profile used to build Python, one of ``BUILD_PROFILES``.
+    progress : callable, optional
+        Called with the stage and the percentage done while building Python.
+    build_cache : BuildCache, optional
+        Cache the build of Python is added to.
+    incremental : bool, default: False
+        Whether to reuse the work of previous builds of Python.
+
     Examples
     --------
     >>> install_python_linux("Miniforge3-23.1.0-4-Linux-x86_64.sh")
 
     """
     if "Miniforge" in filename:
-        execute_linux_command(f"bash {filename} -b -u -p {ansys_linux_path}/conda")
+        run_command(
+            ["bash", filename, "-b", "-u", "-p", f"{ansys_linux_path}/conda"],
+            check=True,
+        )
     else:
-        tar_dir, file = os.path.split(filename)
-        untar_dirname = filename.replace(".tar.xz", "")
-        cwd = os.getcwd()
-        os.chdir(tar_dir)
-        execute_linux_command(f"tar xvf {file}")
-        file = file.replace(".tar.xz", "")
-        file = file.lower()
-        execute_linux_command(
-            f"cd {untar_dirname};mkdir -p {ansys_linux_path}/{file};make clean;./configure --prefix={ansys_linux_path}/{file};make;make install;cp {ansys_linux_path}/{file}/bin/python3 {ansys_linux_path}/{file}/bin/python"
+        file = os.path.basename(filename).replace(".tar.xz", "").lower()
+        prefix = f"{ansys_linux_path}/{file}"
+        build = PythonBuild(
+            filename,
+            prefix,
+            profile=profile,
+            progress=progress,
+            incremental=incremental,
         )
-        os.chdir(cwd)
+        try:
+            build.run()
+            if build_cache is not None:
+                try:
+                    build_cache.store(prefix, file.replace("python-", ""), profile)
+                except (OSError, subprocess.CalledProcessError) as err:
+                    LOG.warning("Unable to cache the build of %s: %s", file, err)
+        finally:
+            # The build tree is not needed once installed, or if it failed
+            build.remove_tree()
     return 0
 
 
@@ -195,8 +236,8 @@ def create_venv_linux(venv_dir, py_path):
     ... )
 
     """
-    execute_linux_command(f"{py_path} -m pip install -U pip uv")
-    execute_linux_command(f"{py_path} -m uv venv {venv_dir}")
+    get_package_manager_tracker().upgrade(py_path)
+    run_command([py_path, "-m", "uv", "venv", venv_dir], check=True)
 
 
 def create_venv_linux_conda(venv_dir, py_path):
@@ -212,10 +253,10 @@ def create_venv_linux_conda(venv_dir, py_path):
 
     """
     # execute_linux_command(f"{py_path}/bin/conda create --prefix {venv_dir} python -y")
-    execute_linux_command(
-        f"{py_path}/bin/mamba -V || {py_path}/bin/conda install mamba -y"
-    )
-    execute_linux_command(f"{py_path}/bin/mamba create --prefix {venv_dir} python -y")
+    mamba = f"{py_path}/bin/mamba"
+    if not os.path.isfile(mamba):
+        run_command([f"{py_path}/bin/conda", "install", "mamba", "-y"], check=True)
+    run_command([mamba, "create", "--prefix", venv_dir, "python", "-y"], check=True)
 
 
 def delete_venv_conda(miniforge_path, parent_path):
@@ -230,21 +271,23 @@ def delete_venv_conda(miniforge_path, parent_path):
     ... )
 
     """
-    execute_linux_command(f"{miniforge_path} env remove --prefix {parent_path} --yes")
+    run_command(
+        [miniforge_path, "env", "remove", "--prefix", parent_path, "--yes"], check=True
+    )
 
 
 def run_linux_command(pypath, extra, venv=False, working_dir=None):
     """
     Run pip command on Linux terminal.
 
+    When pip and uv of the interpreter are outdated, a background job
+    upgrades them first, and the terminal opens once it is done.
+
     Examples
     --------
     >>> run_linux_command("/home/sha/.local/ansys/python-3.12.0/bin/python3", "uv pip list")
 
     """
-    # Update package manager before executing commands
-    execute_linux_command(f"{pypath} -m pip install -U pip uv")
-
     prefix = f"{pypath}"
     extra = extra.replace("timeout", "sleep")
     python_name = prefix.split("/")[-1]
@@ -262,7 +305,31 @@ def run_linux_command(pypath, extra, venv=False, working_dir=None):
     cd_cmd = (
         f"cd {working_dir!r}" if working_dir and os.path.isdir(working_dir) else "cd ~"
     )
-    execute_linux_command(f"{cd_cmd} ; {prefix}{extra}", wait=False)
+    command = f"{cd_cmd} ; {prefix}{extra}"
+
+    # Update package manager before executing commands, if outdated
+    python = os.path.join(pypath, "bin", "python") if venv else pypath
+    tracker = get_package_manager_tracker()
+    if tracker.is_current(python):
+        execute_linux_command(command, wait=False, terminal=True)
+        return
+    # Upgrade in the background, opening the terminal once done
+    upgrade = Job(
+        f"Upgrade pip and uv of {python}",
+        lambda job: tracker.upgrade(python),
+        kind="pip-upgrade",
+        resource="network",
+    )
+    get_job_scheduler().submit(
+        upgrade,
+        Job(
+            "Open a terminal",
+            lambda job: execute_linux_command(command, wait=False, terminal=True),
+            kind="terminal",
+            resource="terminal",
+            depends_on=[upgrade],
+        ),
+    )
 
 
 def run_linux_command_conda(pypath, extra, venv=False, working_dir=None):
@@ -303,7 +370,9 @@ def run_linux_command_conda(pypath, extra, venv=False, working_dir=None):
     cd_cmd = (
         f"cd {working_dir!r}" if working_dir and os.path.isdir(working_dir) else "cd ~"
     )
-    execute_linux_command(f"{cd_cmd} {venvParam} ; {conda_path}{extra} ", wait=False)
+    execute_linux_command(
+        f"{cd_cmd} {venvParam} ; {conda_path}{extra} ", wait=False, terminal=True
+    )
 
 
 def find_ansys_installed_python_linux():
@@ -338,17 +407,13 @@ def find_ansys_installed_python_linux():
             for x in os.listdir(ansys_path)
             if "python" in x and x != ".ansys_python_venvs" and x != "conda"
         ]:
-            version = files.replace("python-", "")
-            major_version = version.split(".")[0]
-            pythons[os.path.join(ansys_path, files, f"bin/python{major_version}")] = (
-                version,
-                False,
-            )
-            LOG.debug(
-                "Identified %s at %s",
-                version,
-                os.path.join(ansys_path, files, f"bin/python{major_version}"),
-            )
+            dir_version = files.replace("python-", "")
+            major_version = dir_version.split(".")[0]
+            path = os.path.join(ansys_path, files, f"bin/python{major_version}")
+            # Fall back to the version in the directory name
+            version = get_python_version(path, fallback=False) or dir_version
+            pythons[path] = (version, False)
+            LOG.debug("Identified %s at %s", version, path)
 
     except:
         # Ignore if the command fails (e.g., if the Python version is not installed)
@@ -403,20 +468,41 @@ def query_gh_latest_release_linux(token=None):
         return None, None
 
 
-def execute_linux_command(command, wait=True):
+def execute_linux_command(command, wait=True, terminal=False, timeout=None):
     """
-    Run linux command on gnome terminal.
+    Run linux command.
+
+    Commands run without any terminal, with their output logged, unless
+    ``terminal`` is set for the commands interacting with the user.
+
+    Parameters
+    ----------
+    command : str
+        Shell command to run.
+    wait : bool, default: True
+        Whether to wait for the command to finish.
+    terminal : bool, default: False
+        Whether to run the command in a new terminal window.
+    timeout : float, optional
+        Seconds after which a command run without terminal is stopped.
+
+    Returns
+    -------
+    CommandResult or None
+        Result of the command, or ``None`` if it was not waited for or
+        ran in a terminal.
 
     Examples
     --------
-    >>> execute_linux_command("ls")
+    >>> execute_linux_command("ls").returncode
+    0
 
     """
-    wait_command = ""
-    if wait:
-        wait_command = "--wait"
-    LOG.debug(f"gnome-terminal {wait_command} -- sh -c '{command}'")
-    os.system(f"gnome-terminal {wait_command} -- sh -c '{command}'")
+    if terminal:
+        open_terminal(command, wait=wait)
+        return None
+    running = Command(command, timeout=timeout).start()
+    return running.wait() if wait else None
 
 
 def get_os_version():
@@ -468,23 +554,32 @@ def update_app(filename):
     os_version = get_os_version()
     if os_version == "centos":
         execute_linux_command(
-            f"cd {updater_path};unzip -o {filename}; ./installer_CentOS.sh"
+            f"cd {updater_path};unzip -o {filename}; ./installer_CentOS.sh",
+            terminal=True,
         )
     elif os_version == "fedora":
         execute_linux_command(
-            f"cd {updater_path};unzip -o {filename}; ./installer_Fedora.sh"
+            f"cd {updater_path};unzip -o {filename}; ./installer_Fedora.sh",
+            terminal=True,
         )
     else:
-        execute_linux_command(f"cd {updater_path};unzip -o {filename}; ./installer.sh")
+        execute_linux_command(
+            f"cd {updater_path};unzip -o {filename}; ./installer.sh", terminal=True
+        )
 
 
-def check_python_asset_linux(version):
+def check_python_asset_linux(version, profile=BUILD_PROFILE_DEFAULT, build_cache=None):
     """
     Check python asset is available for linux or not.
 
+    Builds of the version found in ``build_cache`` are installed first,
+    then the assets bundled with the installer.
+
     Parameters
     ----------
         version : Version of the python
+        profile : Build profile of the cached builds to install
+        build_cache : ``BuildCache`` to look up
 
     Returns
     -------
@@ -492,6 +587,15 @@ def check_python_asset_linux(version):
         confirmation.
 
     """
+    if build_cache is not None:
+        artifact = build_cache.lookup(version, profile)
+        if artifact is not None:
+            try:
+                build_cache.install(artifact, f"{ansys_linux_path}/python-{version}")
+                return "Success"
+            except (OSError, KeyError, ValueError, subprocess.CalledProcessError) as e:
+                LOG.warning(f"Unable to install {artifact}: {e}")
+
     os_version = get_os_version()
     assets_path = os.path.join(ASSETS_PATH)
 
@@ -524,9 +628,8 @@ def install_python_linux_from_assets(file):
     try:
         file_name = file.replace(".tar.gz", "")
         file_name = file_name.lower()
-        execute_linux_command(
-            f"mkdir -p {ansys_linux_path};tar xvf {file} -C {ansys_linux_path};"
-        )
+        os.makedirs(ansys_linux_path, exist_ok=True)
+        run_command(["tar", "xf", file, "-C", ansys_linux_path], check=True)
         os.remove(file)
         return "Success"
     except Exception as e:
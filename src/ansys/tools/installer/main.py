@@ -29,20 +29,22 @@ import sys
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
-import certifi
 from packaging import version
 import requests
 
-from ansys.tools.installer import CACHE_DIR, __version__
+from ansys.tools.installer import __version__
 from ansys.tools.installer.auto_updater import query_gh_latest_release
-from ansys.tools.installer.common import protected
+from ansys.tools.installer.build_cache import get_build_cache
+from ansys.tools.installer.common import protected, threaded
 from ansys.tools.installer.configure import Configure
+from ansys.tools.installer.configure_json import get_configure_json
 from ansys.tools.installer.constants import (
     ABOUT_TEXT,
     ANSYS_FAVICON,
     ASSETS_PATH,
     CONDA_PYTHON_VERSION,
     INSTALL_TEXT,
+    JOB_DOWNLOAD_RETRIES,
     LOG,
     PRE_COMPILED_PYTHON_WARNING,
     PYTHON_VERSION_TEXT,
@@ -50,8 +52,12 @@ from ansys.tools.installer.constants import (
     VANILLA_PYTHON_VERSIONS,
 )
 from ansys.tools.installer.create_virtual_environment import CreateVenvTab
+from ansys.tools.installer.download_cache import DownloadCache
+from ansys.tools.installer.downloader import Downloader
 from ansys.tools.installer.installed_table import InstalledTab
 from ansys.tools.installer.installer import install_python
+from ansys.tools.installer.job_queue import JobQueue
+from ansys.tools.installer.jobs import CANCELLED, DONE, FAILED, Job, get_job_scheduler
 from ansys.tools.installer.linux_functions import (
     check_python_asset_linux,
     get_conda_url_and_filename,
@@ -61,6 +67,7 @@ from ansys.tools.installer.linux_functions import (
     update_app,
 )
 from ansys.tools.installer.misc import ImageWidget, PyAnsysDocsBox, enable_logging
+from ansys.tools.installer.prefetch import prefetch_pkg_metadata
 from ansys.tools.installer.progress_bar import ProgressBar
 from ansys.tools.installer.uninstall import Uninstall
 from ansys.tools.installer.windows_functions import run_ps
@@ -85,6 +92,7 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
 
         self._pbar = None
         self._err_message_box = None
+        self._download_cache = DownloadCache()
 
         # Set the global font
         font = QtGui.QFont("Open Sans", -1, QtGui.QFont.Normal, False)
@@ -179,6 +187,8 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
         self.venv_table_tab = CreateVenvTab(self)
         self.tab_widget.addTab(self.venv_table_tab, "Create virtual environments")
         self.tab_widget.addTab(self.installed_table_tab, "Manage Python environments")
+        self.job_queue_tab = JobQueue(self)
+        self.tab_widget.addTab(self.job_queue_tab, "Jobs")
 
         # Create the layout for the container
         container_layout = QtWidgets.QVBoxLayout()
@@ -286,6 +296,10 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
         self.signal_error.connect(self._show_error)
         self.signal_close.connect(self._close)
 
+        if get_configure_json().prefetch_metadata:
+            LOG.debug("Prefetching PyAnsys package metadata in the background")
+            threaded(prefetch_pkg_metadata)()
+
         if show:
             self.show()
 
@@ -540,13 +554,11 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
 
     @protected
     def download_and_install(self):
-        """Download and install.
+        """Queue the download and the installation of Python.
 
-        Called when ``self.submit_button.clicked`` is emitted.
+        Called when ``self.submit_button.clicked`` is emitted. The jobs run
+        in the background and are shown in the "Jobs" tab.
         """
-        self.setEnabled(False)
-        QtWidgets.QApplication.processEvents()
-
         try:
             if self.installation_type_select.currentData() == "vanilla":
                 selected_version = (
@@ -554,20 +566,25 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
                 )  # should be major, minor, patch
                 # OS based file download
                 if is_linux_os():
-                    try:
-                        return_text = check_python_asset_linux(selected_version)
-                        if return_text:
-                            LOG.debug("Triggering table widget update")
-                            self.installed_table_tab.update_table()
-                            self.venv_table_tab.update_table()
-                            self.setEnabled(True)
-                            return 0
-                    except Exception as e:
-                        LOG.debug(f"download_and_install {e}")
-                    url, filename = get_vanilla_url_and_filename(selected_version)
-                else:
-                    url = f"https://www.python.org/ftp/python/{selected_version}/python-{selected_version}-amd64.exe"
-                    filename = f"python-{selected_version}-amd64.exe"
+                    profile = get_configure_json().build_profile
+                    get_job_scheduler().submit(
+                        Job(
+                            f"Look up Python {selected_version} builds",
+                            lambda job: check_python_asset_linux(
+                                selected_version,
+                                profile=profile,
+                                build_cache=get_build_cache(),
+                            ),
+                            kind="lookup",
+                            resource="disk",
+                            on_done=lambda job: self._python_looked_up(
+                                job, selected_version
+                            ),
+                        )
+                    )
+                    return
+                url = f"https://www.python.org/ftp/python/{selected_version}/python-{selected_version}-amd64.exe"
+                filename = f"python-{selected_version}-amd64.exe"
                 LOG.info("Installing vanilla Python %s", selected_version)
             else:
                 # OS based file download
@@ -578,27 +595,101 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
                     url = f"https://github.com/conda-forge/miniforge/releases/download/{CONDA_PYTHON_VERSION}/Miniforge3-{CONDA_PYTHON_VERSION}-Windows-x86_64.exe"
                     filename = f"Miniforge3-{CONDA_PYTHON_VERSION}-Windows-x86_64.exe"
                 LOG.info("Installing miniconda from %s", url)
-            try:
-                self._download(url, filename, when_finished=self._run_install_python)
-            except Exception as err:
-                if os.name == "nt":
-                    LOG.warning(
-                        "Download using requests library failed... Going to fallback method for Windows."
-                    )
-                    self._windows_fallback_download(
-                        url, filename, when_finished=self._run_install_python
-                    )
-                else:
-                    raise err
+            self._queue_install_python(url, filename)
         except Exception as e:
             self.show_error(str(e))
-            self.setEnabled(True)
 
-    def _download(self, url, filename, when_finished=None, auth=None):
+    def _python_looked_up(self, job, selected_version):
+        """Install a cached build, or queue the download of the sources."""
+        if job.state == CANCELLED:
+            return
+        if job.state == DONE and job.result:
+            LOG.debug("Triggering table widget update")
+            self.installed_table_tab.update_table()
+            self.venv_table_tab.update_table()
+            return
+        if job.error is not None:
+            LOG.debug(f"download_and_install {job.error}")
+        url, filename = get_vanilla_url_and_filename(selected_version)
+        LOG.info("Installing vanilla Python %s", selected_version)
+        self._queue_install_python(url, filename)
+
+    def _queue_install_python(self, url, filename):
+        """Queue the download of an installer, then its installation.
+
+        Downloads run in parallel with other jobs, while installations,
+        which build Python from source on Linux, run one at a time.
+        """
+        download = Job(
+            f"Download {filename}",
+            lambda job: self._download_job(job, url, filename),
+            kind="download",
+            resource="network",
+            retries=JOB_DOWNLOAD_RETRIES,
+            on_done=self._job_done,
+        )
+        install = Job(
+            f"Install {filename}",
+            self._install_job,
+            kind="build" if is_linux_os() else "install",
+            resource="cpu",
+            depends_on=[download],
+            on_done=self._python_installed,
+        )
+        get_job_scheduler().submit(download, install)
+
+    def _download_job(self, job, url, filename):
+        """Download a file in a job, falling back to PowerShell on Windows."""
+        try:
+            output_path = self._download(url, filename, job=job)
+        except Exception:
+            if os.name != "nt" or job.cancelled:
+                raise
+            LOG.warning(
+                "Download using requests library failed... Going to fallback method for Windows."
+            )
+            output_path = self._windows_fallback_download(url, filename)
+        return output_path
+
+    def _install_job(self, job):
+        """Install the file downloaded by the job this one depends on."""
+        filename = job.depends_on[0].result
+        out, error_code = install_python(
+            filename, progress=lambda stage, percent: job.set_progress(percent, stage)
+        )
+        if error_code:
+            raise RuntimeError(out)
+        return out
+
+    def _job_done(self, job):
+        """Show the error of a failed job."""
+        if job.state == FAILED:
+            self._show_error(f"{job.name} failed.\n\n{job.error}")
+
+    def _python_installed(self, job):
+        """Update the tables once Python is installed."""
+        if job.state == FAILED:
+            LOG.error(f"Error while installing Python: {job.error}")
+            msg = QtWidgets.QMessageBox()
+            msg.warning(
+                self,
+                "Error while installing Python!",
+                f"Error message:\n\n {job.error}",
+            )
+        if job.state != CANCELLED:
+            LOG.debug("Triggering table widget update")
+            self.installed_table_tab.update_table()
+            self.venv_table_tab.update_table()
+
+    def _download(self, url, filename, when_finished=None, auth=None, job=None):
         """Download a file with a progress bar.
 
-        Checks cache first. If cached file exists and is the same size
-        as the file to be downloaded, uses cached file.
+        Checks the download cache first. Cached files are used without
+        any network access, unless they are due for revalidation, in which
+        case a single conditional request confirms they are still current.
+        Otherwise, the file is fetched in parallel byte ranges when the
+        server supports them, resuming any partial download left in the
+        cache, and then added to the cache.
 
         ``when_finished`` must accept one parameter, the path of the file downloaded.
 
@@ -619,73 +710,94 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
             downloading release artifacts from private/internal
             repositories.
 
+        job : Job, optional
+            Job running the download. Its progress is reported instead of
+            showing a progress bar, cancelling it stops the download, and
+            failed downloads raise an exception instead of showing an error.
+
+        Returns
+        -------
+        str or None
+            Path of the file downloaded, or ``None`` if the download failed.
+
         """
         request_headers = {"Accept": "application/octet-stream"}
         if auth:
             request_headers["Authorization"] = f"token {auth}"
 
-        # initiate the download
-        session = requests.Session()
-        response = session.get(
-            url,
-            allow_redirects=True,
-            stream=True,
-            headers=request_headers,
-            verify=certifi.where(),
-        )
-        tsize = int(response.headers.get("Content-Length", 0))
-
-        if response.status_code != 200:
-            self.show_error(
-                f"Unable to download {filename}.\n\nReceived {response.status_code} from {url}"
-            )
-            self.pbar_close()
-            return
+        downloader = Downloader()
+        if job is not None:
+            job.add_cancel_callback(downloader.cancel)
+        cached = self._download_cache.lookup(url)
+        if cached is not None and self._download_cache.is_stale(cached):
+            if downloader.revalidate(
+                url,
+                etag=cached["etag"],
+                last_modified=cached["last_modified"],
+                size=cached["size"],
+                headers=request_headers,
+            ):
+                self._download_cache.mark_validated(url)
+            else:
+                LOG.debug("%s changed on the server. Downloading again.", url)
+                self._download_cache.invalidate(url)
+                cached = None
 
-        output_path = os.path.join(CACHE_DIR, filename)
-        if os.path.isfile(output_path) and tsize:
-            LOG.debug("%s exists at in %s", filename, CACHE_DIR)
-            file_sz = os.path.getsize(output_path)
-            if tsize == file_sz:
-                LOG.debug("Sizes match. Using cached file from %s", output_path)
-                if when_finished is not None:
-                    when_finished(output_path)
-                return
+        if cached is not None:
+            LOG.debug("Using cached file from %s", cached["path"])
+            if when_finished is not None:
+                when_finished(cached["path"])
+            return cached["path"]
 
-            LOG.debug("Sizes do not match. Ignoring cached file.")
+        staging_path = self._download_cache.staging_path(filename)
 
-        # size and current_bytes, current bar position
-        total = [None, 0, 0]
+        # current bar position
+        current = [None]
 
-        def update(b=1, bsize=1, tsize=None):
+        def update(downloaded, tsize):
             """Update download progress."""
+            if current[0] is None:
+                if job is None:
+                    self.pbar_open(100, f"Downloading {filename}")
+                current[0] = 0
             if tsize:
-                total[0] = tsize
-            total[1] += bsize
-            if total[0] is not None:
-                val = floor(100 * total[1] / total[0])
-                if total[2] != val:
-                    self.pbar_set_value(val)
+                val = floor(100 * downloaded / tsize)
+                if current[0] != val:
+                    current[0] = val
+                    if job is None:
+                        self.pbar_set_value(val)
+                    else:
+                        job.set_progress(val)
 
-        self.pbar_open(100, f"Downloading {filename}")
-
-        chunk_size = 200 * 1024  # 200kb
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size):
-                f.write(chunk)
-                update(0, chunk_size, tsize)
-                tsize = None
+        try:
+            info = downloader.download(
+                url, staging_path, headers=request_headers, progress=update
+            )
+        except requests.exceptions.HTTPError as err:
+            status = err.response.status_code if err.response is not None else ""
+            message = f"Unable to download {filename}.\n\nReceived {status} from {url}"
+            if job is not None:
+                raise RuntimeError(message) from err
+            self.show_error(message)
+            return
+        finally:
+            if job is None:
+                self.pbar_close()
 
-        self.pbar_close()
+        output_path = self._download_cache.add(
+            url, staging_path, etag=info["etag"], last_modified=info["last_modified"]
+        )
 
         if when_finished is not None:
             when_finished(output_path)
+        return output_path
 
     def _windows_fallback_download(self, url, filename, when_finished=None):
         """Download a file. Fallback method for Windows.
 
         Deletes any pre-existing output file with the same name. Then, performs
-        the download using PowerShell and the Invoke-RestMethod command.
+        the download using PowerShell and the Invoke-RestMethod command, and
+        adds the file to the download cache.
 
         ``when_finished`` must accept one parameter, the path of the file downloaded.
 
@@ -698,9 +810,20 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
         when_finished : callable, optional
             Function to call when complete. Function should accept one
             parameter: the full path of the file downloaded.
+
+        Returns
+        -------
+        str
+            Path of the file downloaded.
+
+        Raises
+        ------
+        RuntimeError
+            If the download failed.
+
         """
-        # Delete pre-existing cache. This is fail-safe mode
-        output_path = os.path.join(CACHE_DIR, filename)
+        # Delete pre-existing download. This is fail-safe mode
+        output_path = self._download_cache.staging_path(filename)
         if os.path.isfile(output_path):
             os.remove(output_path)
 
@@ -710,40 +833,14 @@ class AnsysPythonInstaller(QtWidgets.QMainWindow):
         )
 
         if error_code:
-            LOG.error(
+            raise RuntimeError(
                 f"Error while downloading Python on Windows fail-safe mode: {out}"
             )
-            msg = QtWidgets.QMessageBox()
-            msg.warning(
-                self,
-                "Error while downloading Python on Windows fail-safe mode!",
-                f"Error message:\n\n {out}",
-            )
-            self.setEnabled(True)
-            return
+        output_path = self._download_cache.add(url, output_path)
 
         if when_finished is not None:
             when_finished(output_path)
-
-    def _run_install_python(self, filename):
-        """Execute the installation process."""
-        LOG.debug("Executing run_install_python")
-        out, error_code = install_python(filename)
-
-        if error_code:
-            LOG.error(f"Error while installing Python: {out}")
-            msg = QtWidgets.QMessageBox()
-            msg.warning(
-                self,
-                "Error while installing Python!",
-                f"Error message:\n\n {out}",
-            )
-
-        LOG.debug("Triggering table widget update")
-        self.installed_table_tab.update_table()
-        self.venv_table_tab.update_table()
-
-        self.setEnabled(True)
+        return output_path
 
 
 def __restore_windows_dll_load():
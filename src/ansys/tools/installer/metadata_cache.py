@@ -0,0 +1,232 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Persistent cache for package index metadata."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import requests
+
+from ansys.tools.installer import CACHE_DIR
+from ansys.tools.installer.constants import (
+    METADATA_CACHE_STALE_TTL,
+    METADATA_CACHE_TTL,
+)
+from ansys.tools.installer.http_client import get_http_client
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+
+class MetadataCache:
+    """Disk-backed cache of parsed HTTP metadata documents.
+
+    Each URL is stored as a JSON record holding the parsed data, the
+    ``ETag`` and ``Last-Modified`` validators and the time it was fetched.
+    Records younger than ``ttl`` are served directly. Records older than
+    ``ttl`` but within ``stale_ttl`` more seconds are served immediately
+    while a background conditional request refreshes them
+    (stale-while-revalidate). Older records are revalidated before being
+    returned, and are still used if the server cannot be reached.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory holding the records. Defaults to ``CACHE_DIR/metadata``.
+    ttl : float, optional
+        Number of seconds a record is considered fresh.
+    stale_ttl : float, optional
+        Number of seconds after ``ttl`` during which a stale record is
+        served while it is refreshed in the background.
+    session : requests.Session, optional
+        Session used for all requests. Defaults to the session of the
+        shared HTTP client.
+    timeout : float, default: 30
+        Connect and read timeout in seconds of each request.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir=None,
+        ttl=METADATA_CACHE_TTL,
+        stale_ttl=METADATA_CACHE_STALE_TTL,
+        session=None,
+        timeout=30,
+    ):
+        """Instantiate the cache."""
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, "metadata")
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = timeout
+        if session is None:
+            session = get_http_client().session
+        self._session = session
+        self._records = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, url, parse, headers=None, on_refresh=None):
+        """Get the parsed content of a URL.
+
+        Parameters
+        ----------
+        url : str
+            URL of the document.
+        parse : callable
+            Function receiving the streamed ``requests.Response`` and
+            returning JSON serializable data to cache.
+        headers : dict, optional
+            Extra request headers.
+        on_refresh : callable, optional
+            Function called with the new data when a stale record is
+            refreshed in the background and its content changed. It is
+            called from the background thread.
+
+        Returns
+        -------
+        object
+            Parsed data, as returned by ``parse``.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If the document is not cached and cannot be fetched.
+
+        """
+        record = self._read(url)
+        if record is not None:
+            age = time.time() - record["fetched"]
+            if age < self.ttl:
+                return record["data"]
+            if age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(url, parse, headers, on_refresh)
+                return record["data"]
+
+        try:
+            return self._fetch(url, parse, headers, record)["data"]
+        except requests.exceptions.RequestException as err:
+            if record is None:
+                raise
+            LOG.warning("Unable to refresh %s: %s. Using cached data.", url, err)
+            return record["data"]
+
+    def invalidate(self, url):
+        """Remove the record of a URL."""
+        with self._lock:
+            self._records.pop(url, None)
+        try:
+            os.remove(self._record_path(url))
+        except FileNotFoundError:
+            pass
+
+    def _fetch(self, url, parse, headers, record):
+        """Fetch a URL, revalidating the existing record if any."""
+        request_headers = dict(headers or {})
+        if record is not None:
+            if record.get("etag"):
+                request_headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                request_headers["If-Modified-Since"] = record["last_modified"]
+
+        response = self._session.get(
+            url, headers=request_headers, stream=True, timeout=self.timeout
+        )
+        with response:
+            if response.status_code == 304 and record is not None:
+                LOG.debug("%s not modified", url)
+                record = {**record, "fetched": time.time()}
+            else:
+                response.raise_for_status()
+                record = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched": time.time(),
+                    "data": parse(response),
+                }
+
+        self._write(url, record)
+        return record
+
+    def _refresh_in_background(self, url, parse, headers, on_refresh):
+        """Revalidate a stale record in a background thread."""
+        with self._lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+
+        def refresh():
+            try:
+                old = self._read(url)
+                new = self._fetch(url, parse, headers, old)
+                if on_refresh is not None and (
+                    old is None or new["data"] != old["data"]
+                ):
+                    on_refresh(new["data"])
+            except Exception as err:
+                LOG.debug("Background refresh of %s failed: %s", url, err)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(url)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _record_path(self, url):
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _read(self, url):
+        """Read a record from memory, or from disk on first access."""
+        with self._lock:
+            if url in self._records:
+                return self._records[url]
+
+        try:
+            with open(self._record_path(url)) as f:
+                record = json.load(f)
+            if record.get("url") != url or "data" not in record:
+                raise ValueError("Invalid metadata record")
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            self._records[url] = record
+        return record
+
+    def _write(self, url, record):
+        with self._lock:
+            self._records[url] = record
+        path = self._record_path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(record, f)
+            os.replace(tmp_path, path)
+        except OSError as err:
+            LOG.debug("Unable to write metadata record %s: %s", path, err)
@@ -0,0 +1,215 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Track when pip and uv were last upgraded for each interpreter."""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from ansys.tools.installer import CACHE_DIR
+from ansys.tools.installer.commands import run_command
+from ansys.tools.installer.constants import (
+    PACKAGE_MANAGERS_DEFAULT_MAX_AGE,
+    PACKAGE_MANAGERS_MAX_AGE,
+    PIP_UPGRADE_TIMEOUT,
+)
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+_TRACKER = None
+_TRACKER_LOCK = threading.Lock()
+
+
+class PackageManagerTracker:
+    """Time of the last upgrade of pip and uv of each interpreter.
+
+    Upgrades are persisted in a JSON file, by real path of the interpreter,
+    along with the modification time of the interpreter so that a
+    reinstalled interpreter is upgraded again.
+
+    Parameters
+    ----------
+    path : str, optional
+        File holding the upgrades. Defaults to
+        ``CACHE_DIR/package_managers.json``.
+    max_age : float, default: PACKAGE_MANAGERS_DEFAULT_MAX_AGE hours
+        Seconds after which pip and uv are upgraded again. With ``0``, they
+        are upgraded every time.
+
+    Examples
+    --------
+    >>> tracker = PackageManagerTracker()
+    >>> tracker.upgrade("/home/sha/.local/ansys/python-3.12.0/bin/python3")
+    True
+
+    """
+
+    def __init__(self, path=None, max_age=PACKAGE_MANAGERS_DEFAULT_MAX_AGE * 3600):
+        """Instantiate the tracker."""
+        self.path = path or os.path.join(CACHE_DIR, "package_managers.json")
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # Interpreters being upgraded, to upgrade each one once at a time
+        self._upgrading = {}
+        self._upgrades = self._load()
+
+    def is_current(self, python):
+        """Whether pip and uv of an interpreter were upgraded recently enough.
+
+        Parameters
+        ----------
+        python : str
+            Path of the Python executable.
+
+        """
+        key = os.path.realpath(python)
+        with self._lock:
+            upgrade = self._upgrades.get(key)
+        if upgrade is None or time.time() - upgrade["upgraded"] >= self.max_age:
+            return False
+        return upgrade["mtime"] == _mtime(key)
+
+    def mark_upgraded(self, python):
+        """Record that pip and uv of an interpreter were just upgraded."""
+        key = os.path.realpath(python)
+        with self._lock:
+            self._upgrades[key] = {"upgraded": time.time(), "mtime": _mtime(key)}
+            self._save()
+
+    def forget(self, python):
+        """Upgrade pip and uv of an interpreter the next time they are needed."""
+        with self._lock:
+            if self._upgrades.pop(os.path.realpath(python), None) is not None:
+                self._save()
+
+    def upgrade(self, python, force=False):
+        """Upgrade pip and uv of an interpreter, unless they are current.
+
+        Failures are logged, and the installed versions are kept.
+
+        Parameters
+        ----------
+        python : str
+            Path of the Python executable.
+        force : bool, default: False
+            Upgrade even if they are current.
+
+        Returns
+        -------
+        bool
+            Whether pip and uv are current.
+
+        """
+        key = os.path.realpath(python)
+        with self._lock:
+            lock = self._upgrading.setdefault(key, threading.Lock())
+        # Concurrent callers wait for the upgrade instead of running it again
+        with lock:
+            if not force and self.is_current(python):
+                LOG.debug("pip and uv of %s are current", python)
+                return True
+            try:
+                result = run_command(
+                    [python, "-m", "pip", "install", "-U", "pip", "uv"],
+                    timeout=PIP_UPGRADE_TIMEOUT,
+                )
+            except OSError as err:
+                LOG.warning("Unable to upgrade pip and uv of %s: %s", python, err)
+                return False
+            if result.returncode:
+                LOG.warning(
+                    "Unable to upgrade pip and uv of %s:\n%s", python, result.output
+                )
+                return False
+            self.mark_upgraded(python)
+            return True
+
+    def _load(self):
+        """Read the upgrades from disk."""
+        try:
+            with open(self.path) as f:
+                upgrades = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(upgrades, dict):
+            return {}
+        return {
+            key: upgrade
+            for key, upgrade in upgrades.items()
+            if isinstance(upgrade, dict) and {"upgraded", "mtime"} <= upgrade.keys()
+        }
+
+    def _save(self):
+        """Write the upgrades, with the caller holding the lock."""
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(self._upgrades, f)
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            LOG.debug("Unable to write %s: %s", self.path, err)
+
+
+def get_package_manager_tracker():
+    """Get the package manager tracker shared by the whole application.
+
+    The maximum age of the upgrades follows the configuration.
+
+    Returns
+    -------
+    PackageManagerTracker
+        Shared package manager tracker.
+
+    """
+    global _TRACKER
+    with _TRACKER_LOCK:
+        if _TRACKER is None:
+            # Imported here, as the configuration imports linux_functions
+            from ansys.tools.installer.configure_json import get_configure_json
+
+            config = get_configure_json()
+            _TRACKER = PackageManagerTracker(
+                max_age=config.package_managers_max_age * 3600
+            )
+            config.signals.changed.connect(_on_setting_changed)
+    return _TRACKER
+
+
+def _on_setting_changed(key):
+    """Apply a new maximum age to the shared tracker."""
+    if key == PACKAGE_MANAGERS_MAX_AGE and _TRACKER is not None:
+        from ansys.tools.installer.configure_json import get_configure_json
+
+        _TRACKER.max_age = get_configure_json().package_managers_max_age * 3600
+
+
+def _mtime(path):
+    """Get the modification time of a file, or ``None``."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
@@ -0,0 +1,96 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Background prefetch of PyAnsys package metadata."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import time
+
+from ansys.tools.installer.common import get_pkg_versions, get_targets
+from ansys.tools.installer.constants import PREFETCH_MAX_WORKERS, PYANSYS_LIBS
+from ansys.tools.installer.http_client import get_http_client
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+
+def _resolve(pkg_name):
+    """Resolve the versions of a package and the targets of its latest version."""
+    tstart = time.perf_counter()
+    versions = get_pkg_versions(pkg_name)
+    if versions and versions[0]:
+        get_targets(pkg_name, versions[0])
+    return time.perf_counter() - tstart
+
+
+def prefetch_pkg_metadata(packages=None, max_workers=PREFETCH_MAX_WORKERS):
+    """Fill the metadata cache for a batch of packages concurrently.
+
+    The versions of each package, and the targets of its latest version,
+    are resolved by a bounded pool of threads. All requests go through the
+    shared metadata cache and the pooled HTTP client, so later lookups from
+    the GUI are answered from the cache.
+
+    Parameters
+    ----------
+    packages : list of str, optional
+        Names of the packages on PyPI. Defaults to every entry of
+        ``PYANSYS_LIBS``.
+    max_workers : int, optional
+        Maximum number of packages resolved at the same time.
+
+    Returns
+    -------
+    dict
+        Timings in seconds, with the keys ``"total"`` for the whole batch
+        and ``"packages"`` mapping each package name to its own duration.
+
+    Examples
+    --------
+    >>> timings = prefetch_pkg_metadata(["pyansys", "ansys-mapdl-core"])
+    >>> timings["total"]
+    0.84
+
+    """
+    packages = list(PYANSYS_LIBS.values() if packages is None else packages)
+    timings = {}
+
+    tstart = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_resolve, pkg): pkg for pkg in packages}
+        for future in as_completed(futures):
+            pkg_name = futures[future]
+            try:
+                timings[pkg_name] = future.result()
+            except Exception as err:
+                LOG.warning(f"Unable to prefetch metadata of {pkg_name}: {err}")
+    total = time.perf_counter() - tstart
+
+    LOG.info(
+        "Prefetched metadata of %d packages in %.2f s (slowest: %.2f s)",
+        len(timings),
+        total,
+        max(timings.values(), default=0),
+    )
+    get_http_client().log_stats()
+    return {"total": total, "packages": timings}
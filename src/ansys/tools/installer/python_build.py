@@ -0,0 +1,422 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Build Python from source on Linux."""
+
+import logging
+import os
+import re
+import shutil
+import signal
+import subprocess
+import threading
+import time
+
+from ansys.tools.installer import CACHE_DIR
+from ansys.tools.installer.commands import Command, run_command
+from ansys.tools.installer.constants import (
+    BUILD_LOG_TAIL,
+    BUILD_PROFILE_DEFAULT,
+    BUILD_PROFILES,
+    BUILD_STAGE_WEIGHTS,
+)
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+_ARCHIVE_SUFFIX = re.compile(r"\.(tar\.\w+|tgz)$")
+_MINOR_VERSION = re.compile(r"(\d+\.\d+)\.\d+")
+
+# Output lines counted to follow the progress of ``configure`` and ``make``
+_CHECK_LINE = re.compile(r"^checking ")
+_COMPILE_LINE = re.compile(r"\s-c\s(?:.*\s)?\S+\.c(?:\s|$)")
+
+# Directories holding the C sources compiled by ``make``
+_SOURCE_DIRS = ("Modules", "Objects", "Parser", "Programs", "Python")
+
+
+def build_jobs():
+    """Get the number of parallel jobs to build with.
+
+    Returns
+    -------
+    int
+        Number of processor cores this process can run on.
+
+    Examples
+    --------
+    >>> build_jobs()
+    8
+
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def c_compiler():
+    """Get the C compiler command Python is built with.
+
+    Returns
+    -------
+    str
+        Value of the ``CC`` environment variable, or ``"cc"``.
+
+    Examples
+    --------
+    >>> c_compiler()
+    'cc'
+
+    """
+    return os.environ.get("CC") or "cc"
+
+
+class PythonBuild:
+    """Build and install Python from a source archive.
+
+    The archive is extracted in a build directory, then ``configure``,
+    ``make`` and ``make install`` run without any terminal, with ``make``
+    using one job per processor core. Their output is written to a log file
+    in the build directory, and parsed to report the progress of the build.
+    Call ``remove_tree`` once the build is installed to free its space.
+    Python is compiled with ``c_compiler()``, the compiler of the cache key
+    of the build artifacts.
+
+    Incremental builds reuse the work of the previous ones: the compiler is
+    wrapped with ``ccache`` when it is installed, keeping the objects in
+    ``cache_dir/ccache``, and ``configure`` reads and writes a cache file
+    shared by all the versions of a minor series in ``cache_dir/configure``.
+    Rebuilding a patch release then only compiles the files that changed.
+
+    Parameters
+    ----------
+    archive : str
+        Path of the ``Python-X.Y.Z.tar.xz`` source archive.
+    prefix : str
+        Directory to install Python in.
+    profile : str, default: BUILD_PROFILE_DEFAULT
+        Optimization profile, one of ``BUILD_PROFILES``.
+    jobs : int, optional
+        Number of parallel ``make`` jobs. Defaults to ``build_jobs()``.
+    progress : callable, optional
+        Called with the name of the current stage and the percentage of
+        the whole build done, each time this percentage changes.
+    incremental : bool, default: False
+        Whether to reuse the objects and ``configure`` results of previous
+        builds.
+    cache_dir : str, optional
+        Directory holding the caches of incremental builds. Defaults to
+        ``CACHE_DIR``.
+    build_dir : str, optional
+        Directory the archive is extracted and built in. Defaults to
+        ``CACHE_DIR/build``.
+
+    Examples
+    --------
+    >>> build = PythonBuild(
+    ...     "/tmp/Python-3.12.0.tar.xz",
+    ...     "/home/user/.local/ansys/python-3.12.0",
+    ...     profile="optimized",
+    ... )
+    >>> build.run()
+    {'extract': 1.02, 'configure': 14.7, 'build': 95.31, 'install': 12.4, 'total': 123.43}
+
+    """
+
+    def __init__(
+        self,
+        archive,
+        prefix,
+        profile=BUILD_PROFILE_DEFAULT,
+        jobs=None,
+        progress=None,
+        incremental=False,
+        cache_dir=None,
+        build_dir=None,
+    ):
+        """Instantiate the build."""
+        if profile not in BUILD_PROFILES:
+            raise ValueError(
+                f"Unknown build profile {profile!r}. "
+                f"Use one of {', '.join(BUILD_PROFILES)}."
+            )
+        self.archive = archive
+        self.prefix = prefix
+        self.profile = profile
+        self.jobs = jobs or build_jobs()
+        self.progress = progress
+        self.build_dir = build_dir or os.path.join(CACHE_DIR, "build")
+        self.source_dir = os.path.join(
+            self.build_dir, _ARCHIVE_SUFFIX.sub("", os.path.basename(archive))
+        )
+        self.log_path = f"{self.source_dir}-build.log"
+        self.incremental = incremental
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.timings = {}
+        # ``ccache`` hits and misses of the build, and their ratio
+        self.cache_stats = None
+
+        self._env = None
+        self._ccache = False
+        self._configure_cache = None
+        self._percent = None
+        self._command = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def run(self):
+        """Run all the stages of the build.
+
+        Returns
+        -------
+        dict
+            Seconds taken by each stage, and by the whole build as ``total``.
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If a stage fails. Its ``output`` holds the last lines of output.
+
+        """
+        start = time.perf_counter()
+        # The compiler of the cache key of the build, see ``compiler_id``
+        self._env = {**os.environ, "CC": c_compiler()}
+        if self.incremental:
+            self._prepare_caches()
+        # Each stage appends its output
+        os.makedirs(self.build_dir, exist_ok=True)
+        open(self.log_path, "w").close()
+        self._run(
+            "extract",
+            ["tar", "xf", os.path.abspath(self.archive)],
+            cwd=self.build_dir,
+        )
+        if os.path.isfile(os.path.join(self.source_dir, "Makefile")):
+            # Only a tree built before has anything to clean
+            self._run("clean", ["make", "clean"])
+        self._configure()
+        ccache_before = self._ccache_stats()
+        self._run(
+            "build", ["make", f"-j{self.jobs}"], _COMPILE_LINE, self._count_sources()
+        )
+        self._report_cache_stats(ccache_before, self._ccache_stats())
+        self._run("install", ["make", "install"])
+
+        bin_dir = os.path.join(self.prefix, "bin")
+        shutil.copy2(os.path.join(bin_dir, "python3"), os.path.join(bin_dir, "python"))
+
+        self.timings["total"] = round(time.perf_counter() - start, 2)
+        LOG.info(
+            "Built %s with the %s profile and %d jobs: %s",
+            os.path.basename(self.source_dir),
+            self.profile,
+            self.jobs,
+            ", ".join(f"{stage} {seconds}s" for stage, seconds in self.timings.items()),
+        )
+        return self.timings
+
+    def remove_tree(self):
+        """Remove the extracted sources and build tree, keeping the log."""
+        shutil.rmtree(self.source_dir, ignore_errors=True)
+
+    def cancel(self):
+        """Stop the build, from any thread.
+
+        ``run`` then raises ``subprocess.CalledProcessError``.
+        """
+        with self._lock:
+            self._cancelled = True
+            command = self._command
+        if command is not None:
+            command.cancel()
+
+    def _prepare_caches(self):
+        """Set up the compiler wrapper and configure cache of incremental builds."""
+        minor = _MINOR_VERSION.search(os.path.basename(self.source_dir))
+        if minor is not None:
+            configure_dir = os.path.join(self.cache_dir, "configure")
+            os.makedirs(configure_dir, exist_ok=True)
+            self._configure_cache = os.path.join(
+                configure_dir, f"{minor.group(1)}-{self.profile}.cache"
+            )
+
+        ccache = shutil.which("ccache")
+        if ccache is None:
+            LOG.warning("ccache is not installed, all the files are compiled")
+            return
+        ccache_dir = os.path.join(self.cache_dir, "ccache")
+        os.makedirs(ccache_dir, exist_ok=True)
+        self._ccache = True
+        self._env.update(
+            {
+                "CC": f"{ccache} {self._env['CC']}",
+                "CCACHE_DIR": ccache_dir,
+                # Hit files compiled in the tree of another version
+                "CCACHE_BASEDIR": os.path.dirname(os.path.abspath(self.source_dir)),
+                "CCACHE_NOHASHDIR": "1",
+            }
+        )
+
+    def _configure(self):
+        """Run ``configure``, with a fresh cache if the one kept fails."""
+        args = ["./configure", f"--prefix={self.prefix}"]
+        args += BUILD_PROFILES[self.profile]
+        if self._configure_cache is None:
+            self._run("configure", args, _CHECK_LINE, self._count_checks())
+            return
+        try:
+            self._run(
+                "configure",
+                args + [f"--cache-file={self._configure_cache}"],
+                _CHECK_LINE,
+                self._count_checks(),
+            )
+        except subprocess.CalledProcessError:
+            if not os.path.isfile(self._configure_cache):
+                raise
+            # Results cached by a previous build may not apply anymore
+            LOG.warning(
+                "configure failed with %s, retrying with a fresh cache",
+                self._configure_cache,
+            )
+            os.remove(self._configure_cache)
+            self._run(
+                "configure",
+                args + [f"--cache-file={self._configure_cache}"],
+                _CHECK_LINE,
+                self._count_checks(),
+            )
+
+    def _ccache_stats(self):
+        """Get the hits and misses counted by ``ccache``, if it is used."""
+        if not self._ccache:
+            return None
+        try:
+            output = run_command(
+                ["ccache", "--print-stats"], check=True, env=self._env
+            ).output
+        except (OSError, subprocess.CalledProcessError) as err:
+            LOG.debug("Unable to read the ccache statistics: %s", err)
+            return None
+        counters = dict(
+            line.split("\t", 1) for line in output.splitlines() if "\t" in line
+        )
+        try:
+            hits = int(counters.get("direct_cache_hit", 0)) + int(
+                counters.get("preprocessed_cache_hit", 0)
+            )
+            return hits, int(counters.get("cache_miss", 0))
+        except ValueError:
+            return None
+
+    def _report_cache_stats(self, before, after):
+        """Record the hit rate of ``ccache`` during the build."""
+        if before is None or after is None:
+            return
+        hits, misses = after[0] - before[0], after[1] - before[1]
+        total = hits + misses
+        self.cache_stats = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+        }
+        message = (
+            f"ccache hit rate {self.cache_stats['hit_rate']:.1%} "
+            f"({hits} hits, {misses} misses)"
+        )
+        with open(self.log_path, "a") as log:
+            log.write(f"{message}\n")
+        LOG.info(message)
+
+    def _run(self, stage, args, pattern=None, total=1, cwd=None):
+        """Run one stage, counting the lines of output matching ``pattern``."""
+        matched = 0
+
+        def count(line):
+            """Follow the progress of the stage."""
+            nonlocal matched
+            if pattern.search(line):
+                matched += 1
+                self._report(stage, matched / total)
+
+        command = Command(
+            args,
+            cwd=cwd or self.source_dir,
+            env=self._env,
+            on_output=None if pattern is None else count,
+            log_path=self.log_path,
+            tail=BUILD_LOG_TAIL,
+        )
+        with self._lock:
+            if self._cancelled:
+                raise subprocess.CalledProcessError(
+                    -signal.SIGTERM, args, output="Build cancelled"
+                )
+            self._command = command
+            LOG.debug("Build stage %s", stage)
+            self._report(stage, 0)
+            command.start()
+        result = command.wait()
+        with self._lock:
+            self._command = None
+        self.timings[stage] = round(self.timings.get(stage, 0) + result.duration, 2)
+
+        if result.returncode:
+            LOG.error("Build stage %s failed, see %s", stage, self.log_path)
+        result.check_returncode()
+        self._report(stage, 1)
+
+    def _report(self, stage, fraction):
+        """Report the overall progress once a stage is ``fraction`` done."""
+        if self.progress is None or stage not in BUILD_STAGE_WEIGHTS:
+            return
+        percent = 0
+        for name, weight in BUILD_STAGE_WEIGHTS.items():
+            if name == stage:
+                percent += int(weight * min(fraction, 1))
+                break
+            percent += weight
+        if self._percent is None or percent > self._percent:
+            self._percent = percent
+            self.progress(stage, percent)
+
+    def _count_checks(self):
+        """Estimate the number of checks run by ``configure``."""
+        try:
+            with open(
+                os.path.join(self.source_dir, "configure"), errors="replace"
+            ) as f:
+                return max(f.read().count('"checking '), 1)
+        except OSError:
+            return 1
+
+    def _count_sources(self):
+        """Estimate the number of C files compiled by ``make``."""
+        count = 0
+        for name in _SOURCE_DIRS:
+            for _, _, files in os.walk(os.path.join(self.source_dir, name)):
+                count += sum(filename.endswith(".c") for filename in files)
+        if "--enable-optimizations" in BUILD_PROFILES[self.profile]:
+            # Everything is compiled twice, with and without instrumentation
+            count *= 2
+        return max(count, 1)
@@ -0,0 +1,215 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Read the version of a Python interpreter from its installation files."""
+
+import logging
+import os
+import re
+import subprocess
+
+from ansys.tools.installer.constants import PYTHON_PROBE_TIMEOUT
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+_VERSION = re.compile(r"^(\d+\.\d+(?:\.\d+)?)")
+_CONDA_META_PYTHON = re.compile(r"^python-(\d+\.\d+\.\d+)-.*\.json$")
+_PY_VERSION = re.compile(r'^#define\s+PY_VERSION\s+"([^"]+)"', re.MULTILINE)
+_PYTHON_DIR = re.compile(r"^python(\d+\.\d+)[mt]?$")
+_EXECUTABLE_VERSION = re.compile(r"^python(\d+\.\d+)")
+
+
+def get_python_version(executable, fallback=True):
+    """Get the version of a Python interpreter without running it.
+
+    The following files are read, in order:
+
+    * ``pyvenv.cfg`` of a virtual environment.
+    * ``conda-meta/python-X.Y.Z-*.json`` of a conda environment.
+    * ``PY_VERSION`` of ``include/pythonX.Y/patchlevel.h``, or of
+      ``include/patchlevel.h`` on Windows.
+
+    When none of them exists, for example for an interpreter installed
+    without its C headers, ``executable --version`` is run. Without
+    ``fallback``, or if running the interpreter fails, the ``lib/pythonX.Y``
+    standard library is looked for, which only provides ``X.Y``.
+
+    The installation prefix is found from the real path of the executable.
+    When it holds several Python versions, the one matching the name of the
+    executable, for example ``python3.11``, is used.
+
+    Parameters
+    ----------
+    executable : str
+        Path of the Python executable.
+    fallback : bool, default: True
+        Run ``executable --version`` when no file gives the full version.
+
+    Returns
+    -------
+    str or None
+        Version of the interpreter, or ``None`` if it cannot be found.
+
+    Examples
+    --------
+    >>> get_python_version("/home/user/.local/ansys/python-3.11.4/bin/python3")
+    '3.11.4'
+
+    """
+    exe_dir = os.path.dirname(os.path.abspath(executable))
+    for venv_dir in (os.path.dirname(exe_dir), exe_dir):
+        version = _read_pyvenv_cfg(os.path.join(venv_dir, "pyvenv.cfg"))
+        if version is not None:
+            return version
+
+    real_path = os.path.realpath(executable)
+    real_dir = os.path.dirname(real_path)
+    minor = None
+    for name in (os.path.basename(real_path), os.path.basename(executable)):
+        match = _EXECUTABLE_VERSION.match(name)
+        if match:
+            minor = match.group(1)
+            break
+
+    # POSIX installs keep the executable in <prefix>/bin, Windows in <prefix>
+    prefixes = [os.path.dirname(real_dir), real_dir]
+    for probe in (_read_conda_meta, _read_patchlevel):
+        for prefix in prefixes:
+            version = probe(prefix, minor)
+            if version is not None:
+                return version
+
+    if fallback:
+        version = _run_python_version(executable)
+        if version is not None:
+            return version
+    for prefix in prefixes:
+        version = _read_stdlib_version(prefix, minor)
+        if version is not None:
+            return version
+    return None
+
+
+def _read_pyvenv_cfg(path):
+    """Read the version of the base interpreter of a virtual environment."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    config = {}
+    for line in lines:
+        key, sep, value = line.partition("=")
+        if sep:
+            config[key.strip().lower()] = value.strip()
+
+    # "version" is written by venv, "version_info" by virtualenv and uv
+    for key in ("version", "version_info"):
+        match = _VERSION.match(config.get(key, ""))
+        if match:
+            return match.group(1)
+    return None
+
+
+def _read_conda_meta(prefix, minor):
+    """Read the version of the ``python`` package of a conda environment."""
+    for name in _list_dir(os.path.join(prefix, "conda-meta")):
+        match = _CONDA_META_PYTHON.match(name)
+        if match and _same_minor(match.group(1), minor):
+            return match.group(1)
+    return None
+
+
+def _read_patchlevel(prefix, minor):
+    """Read ``PY_VERSION`` from the C headers of an installation."""
+    include_dir = os.path.join(prefix, "include")
+    headers = [
+        os.path.join(include_dir, name, "patchlevel.h")
+        for name in _version_dirs(include_dir, minor)
+    ]
+    # Windows installs do not have a versioned directory
+    headers.append(os.path.join(include_dir, "patchlevel.h"))
+
+    for header in headers:
+        try:
+            with open(header, encoding="utf-8") as f:
+                match = _PY_VERSION.search(f.read())
+        except (OSError, UnicodeDecodeError):
+            continue
+        if match and _same_minor(match.group(1), minor):
+            return match.group(1)
+    return None
+
+
+def _read_stdlib_version(prefix, minor):
+    """Read ``X.Y`` from the ``lib/pythonX.Y`` standard library of a prefix."""
+    lib_dir = os.path.join(prefix, "lib")
+    for name in _version_dirs(lib_dir, minor):
+        if os.path.isfile(os.path.join(lib_dir, name, "os.py")):
+            return _PYTHON_DIR.match(name).group(1)
+    return None
+
+
+def _version_dirs(directory, minor):
+    """List the ``pythonX.Y`` directories of a directory, matching ``minor``.
+
+    Nothing is returned if the directories belong to several ``X.Y`` series,
+    as the right one cannot be told apart.
+    """
+    names = {}
+    for name in _list_dir(directory):
+        match = _PYTHON_DIR.match(name)
+        if match and (minor is None or match.group(1) == minor):
+            names[name] = match.group(1)
+    if len(set(names.values())) > 1:
+        return []
+    return sorted(names)
+
+
+def _same_minor(version, minor):
+    """Whether a version belongs to the ``X.Y`` series ``minor``, if given."""
+    return minor is None or version == minor or version.startswith(f"{minor}.")
+
+
+def _list_dir(directory):
+    """List a directory, or nothing if it cannot be read."""
+    try:
+        return os.listdir(directory)
+    except OSError:
+        return []
+
+
+def _run_python_version(executable):
+    """Get the version of a Python interpreter by running it."""
+    try:
+        output = subprocess.check_output(
+            [executable, "--version"],
+            text=True,
+            stderr=subprocess.STDOUT,
+            timeout=PYTHON_PROBE_TIMEOUT,
+        ).strip()
+        return output.split()[1]
+    except (OSError, subprocess.SubprocessError, IndexError) as err:
+        LOG.debug("Unable to get the version of %s: %s", executable, err)
+        return None
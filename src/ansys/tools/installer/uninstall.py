@@ -27,7 +27,7 @@ import shutil
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from ansys.tools.installer.configure_json import ConfigureJson
+from ansys.tools.installer.configure_json import get_configure_json
 from ansys.tools.installer.constants import ANSYS_FAVICON, ASSETS_PATH
 from ansys.tools.installer.linux_functions import (
     execute_linux_command,
@@ -193,10 +193,10 @@ class Uninstall(QtWidgets.QWidget):
         os_version = get_os_version()
         if os_version in ["centos", "fedora"]:
             script_path = os.path.join(ASSETS_PATH, "uninstaller_yum.sh")
-            execute_linux_command(f"{script_path}", wait=False)
+            execute_linux_command(f"{script_path}", wait=False, terminal=True)
         elif get_os_version().startswith("2"):
             script_path = os.path.join(ASSETS_PATH, "uninstaller_ubuntu.sh")
-            execute_linux_command(f"{script_path}", wait=False)
+            execute_linux_command(f"{script_path}", wait=False, terminal=True)
 
         self.user_confirmation_form.close()
         self._parent.uninstall_window.close()
@@ -212,7 +212,7 @@ class Uninstall(QtWidgets.QWidget):
     def _remove_all_venvs(self):
         """Remove all the venv created by Ansys Python Manager."""
         try:
-            configure = ConfigureJson()
+            configure = get_configure_json()
             script_path = "bin" if is_linux_os() else "Scripts"
             for venv_dir in configure.history["path"]:
                 for venv_dir_name in os.listdir(venv_dir):
@@ -236,7 +236,7 @@ class Uninstall(QtWidgets.QWidget):
     def _remove_configs(self):
         """Remove all the configurations created by Ansys Python Manager."""
         try:
-            configure = ConfigureJson()
+            configure = get_configure_json()
             print(f"removed {configure.config_dir}")
             shutil.rmtree(configure.config_dir, ignore_errors=True)
         except:
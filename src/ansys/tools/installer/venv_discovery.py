@@ -0,0 +1,357 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Discovery of the virtual environments of the search paths."""
+
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
+import logging
+import os
+import re
+
+from ansys.tools.installer.constants import (
+    VENV_DISCOVERY_DEPTH,
+    VENV_DISCOVERY_IGNORE,
+    VENV_DISCOVERY_MAX_WORKERS,
+)
+from ansys.tools.installer.linux_functions import is_linux_os
+from ansys.tools.installer.python_version import get_python_version
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+VENV = "venv"
+CONDA = "conda"
+
+
+class VenvRecord:
+    """Virtual environment found on disk.
+
+    Parameters
+    ----------
+    path : str
+        Root directory of the environment.
+    name : str
+        Path of the environment relative to its search path.
+    kind : str
+        ``"venv"`` for environments created with ``venv`` or
+        ``virtualenv``, ``"conda"`` for conda environments.
+    scripts : str
+        Directory of the scripts of the environment.
+    python_version : str, optional
+        Version of the interpreter, for example ``"3.12.1"``, if found.
+    size : int, optional
+        Disk usage in bytes, if computed.
+    last_used : float, optional
+        Approximate time the environment was last used, in seconds since
+        the epoch.
+
+    """
+
+    __slots__ = (
+        "path",
+        "name",
+        "kind",
+        "scripts",
+        "python_version",
+        "size",
+        "last_used",
+    )
+
+    def __init__(
+        self, path, name, kind, scripts, python_version=None, size=None, last_used=None
+    ):
+        """Instantiate the record."""
+        self.path = path
+        self.name = name
+        self.kind = kind
+        self.scripts = scripts
+        self.python_version = python_version
+        self.size = size
+        self.last_used = last_used
+
+    def __repr__(self):
+        """Represent the record."""
+        return f"VenvRecord({self.path!r}, kind={self.kind!r})"
+
+    def to_dict(self):
+        """Convert the record to a dictionary serializable to JSON."""
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a record from the output of ``to_dict``."""
+        return cls(**data)
+
+
+def discover_venvs(
+    roots,
+    max_depth=VENV_DISCOVERY_DEPTH,
+    ignore=None,
+    compute_size=False,
+    inventory=None,
+    max_workers=VENV_DISCOVERY_MAX_WORKERS,
+):
+    """Find the virtual environments of several search paths.
+
+    The search paths are scanned in parallel.
+
+    Parameters
+    ----------
+    roots : list of str
+        Search paths.
+    max_depth : int, default: VENV_DISCOVERY_DEPTH
+        Depth of the directories searched. Environments directly in a
+        search path are at depth 1.
+    ignore : dict, optional
+        Glob patterns of the directories to skip, by search path, in
+        addition to ``VENV_DISCOVERY_IGNORE``.
+    compute_size : bool, default: False
+        Measure the disk usage of the environments.
+    inventory : ansys.tools.installer.inventory.Inventory, optional
+        Inventory keeping the environments of each search path until one
+        of its directories changes.
+    max_workers : int, default: VENV_DISCOVERY_MAX_WORKERS
+        Number of search paths scanned at once.
+
+    Returns
+    -------
+    list of VenvRecord
+        Environments found, in the order of the search paths. Environments
+        found from several search paths are listed once.
+
+    """
+    ignore = ignore or {}
+
+    def scan(root):
+        patterns = VENV_DISCOVERY_IGNORE + tuple(ignore.get(root, ()))
+        if inventory is None:
+            return scan_root(root, max_depth, patterns, compute_size)[0]
+
+        def compute():
+            records, watch = scan_root(root, max_depth, patterns, compute_size)
+            return [record.to_dict() for record in records], watch
+
+        key = f"venvs:{root}:{max_depth}:{int(compute_size)}:{'|'.join(patterns)}"
+        return [VenvRecord.from_dict(data) for data in inventory.get(key, compute)]
+
+    if len(roots) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(min(max_workers, len(roots))) as pool:
+            results = list(pool.map(scan, roots))
+    else:
+        results = [scan(root) for root in roots]
+
+    records = {}
+    for root_records in results:
+        for record in root_records:
+            records.setdefault(record.path, record)
+    return list(records.values())
+
+
+def scan_root(
+    root,
+    max_depth=VENV_DISCOVERY_DEPTH,
+    ignore=VENV_DISCOVERY_IGNORE,
+    compute_size=False,
+    script_path=None,
+):
+    """Find the virtual environments of a search path.
+
+    Each directory is listed once with ``os.scandir``. Environments are not
+    searched for nested environments.
+
+    Parameters
+    ----------
+    root : str
+        Search path.
+    max_depth : int, default: VENV_DISCOVERY_DEPTH
+        Depth of the directories searched. Environments directly in the
+        search path are at depth 1.
+    ignore : sequence of str, default: VENV_DISCOVERY_IGNORE
+        Glob patterns of the names, or paths relative to ``root``, of the
+        directories to skip.
+    compute_size : bool, default: False
+        Measure the disk usage of the environments.
+    script_path : str, optional
+        Directory of the scripts of an environment. Defaults to ``"bin"``
+        on Linux and ``"Scripts"`` on Windows.
+
+    Returns
+    -------
+    tuple
+        Environments found, sorted by name, and the paths whose
+        modification changes them. Directories that are not environments
+        yet are included, so environments being created are picked up.
+
+    """
+    if script_path is None:
+        script_path = "bin" if is_linux_os() else "Scripts"
+    ignored = _compile_globs(ignore)
+
+    records = []
+    watch = [root]
+    try:
+        pending = [(_list_dirs(root), "", 1)]
+    except OSError:
+        return records, watch
+
+    while pending:
+        children, prefix, depth = pending.pop()
+        for child in children:
+            name = prefix + child.name
+            if ignored(child.name, name):
+                continue
+            try:
+                entries = {entry.name: entry for entry in os.scandir(child.path)}
+            except OSError:
+                continue
+
+            kind = _env_kind(child.path, entries, script_path)
+            if kind is not None:
+                records.append(
+                    _record(child.path, name, kind, entries, script_path, compute_size)
+                )
+                continue
+
+            watch.append(child.path)
+            if script_path in entries:
+                watch.append(os.path.join(child.path, script_path))
+            if depth < max_depth:
+                subdirs = [entry for entry in entries.values() if _is_dir(entry)]
+                pending.append((subdirs, name + os.sep, depth + 1))
+
+    records.sort(key=lambda record: record.name)
+    return records, watch
+
+
+def disk_usage(path):
+    """Get the disk usage of a directory tree, in bytes.
+
+    Symbolic links are not followed.
+
+    Parameters
+    ----------
+    path : str
+        Directory.
+
+    Returns
+    -------
+    int
+        Disk usage in bytes. Files that cannot be read are skipped.
+
+    """
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            entries = list(os.scandir(pending.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            blocks = getattr(stat, "st_blocks", None)
+            total += stat.st_size if blocks is None else blocks * 512
+    return total
+
+
+def _list_dirs(path):
+    """List the subdirectories of a directory."""
+    return [entry for entry in os.scandir(path) if _is_dir(entry)]
+
+
+def _is_dir(entry):
+    """Whether a directory entry is a directory, following symbolic links."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _compile_globs(patterns):
+    """Compile glob patterns into a function matching a name or path.
+
+    Patterns holding a ``/`` are matched against the path relative to the
+    search path, the others against the directory name.
+    """
+
+    def compile_regex(patterns):
+        if not patterns:
+            return lambda name: None
+        regex = "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+        return re.compile(regex).match
+
+    match_name = compile_regex([p for p in patterns if "/" not in p])
+    match_path = compile_regex([p for p in patterns if "/" in p])
+
+    def ignored(name, path):
+        if match_name(os.path.normcase(name)) is not None:
+            return True
+        path = os.path.normcase(path).replace(os.sep, "/")
+        return match_path(path) is not None
+
+    return ignored
+
+
+def _env_kind(path, entries, script_path):
+    """Get the kind of environment of a directory, if it is one."""
+    if script_path in entries and os.path.isfile(
+        os.path.join(path, script_path, "activate")
+    ):
+        return VENV
+    if "conda-meta" in entries and "condabin" not in entries:
+        return CONDA
+    return None
+
+
+def _record(path, name, kind, entries, script_path, compute_size):
+    """Describe an environment."""
+    scripts = os.path.join(path, script_path)
+    if kind == CONDA and not is_linux_os():
+        executable = os.path.join(path, "python.exe")
+    else:
+        executable = os.path.join(scripts, "python" if is_linux_os() else "python.exe")
+
+    # Interpreters of virtual environments read pyvenv.cfg at startup
+    try:
+        if "pyvenv.cfg" in entries:
+            stat = entries["pyvenv.cfg"].stat()
+        else:
+            stat = os.stat(executable)
+        last_used = max(stat.st_atime, stat.st_mtime)
+    except OSError:
+        last_used = None
+
+    return VenvRecord(
+        path,
+        name,
+        kind,
+        scripts,
+        python_version=get_python_version(executable, fallback=False),
+        size=disk_usage(path) if compute_size else None,
+        last_used=last_used,
+    )
@@ -0,0 +1,147 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Metadata of virtual environments: Python version, packages and size."""
+
+import os
+
+from ansys.tools.installer.inventory import get_inventory
+from ansys.tools.installer.linux_functions import is_linux_os
+from ansys.tools.installer.python_version import get_python_version
+from ansys.tools.installer.venv_discovery import disk_usage
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def get_venv_metadata(path, inventory=None):
+    """Get the metadata of an environment, computing it only if it changed.
+
+    The metadata is kept in the inventory until the environment root, its
+    ``pyvenv.cfg`` or ``conda-meta`` directory, or one of its
+    ``site-packages`` directories change.
+
+    Parameters
+    ----------
+    path : str
+        Root directory of the environment.
+    inventory : ansys.tools.installer.inventory.Inventory, optional
+        Inventory keeping the metadata. Defaults to ``get_inventory()``.
+
+    Returns
+    -------
+    dict
+        Metadata described in ``collect_venv_metadata``.
+
+    """
+    if inventory is None:
+        inventory = get_inventory()
+    return inventory.get(f"venv-meta:{path}", lambda: collect_venv_metadata(path))
+
+
+def collect_venv_metadata(path):
+    """Compute the metadata of an environment.
+
+    Parameters
+    ----------
+    path : str
+        Root directory of the environment.
+
+    Returns
+    -------
+    tuple
+        Dictionary with the ``"python_version"`` of the interpreter, the
+        number of installed ``"packages"`` and the ``"size"`` on disk in
+        bytes, and the paths whose modification changes it. Values that
+        cannot be found are ``None``.
+
+    """
+    site_dirs = _site_packages_dirs(path)
+    packages = None
+    for site_dir in site_dirs:
+        try:
+            with os.scandir(site_dir) as entries:
+                count = sum(entry.name.endswith(".dist-info") for entry in entries)
+        except OSError:
+            continue
+        packages = (packages or 0) + count
+
+    if is_linux_os():
+        executable = os.path.join(path, "bin", "python")
+    else:
+        executable = os.path.join(path, "Scripts", "python.exe")
+        if not os.path.exists(executable):
+            executable = os.path.join(path, "python.exe")
+
+    metadata = {
+        "python_version": get_python_version(executable, fallback=False),
+        "packages": packages,
+        "size": disk_usage(path) if os.path.isdir(path) else None,
+    }
+    watch = [path, os.path.join(path, "pyvenv.cfg"), os.path.join(path, "conda-meta")]
+    return metadata, watch + site_dirs
+
+
+def format_size(size):
+    """Format a size in bytes for display, for example ``"1.2 GB"``.
+
+    Parameters
+    ----------
+    size : int
+        Size in bytes.
+
+    Returns
+    -------
+    str
+        Size with one decimal in the largest unit below 1024.
+
+    """
+    for unit in _SIZE_UNITS[:-1]:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} {_SIZE_UNITS[-1]}"
+
+
+def _site_packages_dirs(path):
+    """List the ``site-packages`` directories of an environment."""
+    if not is_linux_os():
+        candidates = [os.path.join(path, "Lib", "site-packages")]
+    else:
+        candidates = []
+        for lib in ("lib", "lib64"):
+            try:
+                with os.scandir(os.path.join(path, lib)) as entries:
+                    names = sorted(
+                        e.name for e in entries if e.name.startswith("python")
+                    )
+            except OSError:
+                continue
+            candidates += [
+                os.path.join(path, lib, name, "site-packages") for name in names
+            ]
+
+    site_dirs = {}
+    for candidate in candidates:
+        if os.path.isdir(candidate):
+            # lib64 is usually a link to lib
+            site_dirs.setdefault(os.path.realpath(candidate), candidate)
+    return list(site_dirs.values())
@@ -0,0 +1,352 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Watch the environment and interpreter directories for changes."""
+
+import logging
+import os
+
+from PySide6 import QtCore
+
+from ansys.tools.installer.configure_json import get_configure_json
+from ansys.tools.installer.constants import (
+    VENV_DISCOVERY_IGNORE,
+    VENV_IGNORE,
+    VENV_SEARCH_DEPTH,
+    VENV_SEARCH_PATH,
+    WATCHER_DEBOUNCE,
+    WATCHER_POLL_INTERVAL,
+)
+from ansys.tools.installer.find_python import find_miniforge, scan_venv_dir
+from ansys.tools.installer.linux_functions import (
+    ansys_linux_path,
+    find_ansys_installed_python_linux,
+    is_linux_os,
+)
+from ansys.tools.installer.workers import RequestDispatcher
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+_INTERPRETERS = object()
+
+# Settings changing the environments found in the search paths
+_SEARCH_SETTINGS = (VENV_SEARCH_PATH, VENV_SEARCH_DEPTH, VENV_IGNORE)
+
+_INVENTORY_WATCHER = None
+
+
+class InventoryWatcher(QtCore.QObject):
+    """Report environments and interpreters added or removed on disk.
+
+    The virtual environment search paths, and the directory of the
+    interpreters installed by this application on Linux, are watched with
+    ``QFileSystemWatcher``, which relies on inotify on Linux. Paths it
+    cannot watch, such as missing directories, are polled instead. Only the
+    search path that changed is listed again, in a background thread, and
+    the difference with its previous content is emitted.
+
+    Parameters
+    ----------
+    parent : QtCore.QObject, optional
+        Parent object.
+    search_paths : list of str, optional
+        Directories holding virtual environments. Defaults to the search
+        paths of the configuration, which are then followed when they
+        change.
+    interpreters_path : str, optional
+        Directory holding the interpreters installed by this application.
+        Defaults to ``ansys_linux_path`` on Linux. Not watched on Windows.
+    poll_interval : int, optional
+        Interval in milliseconds between two polls of unwatched paths.
+    poll_only : bool, default: False
+        Poll all paths, for file systems without change notifications, such
+        as NFS mounts changed from another host.
+
+    """
+
+    venv_added = QtCore.Signal(str, str, bool)
+    venv_removed = QtCore.Signal(str)
+    interpreter_added = QtCore.Signal(str, str, bool)
+    interpreter_removed = QtCore.Signal(str)
+
+    def __init__(
+        self,
+        parent=None,
+        search_paths=None,
+        interpreters_path=None,
+        poll_interval=WATCHER_POLL_INTERVAL,
+        poll_only=False,
+    ):
+        """Instantiate the watcher."""
+        super().__init__(parent)
+        self._script_path = "bin" if is_linux_os() else "Scripts"
+        if interpreters_path is None and is_linux_os():
+            interpreters_path = ansys_linux_path
+        self._interpreters_path = interpreters_path
+        self._poll_only = poll_only
+
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_changed)
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(poll_interval)
+        self._poll_timer.timeout.connect(self._poll)
+        self._debounce_timer = QtCore.QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(WATCHER_DEBOUNCE)
+        self._debounce_timer.timeout.connect(self._refresh_changed)
+        # Search paths are listed in the background, the latest change of a
+        # search path superseding the listing still pending
+        self._requests = RequestDispatcher(self, max_threads=2)
+
+        self._owners = {}  # watched path -> search path or _INTERPRETERS
+        self._polled = {}  # polled path -> modification time
+        self._changed = set()
+        # search path -> names of its environments, None until it is listed
+        # if the environments found by the first listing are not emitted
+        self._venvs = {}
+        self._scan_options = None  # (depth, ignore patterns by search path)
+        # path -> (version, admin), None until the interpreters are found
+        self._interpreters = None
+
+        if self._interpreters_path is not None:
+            self._refresh_interpreters()
+        self.reload(search_paths, emit=False)
+
+        if search_paths is None:
+            # Settings changed together are applied by a single reload
+            self._reload_timer = QtCore.QTimer(self)
+            self._reload_timer.setSingleShot(True)
+            self._reload_timer.setInterval(0)
+            self._reload_timer.timeout.connect(self.reload)
+            get_configure_json().signals.changed.connect(self._on_setting_changed)
+
+    def reload(self, search_paths=None, emit=True, max_depth=None, ignore=None):
+        """Watch a new list of search paths.
+
+        Parameters
+        ----------
+        search_paths : list of str, optional
+            Directories holding virtual environments. Defaults to the
+            search paths of the configuration file.
+        emit : bool, default: True
+            Emit the environments of the search paths added or removed.
+        max_depth : int, optional
+            Depth of the directories searched. Defaults to the depth of the
+            configuration file.
+        ignore : dict, optional
+            Glob patterns of the directories skipped, by search path.
+            Defaults to the patterns of the configuration file.
+
+        """
+        if search_paths is None or max_depth is None or ignore is None:
+            configure = get_configure_json()
+            if search_paths is None:
+                search_paths = configure.venv_search_path
+            if max_depth is None:
+                max_depth = configure.venv_search_depth
+            if ignore is None:
+                ignore = configure.venv_ignore
+        for venv_dir in set(self._venvs) - set(search_paths):
+            self._requests.cancel(venv_dir)
+            self._watch(venv_dir, [])
+            names = self._venvs.pop(venv_dir)
+            if emit and names is not None:
+                for name in names:
+                    self.venv_removed.emit(self._venv_path(venv_dir, name))
+
+        scan_options = (max_depth, ignore)
+        if scan_options != self._scan_options:
+            self._scan_options = scan_options
+            for venv_dir in self._venvs:
+                if not emit:
+                    self._venvs[venv_dir] = None
+                self._refresh_venv_dir(venv_dir)
+        for venv_dir in search_paths:
+            if venv_dir not in self._venvs:
+                self._venvs[venv_dir] = set() if emit else None
+                self._refresh_venv_dir(venv_dir)
+
+    @property
+    def watched_paths(self):
+        """Paths watched with change notifications."""
+        return self._watcher.directories()
+
+    @property
+    def polled_paths(self):
+        """Paths polled for changes."""
+        return list(self._polled)
+
+    @property
+    def refreshing(self):
+        """Whether a search path is being listed."""
+        return self._requests.is_pending(_INTERPRETERS) or any(
+            self._requests.is_pending(venv_dir) for venv_dir in self._venvs
+        )
+
+    def _watch(self, owner, paths):
+        """Replace the paths watched for an owner."""
+        old = {path for path, path_owner in self._owners.items() if path_owner is owner}
+        new = set(paths)
+        for path in old - new:
+            del self._owners[path]
+            self._polled.pop(path, None)
+            self._watcher.removePath(path)
+        for path in new - old:
+            self._owners[path] = owner
+            if self._poll_only or not os.path.isdir(path):
+                self._polled[path] = _mtime(path)
+            elif not self._watcher.addPath(path):
+                LOG.debug("Unable to watch %s. Polling it instead.", path)
+                self._polled[path] = _mtime(path)
+
+        if self._polled and not self._poll_timer.isActive():
+            self._poll_timer.start()
+        elif not self._polled:
+            self._poll_timer.stop()
+
+    def _on_setting_changed(self, key):
+        """Reload the search paths when their settings changed."""
+        if key in _SEARCH_SETTINGS:
+            self._reload_timer.start()
+
+    def _on_changed(self, path):
+        """Schedule the refresh of the owner of a changed path."""
+        owner = self._owners.get(path)
+        if owner is not None:
+            self._changed.add(owner)
+            self._debounce_timer.start()
+
+    def _poll(self):
+        """Look for changes of the polled paths."""
+        for path, mtime in list(self._polled.items()):
+            new_mtime = _mtime(path)
+            if new_mtime != mtime:
+                self._polled[path] = new_mtime
+                self._on_changed(path)
+
+    def _refresh_changed(self):
+        """Refresh the owners of the paths changed since the last refresh."""
+        changed, self._changed = self._changed, set()
+        for owner in changed:
+            if owner is _INTERPRETERS:
+                self._refresh_interpreters()
+            elif owner in self._venvs:
+                self._refresh_venv_dir(owner)
+
+    def _refresh_venv_dir(self, venv_dir):
+        """List a search path again in the background."""
+        max_depth, ignore = self._scan_options
+        self._requests.submit(
+            venv_dir,
+            scan_venv_dir,
+            venv_dir,
+            self._script_path,
+            max_depth,
+            VENV_DISCOVERY_IGNORE + tuple(ignore.get(venv_dir, ())),
+            on_result=lambda result: self._apply_venv_dir(venv_dir, *result),
+            on_error=lambda err: LOG.debug("Unable to list %s: %s", venv_dir, err),
+        )
+
+    def _apply_venv_dir(self, venv_dir, names, watch):
+        """Store the listing of a search path and emit the difference."""
+        if venv_dir not in self._venvs:
+            # Search path removed while it was listed
+            return
+        # Add all paths again, so the ones created since are watched
+        # instead of polled
+        self._watch(venv_dir, [])
+        self._watch(venv_dir, watch)
+
+        names = set(names)
+        old_names = self._venvs[venv_dir]
+        self._venvs[venv_dir] = names
+        if old_names is None:
+            return
+        for name in sorted(old_names - names):
+            LOG.debug("Environment %s removed from %s", name, venv_dir)
+            self.venv_removed.emit(self._venv_path(venv_dir, name))
+        for name in sorted(names - old_names):
+            LOG.debug("Environment %s added to %s", name, venv_dir)
+            self.venv_added.emit(self._venv_path(venv_dir, name), name, False)
+
+    def _refresh_interpreters(self):
+        """Find the installed interpreters again in the background."""
+        self._watch(_INTERPRETERS, [])
+        self._watch(_INTERPRETERS, [self._interpreters_path])
+        self._requests.submit(
+            _INTERPRETERS,
+            self._find_interpreters,
+            on_result=self._apply_interpreters,
+            on_error=lambda err: LOG.debug("Unable to find interpreters: %s", err),
+        )
+
+    def _apply_interpreters(self, interpreters):
+        """Store the installed interpreters and emit the difference."""
+        old_interpreters, self._interpreters = self._interpreters, interpreters
+        if old_interpreters is None:
+            return
+        for path in old_interpreters:
+            if path not in interpreters:
+                self.interpreter_removed.emit(path)
+        for path, (version, admin) in interpreters.items():
+            if path not in old_interpreters:
+                self.interpreter_added.emit(path, version, admin)
+
+    def _find_interpreters(self):
+        """Find the interpreters installed by this application."""
+        interpreters = {
+            path: (f"Python {version}", admin)
+            for path, (version, admin) in find_ansys_installed_python_linux().items()
+        }
+        for path, (version, admin) in find_miniforge().items():
+            interpreters[path] = (f"Conda {version}", admin)
+        return interpreters
+
+    def _venv_path(self, venv_dir, name):
+        """Get the path of the scripts of an environment."""
+        return os.path.join(venv_dir, name, self._script_path)
+
+
+def _mtime(path):
+    """Get the modification time of a path, ``None`` if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_inventory_watcher():
+    """Get the watcher shared by all the dropdowns of the application.
+
+    Must be called once the ``QApplication`` exists.
+
+    Returns
+    -------
+    InventoryWatcher
+        Shared watcher.
+
+    """
+    global _INVENTORY_WATCHER
+    if _INVENTORY_WATCHER is None:
+        _INVENTORY_WATCHER = InventoryWatcher()
+    return _INVENTORY_WATCHER
@@ -26,6 +26,8 @@ import logging
 import os
 import subprocess
 
+from ansys.tools.installer.package_managers import get_package_manager_tracker
+
 LOG = logging.getLogger(__name__)
 
 
@@ -49,13 +51,8 @@ def create_venv_windows(venv_dir: str, py_path: str):
 
     # Update the package managers
     try:
-        # Update pip and uv using the py_path
-        LOG.debug("Updating package managers - pip & uv...")
-        subprocess.call(
-            f'start /w /min cmd /K ""{py_path}\\python.exe" -m pip install --upgrade pip uv && exit"',
-            shell=True,
-            cwd=user_profile,
-        )
+        # Update pip and uv using the py_path, unless they are current
+        upgrade_package_managers_windows(os.path.join(py_path, "python.exe"))
 
         # Create venv using uv
         LOG.debug("Creating virtual environment using uv...")
@@ -67,16 +64,55 @@ def create_venv_windows(venv_dir: str, py_path: str):
 
         # Check & Update default venv packages
         LOG.debug("Updating virtual environment packages...")
-        venv_python = os.path.join(venv_dir, "Scripts", "python.exe")
-        subprocess.call(
-            f'start /w /min cmd /K "{venv_python} -m pip install --upgrade pip uv && exit"',
-            shell=True,
-            cwd=user_profile,
+        upgrade_package_managers_windows(
+            os.path.join(venv_dir, "Scripts", "python.exe")
         )
     except Exception as e:
         LOG.debug(f"Error creating virtual environment: {e}")
 
 
+def upgrade_package_managers_windows(python, path=None):
+    r"""
+    Upgrade pip and uv of an interpreter in a minimized window, unless current.
+
+    Only successful upgrades are recorded by the package manager tracker.
+
+    Parameters
+    ----------
+    python : str
+        Path to the Python executable.
+    path : str, optional
+        Value of the ``PATH`` environment variable of the upgrade.
+
+    Returns
+    -------
+    bool
+        Whether pip and uv are current.
+
+    Examples
+    --------
+    >>> upgrade_package_managers_windows("C:\\Python39\\python.exe")
+    True
+
+    """
+    tracker = get_package_manager_tracker()
+    if tracker.is_current(python):
+        return True
+    LOG.debug("Updating package managers - pip & uv...")
+    set_path = f"set PATH={path} && " if path else ""
+    # ``cmd /C`` exits with the status of pip, returned by ``start /w``
+    returncode = subprocess.call(
+        f'start /w /min cmd /C "{set_path}"{python}" -m pip install --upgrade pip uv"',
+        shell=True,
+        cwd=os.path.expanduser("~"),
+    )
+    if returncode:
+        LOG.warning("Unable to upgrade pip and uv of %s", python)
+        return False
+    tracker.mark_upgraded(python)
+    return True
+
+
 def create_venv_windows_conda(venv_dir: str, py_path: str):
     r"""
     Create a virtual environment on Windows using conda.
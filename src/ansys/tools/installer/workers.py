@@ -0,0 +1,220 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run blocking calls off the GUI thread."""
+
+import atexit
+import logging
+import weakref
+
+from PySide6 import QtCore
+import shiboken6
+
+LOG = logging.getLogger(__name__)
+LOG.setLevel("DEBUG")
+
+_DISPATCHERS = weakref.WeakSet()
+
+
+class WorkerSignals(QtCore.QObject):
+    """Signals emitted by a ``Worker``.
+
+    Created in the GUI thread, so connected slots are run in the GUI
+    thread even though the signals are emitted from the thread pool.
+    """
+
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(object)
+    done = QtCore.Signal()
+
+
+class Worker(QtCore.QRunnable):
+    """Call a function in a ``QThreadPool``.
+
+    Parameters
+    ----------
+    fn : callable
+        Function to call.
+    *args, **kwargs
+        Arguments of the function.
+
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        """Instantiate the worker."""
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.cancelled = False
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def cancel(self):
+        """Flag this worker so its result is never delivered."""
+        self.cancelled = True
+
+    def run(self):
+        """Call the function and emit its result."""
+        try:
+            if self.cancelled:
+                return
+            try:
+                result = self._fn(*self._args, **self._kwargs)
+            except Exception as err:
+                LOG.debug(f"Worker call to {self._fn.__name__} failed: {err}")
+                if not self.cancelled:
+                    self.signals.failed.emit(err)
+                return
+            if not self.cancelled:
+                self.signals.finished.emit(result)
+        finally:
+            self.signals.done.emit()
+
+
+class RequestDispatcher(QtCore.QObject):
+    """Dispatch keyed requests to a thread pool, keeping only the latest.
+
+    Submitting a request for a key supersedes the previous request with the
+    same key. A superseded request is removed from the queue if it did not
+    start yet, and its result is discarded otherwise. Callbacks are run in
+    the GUI thread.
+
+    Parameters
+    ----------
+    parent : QtCore.QObject, optional
+        Parent object.
+    max_threads : int, default: 4
+        Maximum number of requests run at the same time.
+
+    Examples
+    --------
+    >>> dispatcher = RequestDispatcher()
+    >>> dispatcher.submit(
+    ...     "versions", get_pkg_versions, "pyansys", on_result=print
+    ... )
+
+    """
+
+    def __init__(self, parent=None, max_threads=4):
+        """Instantiate the dispatcher."""
+        super().__init__(parent)
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._current = {}
+        # Keep running workers alive until the thread pool is done with them
+        self._running = set()
+        _DISPATCHERS.add(self)
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, **kwargs):
+        """Run ``fn(*args, **kwargs)`` in the thread pool.
+
+        Parameters
+        ----------
+        key : str
+            Identifier of the request. Any pending request with the same key
+            is cancelled.
+        fn : callable
+            Function to call.
+        *args, **kwargs
+            Arguments of the function.
+        on_result : callable, optional
+            Called in the GUI thread with the return value of ``fn``.
+        on_error : callable, optional
+            Called in the GUI thread with the exception raised by ``fn``.
+
+        Returns
+        -------
+        Worker
+            Worker running the request.
+
+        """
+        self.cancel(key)
+        worker = Worker(fn, *args, **kwargs)
+        worker.signals.finished.connect(
+            lambda result: self._deliver(key, worker, on_result, result)
+        )
+        worker.signals.failed.connect(
+            lambda err: self._deliver(key, worker, on_error, err)
+        )
+        worker.signals.done.connect(lambda: self._running.discard(worker))
+        self._current[key] = worker
+        self._running.add(worker)
+        self._pool.start(worker)
+        return worker
+
+    def cancel(self, key):
+        """Cancel the pending request of a key, if any."""
+        worker = self._current.pop(key, None)
+        if worker is not None:
+            worker.cancel()
+            if self._pool.tryTake(worker):
+                self._running.discard(worker)
+
+    def is_pending(self, key):
+        """Return whether a request of a key is waiting for its result."""
+        return key in self._current
+
+    def wait(self, msecs=-1):
+        """Wait for all running requests to finish.
+
+        Parameters
+        ----------
+        msecs : int, default: -1
+            Maximum time to wait in milliseconds. Waits forever if negative.
+
+        Returns
+        -------
+        bool
+            ``True`` if all requests finished.
+
+        """
+        return self._pool.waitForDone(msecs)
+
+    def shutdown(self):
+        """Cancel all pending requests and wait for the running ones."""
+        for key in list(self._current):
+            self.cancel(key)
+        self._pool.clear()
+        self._pool.waitForDone()
+
+    def _deliver(self, key, worker, callback, value):
+        """Hand a result to its callback unless the request was superseded."""
+        if not shiboken6.isValid(self):
+            # The owner of the dispatcher, and its widgets, were deleted
+            return
+        if self._current.get(key) is not worker:
+            return
+        del self._current[key]
+        if callback is not None:
+            callback(value)
+
+
+@atexit.register
+def _shutdown_dispatchers():
+    """Stop all thread pools before the interpreter is finalized."""
+    for dispatcher in list(_DISPATCHERS):
+        try:
+            dispatcher.shutdown()
+        except RuntimeError:
+            # Underlying Qt object already deleted
+            pass
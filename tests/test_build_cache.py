@@ -0,0 +1,133 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import shutil
+
+import pytest
+
+from ansys.tools.installer import build_cache
+from ansys.tools.installer.build_cache import (
+    BUILD_MANIFEST,
+    BuildCache,
+    compiler_id,
+)
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("tar") is None or os.name != "posix",
+    reason="Requires tar on a posix system",
+)
+
+
+@pytest.fixture(autouse=True)
+def platform_key(monkeypatch):
+    monkeypatch.setattr(build_cache, "get_os_version", lambda: "22.04")
+    monkeypatch.setattr(build_cache.platform, "machine", lambda: "x86_64")
+    monkeypatch.setattr(build_cache, "compiler_id", lambda: "gcc-11.4.0")
+
+
+def _build(prefix):
+    bin_dir = os.path.join(prefix, "bin")
+    config_dir = os.path.join(prefix, "lib", "python3.99", "config-3.99-x86_64")
+    os.makedirs(bin_dir)
+    os.makedirs(config_dir)
+    with open(os.path.join(bin_dir, "python3.99"), "wb") as f:
+        f.write(b"\x7fELF\0" + prefix.encode())
+    os.symlink("python3.99", os.path.join(bin_dir, "python3"))
+    with open(os.path.join(bin_dir, "pip3"), "w") as f:
+        f.write(f"#!{prefix}/bin/python3.99\nimport pip\n")
+    os.chmod(os.path.join(bin_dir, "pip3"), 0o755)
+    with open(os.path.join(config_dir, "Makefile"), "w") as f:
+        f.write(f"prefix=\t\t{prefix}\n")
+    return prefix
+
+
+def test_artifact_name(tmp_path):
+    cache = BuildCache(str(tmp_path))
+    assert (
+        cache.artifact_name("3.12.0", "optimized")
+        == "python-3.12.0-22.04-x86_64-gcc-11.4.0-optimized.tar.gz"
+    )
+
+
+def test_store_and_install(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"))
+    prefix = _build(str(tmp_path / "build" / "python-3.99.0"))
+    assert cache.lookup("3.99.0") is None
+
+    artifact = cache.store(prefix, "3.99.0")
+    assert cache.lookup("3.99.0") == artifact
+    assert cache.lookup("3.99.0", "optimized") is None
+    assert cache.lookup("3.99.1") is None
+
+    target = str(tmp_path / "other" / "python-3.99.0")
+    cache.install(artifact, target)
+    with open(os.path.join(target, "bin", "pip3")) as f:
+        assert f.readline() == f"#!{target}/bin/python3.99\n"
+    assert os.access(os.path.join(target, "bin", "pip3"), os.X_OK)
+    assert os.readlink(os.path.join(target, "bin", "python3")) == "python3.99"
+    makefile = os.path.join(target, "lib", "python3.99", "config-3.99-x86_64")
+    with open(os.path.join(makefile, "Makefile")) as f:
+        assert target in f.read()
+    # binaries are left untouched
+    with open(os.path.join(target, "bin", "python3.99"), "rb") as f:
+        assert prefix.encode() in f.read()
+    with open(os.path.join(target, BUILD_MANIFEST)) as f:
+        assert json.load(f)["prefix"] == target
+    assert os.listdir(tmp_path / "other") == ["python-3.99.0"]
+
+
+def test_shared_dir(tmp_path, monkeypatch):
+    shared = str(tmp_path / "shared")
+    builder = BuildCache(str(tmp_path / "builder"), shared_dir=shared)
+    builder.store(_build(str(tmp_path / "build" / "python-3.99.0")), "3.99.0")
+
+    consumer = BuildCache(str(tmp_path / "consumer"), shared_dir=shared)
+    artifact = consumer.lookup("3.99.0")
+    assert os.path.dirname(artifact) == shared
+
+    # other compilers are only accepted without one to build with
+    monkeypatch.setattr(build_cache, "compiler_id", lambda: "clang-17.0.1")
+    assert consumer.lookup("3.99.0") is None
+    monkeypatch.setattr(build_cache, "compiler_id", lambda: None)
+    assert consumer.lookup("3.99.0") == artifact
+
+
+def test_compiler_id_follows_cc(tmp_path, monkeypatch):
+    compiler = tmp_path / "mycc"
+    compiler.write_text("#!/bin/sh\necho 'mycc version 1.2.3'\n")
+    compiler.chmod(0o755)
+    monkeypatch.setenv("CC", f"{compiler} -m64")
+    compiler_id.cache_clear()
+    try:
+        assert compiler_id() == "mycc-1.2.3"
+    finally:
+        compiler_id.cache_clear()
+
+
+def test_eviction(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"), max_size=1)
+    first = cache.store(_build(str(tmp_path / "a" / "python-3.99.0")), "3.99.0")
+    second = cache.store(_build(str(tmp_path / "b" / "python-3.99.1")), "3.99.1")
+    assert not os.path.exists(first)
+    assert os.path.exists(second)
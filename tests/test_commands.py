@@ -0,0 +1,101 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from ansys.tools.installer import commands
+from ansys.tools.installer.commands import Command, open_terminal, run_command
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="Uses a posix shell")
+
+
+def test_run_command(tmp_path):
+    lines = []
+    log_path = str(tmp_path / "command.log")
+    result = run_command(
+        "echo out; echo err >&2; exit 3",
+        cwd=str(tmp_path),
+        on_output=lines.append,
+        log_path=log_path,
+    )
+    assert result.returncode == 3
+    assert result.output == "out\nerr\n"
+    assert lines == ["out\n", "err\n"]
+    with open(log_path) as f:
+        assert f.read() == "$ echo out; echo err >&2; exit 3\nout\nerr\n"
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        result.check_returncode()
+    assert excinfo.value.output == "out\nerr\n"
+
+
+def test_run_command_check():
+    result = run_command([sys.executable, "-c", "print('ok')"], check=True)
+    assert result.output == "ok\n"
+    with pytest.raises(subprocess.CalledProcessError):
+        run_command([sys.executable, "-c", "raise SystemExit(1)"], check=True)
+    with pytest.raises(FileNotFoundError):
+        run_command(["command-that-does-not-exist"])
+
+
+def test_output_tail():
+    result = run_command("seq 1 10", tail=3)
+    assert result.output == "8\n9\n10\n"
+
+
+def test_timeout():
+    start = time.perf_counter()
+    # the background process keeps the output open until it is killed too
+    result = run_command("sleep 30 & sleep 30", timeout=0.2)
+    assert time.perf_counter() - start < 10
+    assert result.timed_out
+    assert result.returncode < 0
+    with pytest.raises(subprocess.TimeoutExpired):
+        result.check_returncode()
+
+
+def test_cancel(monkeypatch):
+    monkeypatch.setattr(commands, "COMMAND_KILL_DELAY", 0.2)
+    # ignores the request to stop, so it is killed
+    command = Command("trap '' TERM; echo started; sleep 30 & wait")
+    started = threading.Event()
+    command.on_output = lambda line: started.set()
+    command.start()
+    assert command.running
+    assert started.wait(5)
+    command.cancel()
+    result = command.wait()
+    assert result.cancelled
+    assert not command.running
+    with pytest.raises(RuntimeError):
+        command.start()
+
+
+def test_open_terminal(monkeypatch):
+    monkeypatch.setattr(commands.shutil, "which", lambda name: None)
+    with pytest.raises(FileNotFoundError):
+        open_terminal("ls")
@@ -0,0 +1,166 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from ansys.tools.installer import configure_json
+from ansys.tools.installer.configure_json import ConfigureJson, get_configure_json
+from ansys.tools.installer.constants import (
+    PREFETCH_METADATA,
+    VENV_DEFAULT_PATH,
+    VENV_SEARCH_PATH,
+)
+
+
+def _read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_files_are_created(tmp_path):
+    config = ConfigureJson(str(tmp_path))
+    assert _read(config.config_file_path)["path"][VENV_SEARCH_PATH] == [
+        config.default_path
+    ]
+    assert _read(config.history_file_path) == {"path": [config.default_path]}
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_invalid_file_is_replaced(tmp_path):
+    (tmp_path / "config.json").write_text("{not json")
+    config = ConfigureJson(str(tmp_path))
+    assert VENV_DEFAULT_PATH in _read(config.config_file_path)["path"]
+
+
+def test_saves_are_debounced(tmp_path, monkeypatch):
+    config = ConfigureJson(str(tmp_path), write_delay=0.2)
+    writes = []
+    write_json = configure_json._write_json
+    monkeypatch.setattr(
+        configure_json,
+        "_write_json",
+        lambda path, data: writes.append(path) or write_json(path, data),
+    )
+
+    config.rewrite_option(PREFETCH_METADATA, True)
+    config.save()
+    config.rewrite_config(VENV_DEFAULT_PATH, str(tmp_path / "venvs"))
+    config.save()
+    assert config.default_path == str(tmp_path / "venvs")
+    assert not _read(config.config_file_path).get("options")
+
+    deadline = time.time() + 5
+    while not writes and time.time() < deadline:
+        time.sleep(0.05)
+    time.sleep(0.1)
+    assert writes == [config.config_file_path, config.history_file_path]
+    assert _read(config.config_file_path)["options"][PREFETCH_METADATA] is True
+    assert str(tmp_path / "venvs") in _read(config.history_file_path)["path"]
+
+
+def test_concurrent_instances_merge(tmp_path):
+    first = ConfigureJson(str(tmp_path), write_delay=0)
+    second = ConfigureJson(str(tmp_path), write_delay=0)
+
+    first.rewrite_option("first", 1)
+    second.rewrite_option("second", 2)
+    first.save()
+    # files changed since the second instance read them
+    time.sleep(0.01)
+    second.save()
+
+    options = _read(first.config_file_path)["options"]
+    assert options["first"] == 1
+    assert options["second"] == 2
+    assert first.reload_if_changed()
+    assert first.options["second"] == 2
+    assert not first.reload_if_changed()
+
+
+def test_shared_instance(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setattr(configure_json, "_CONFIGURE_JSON", None)
+
+    config = get_configure_json()
+    assert config is get_configure_json()
+    assert config.config_dir.startswith(str(tmp_path))
+
+    other = ConfigureJson(config.config_dir, write_delay=0)
+    other.rewrite_option(PREFETCH_METADATA, True)
+    other.save()
+    assert get_configure_json().prefetch_metadata
+
+
+@pytest.mark.parametrize("delay", [0, 0.05])
+def test_flush_writes_pending_changes(tmp_path, delay):
+    config = ConfigureJson(str(tmp_path), write_delay=delay)
+    config.rewrite_option(PREFETCH_METADATA, True)
+    config.flush()
+    assert _read(config.config_file_path)["options"][PREFETCH_METADATA] is True
+
+
+def test_changed_signal(qtbot, tmp_path):
+    config = ConfigureJson(str(tmp_path), write_delay=0)
+    changed = []
+    config.signals.changed.connect(changed.append)
+
+    config.rewrite_option(PREFETCH_METADATA, True)
+    config.rewrite_option(PREFETCH_METADATA, True)
+    config.rewrite_config(VENV_SEARCH_PATH, list(config.venv_search_path))
+    assert changed == [PREFETCH_METADATA]
+    config.save()
+
+    other = ConfigureJson(str(tmp_path), write_delay=0)
+    other.rewrite_config(VENV_SEARCH_PATH, [str(tmp_path / "venvs")])
+    time.sleep(0.01)
+    other.save()
+    assert config.reload_if_changed()
+    assert changed == [PREFETCH_METADATA, VENV_SEARCH_PATH]
+
+
+def test_changed_signal_is_emitted_in_the_gui_thread(qtbot, tmp_path):
+    # First use of the configuration from a worker thread
+    configs = []
+    worker = threading.Thread(
+        target=lambda: configs.append(ConfigureJson(str(tmp_path), write_delay=0))
+    )
+    worker.start()
+    worker.join()
+    config = configs[0]
+    threads = []
+    config.signals.changed.connect(
+        lambda key: threads.append(threading.current_thread())
+    )
+
+    worker = threading.Thread(
+        target=config.rewrite_option, args=(PREFETCH_METADATA, True)
+    )
+    worker.start()
+    worker.join()
+    qtbot.waitUntil(lambda: len(threads) == 1, timeout=5000)
+    assert threads == [threading.main_thread()]
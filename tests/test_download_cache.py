@@ -0,0 +1,111 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import time
+
+from ansys.tools.installer import download_cache
+from ansys.tools.installer.constants import DOWNLOAD_CACHE_USE_RESOLUTION
+from ansys.tools.installer.download_cache import DownloadCache
+
+
+def _add(cache, tmp_path, url, filename, content):
+    path = tmp_path / filename
+    path.write_bytes(content)
+    return cache.add(url, str(path))
+
+
+def test_lookup_hit(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    path = _add(cache, tmp_path, "https://host/a.tar.xz", "a.tar.xz", b"a" * 10)
+
+    entry = cache.lookup("https://host/a.tar.xz")
+    assert entry["path"] == path
+    assert os.path.basename(path) == "a.tar.xz"
+    assert entry["size"] == 10
+    assert cache.lookup("https://host/missing") is None
+
+    # index survives a restart
+    assert DownloadCache(str(tmp_path / "cache")).lookup("https://host/a.tar.xz")
+
+
+def test_lookup_discards_corrupted_artifact(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    path = _add(cache, tmp_path, "https://host/a.tar.xz", "a.tar.xz", b"a" * 10)
+
+    with open(path, "wb") as f:
+        f.write(b"b" * 10)
+    os.utime(path, (time.time() + 10, time.time() + 10))
+
+    assert cache.lookup("https://host/a.tar.xz") is None
+    assert not os.path.exists(path)
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    now = [time.time()]
+    monkeypatch.setattr(download_cache.time, "time", lambda: now[0])
+    cache = DownloadCache(str(tmp_path / "cache"), max_size=25)
+    _add(cache, tmp_path, "https://host/a", "a", b"a" * 10)
+    _add(cache, tmp_path, "https://host/b", "b", b"b" * 10)
+    now[0] += DOWNLOAD_CACHE_USE_RESOLUTION
+    cache.lookup("https://host/a")  # a is now more recent than b
+    _add(cache, tmp_path, "https://host/c", "c", b"c" * 10)
+
+    assert cache.lookup("https://host/a") is not None
+    assert cache.lookup("https://host/b") is None
+    assert cache.lookup("https://host/c") is not None
+    assert cache.size == 20
+
+
+def test_hits_do_not_rewrite_the_index(tmp_path, monkeypatch):
+    now = [time.time() // DOWNLOAD_CACHE_USE_RESOLUTION * DOWNLOAD_CACHE_USE_RESOLUTION]
+    monkeypatch.setattr(download_cache.time, "time", lambda: now[0])
+    cache = DownloadCache(str(tmp_path / "cache"))
+    _add(cache, tmp_path, "https://host/a", "a", b"a" * 10)
+    writes = []
+    write_index = cache._write_index
+    monkeypatch.setattr(
+        cache, "_write_index", lambda: writes.append(True) or write_index()
+    )
+
+    for _ in range(3):
+        assert cache.lookup("https://host/a") is not None
+        now[0] += DOWNLOAD_CACHE_USE_RESOLUTION / 10
+    assert not writes
+
+    now[0] += DOWNLOAD_CACHE_USE_RESOLUTION
+    assert cache.lookup("https://host/a") is not None
+    assert writes == [True]
+
+
+def test_legacy_downloads_are_removed_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(download_cache, "CACHE_DIR", str(tmp_path))
+    legacy = tmp_path / "Python-3.12.0.tar.xz"
+    legacy.write_bytes(b"legacy")
+
+    DownloadCache()
+    assert not legacy.exists()
+    assert (tmp_path / "downloads" / "index.json").exists()
+
+    legacy.write_bytes(b"new")
+    DownloadCache()
+    assert legacy.exists()
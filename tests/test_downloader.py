@@ -0,0 +1,184 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import re
+import threading
+
+import pytest
+import requests
+
+from ansys.tools.installer.downloader import DownloadCancelled, Downloader
+
+PAYLOAD = os.urandom(1024 * 1024 + 123)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for a file server honoring ``Range`` requests."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.server.requests.append("HEAD")
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.send_header("ETag", self.server.etag)
+        self.end_headers()
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.headers.get("Range"))
+        header = self.headers.get("Range")
+        match = re.match(r"bytes=(\d+)-(\d*)", header or "")
+        if not server.ranges or match is None:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(PAYLOAD)))
+            self.end_headers()
+            self.wfile.write(PAYLOAD)
+            return
+
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else len(PAYLOAD) - 1
+        body = PAYLOAD[start : end + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", server.etag)
+        self.end_headers()
+        if server.fail_from is not None and start >= server.fail_from:
+            # Drop the connection halfway through the body
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.connection.close()
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    httpd.ranges = True
+    httpd.fail_from = None
+    httpd.requests = []
+    httpd.etag = '"payload"'
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_port}/file.bin"
+
+
+def test_download_ranges(server, tmp_path):
+    output = tmp_path / "file.bin"
+    progress = []
+
+    info = Downloader(workers=4, chunk_size=100_000).download(
+        _url(server), str(output), progress=lambda n, t: progress.append((n, t))
+    )
+
+    assert output.read_bytes() == PAYLOAD
+    assert info["size"] == len(PAYLOAD)
+    assert info["etag"] == '"payload"'
+    assert progress[-1] == (len(PAYLOAD), len(PAYLOAD))
+    # probe plus one request per chunk
+    assert len(server.requests) == 1 + 11
+    assert not os.path.exists(f"{output}.part")
+
+
+def test_download_reuses_file_of_same_size(server, tmp_path):
+    output = tmp_path / "file.bin"
+    output.write_bytes(PAYLOAD)
+
+    info = Downloader().download(_url(server), str(output))
+
+    assert info["cached"]
+    assert server.requests == ["bytes=0-0"]
+
+
+def test_download_without_range_support(server, tmp_path):
+    server.ranges = False
+    output = tmp_path / "file.bin"
+
+    info = Downloader(chunk_size=100_000).download(_url(server), str(output))
+
+    assert output.read_bytes() == PAYLOAD
+    assert info["size"] == len(PAYLOAD)
+    assert len(server.requests) == 1
+
+
+def test_download_resumes_from_part_file(server, tmp_path):
+    output = tmp_path / "file.bin"
+    server.fail_from = 500_000
+    downloader = Downloader(workers=1, chunk_size=100_000, retries=0)
+
+    with pytest.raises(requests.exceptions.RequestException):
+        downloader.download(_url(server), str(output))
+    assert os.path.isfile(f"{output}.part")
+    assert os.path.isfile(f"{output}.part.json")
+
+    server.fail_from = None
+    server.requests.clear()
+    downloader.download(_url(server), str(output))
+
+    assert output.read_bytes() == PAYLOAD
+    starts = [int(re.match(r"bytes=(\d+)", r).group(1)) for r in server.requests[1:]]
+    # chunks completed before the failure are not fetched again
+    assert min(starts) >= 500_000
+    assert not os.path.exists(f"{output}.part.json")
+
+
+@pytest.mark.parametrize("ranges", [True, False])
+def test_cancel(server, tmp_path, ranges):
+    server.ranges = ranges
+    output = tmp_path / "file.bin"
+    downloader = Downloader(workers=1, chunk_size=100_000)
+
+    with pytest.raises(DownloadCancelled):
+        downloader.download(
+            _url(server), str(output), progress=lambda n, t: downloader.cancel()
+        )
+    assert not output.exists()
+
+
+def test_revalidate(server):
+    downloader = Downloader()
+
+    assert downloader.revalidate(_url(server), etag='"payload"')
+    assert server.requests == ["HEAD"]
+
+    server.etag = '"changed"'
+    assert not downloader.revalidate(_url(server), etag='"payload"')
+
+
+def test_revalidate_unreachable_server():
+    # keep using the cached file when offline
+    assert Downloader(timeout=1).revalidate("http://127.0.0.1:9/file", etag='"x"')
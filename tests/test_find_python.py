@@ -0,0 +1,71 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import sys
+
+import pytest
+
+from ansys.tools.installer import find_python
+from ansys.tools.installer.find_python import _find_installed_python_linux
+from ansys.tools.installer.inventory import Inventory
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Linux only")
+
+
+def _fake_python(directory, name, version):
+    """Write an executable printing a Python version."""
+    path = directory / name
+    path.write_text(f"#!/bin/sh\necho Python {version}\n")
+    path.chmod(0o755)
+    return path
+
+
+def test_find_installed_python_linux(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    python311 = _fake_python(first, "python3.11", "3.11.4")
+    os.symlink(python311, first / "python3")
+    # shadowed by first/python3
+    _fake_python(second, "python3", "3.9.1")
+    _fake_python(second, "python3.12", "3.12.0")
+    _fake_python(second, "python3.10", "3.11.4")
+    # not executable
+    (second / "python3.8").write_text("")
+    # not a Python name
+    _fake_python(second, "python3-config", "0")
+
+    inventory = Inventory(str(tmp_path / "inventory.json"))
+    monkeypatch.setattr(find_python, "get_inventory", lambda: inventory)
+    monkeypatch.setenv(
+        "PATH", os.pathsep.join([str(first), str(tmp_path / "missing"), str(second)])
+    )
+    pythons = _find_installed_python_linux()
+
+    assert pythons == {
+        str(first / "python3"): ("3.11.4", False),
+        str(second / "python3.10"): ("3.11.4", False),
+        str(second / "python3.12"): ("3.12.0", False),
+    }
@@ -0,0 +1,103 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from ansys.tools.installer.http_client import HttpClient
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Reply ``503`` to the first ``server.failures`` requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        if server.failures:
+            server.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    httpd.requests = 0
+    httpd.failures = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def test_connections_are_reused(server):
+    client = HttpClient()
+    for _ in range(5):
+        assert client.session.get(_url(server)).text == "ok"
+
+    stats = client.stats()[f"http://127.0.0.1:{server.server_address[1]}"]
+    assert stats == {"connections": 1, "requests": 5, "reused": 4}
+    client.close()
+
+
+def test_transient_errors_are_retried(server):
+    server.failures = 2
+    client = HttpClient(backoff_factor=0)
+
+    assert client.session.get(_url(server)).status_code == 200
+    assert server.requests == 3
+
+    server.failures = 5
+    assert client.session.get(_url(server)).status_code == 503
+    client.close()
+
+
+def test_configure():
+    client = HttpClient(proxy="http://proxy:3128", ca_bundle="/tmp/ca.pem")
+    assert client.session.proxies == {
+        "http": "http://proxy:3128",
+        "https": "http://proxy:3128",
+    }
+    assert client.session.verify == "/tmp/ca.pem"
+
+    client.configure()
+    assert client.session.proxies == {}
+    assert client.session.verify.endswith(".pem")
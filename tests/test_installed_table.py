@@ -0,0 +1,146 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import threading
+
+import pytest
+
+from ansys.tools.installer import installed_table
+from ansys.tools.installer.installed_table import DataComboBox
+
+
+@pytest.fixture(autouse=True)
+def fake_metadata(monkeypatch):
+    """Give every environment made-up metadata instead of measuring it."""
+    sizes = {"x1": 1000, "y1": 2000, "x2": 3000}
+
+    def get_venv_metadata(path):
+        size = sizes.get(os.path.basename(path))
+        return {"python_version": "3.11.4", "packages": 3, "size": size}
+
+    monkeypatch.setattr(installed_table, "get_venv_metadata", get_venv_metadata)
+    monkeypatch.setattr(installed_table, "get_inventory", lambda: _NoInventory())
+
+
+class _NoInventory:
+    def save(self):
+        pass
+
+
+def _loaded_combo(qtbot, **kwargs):
+    combo = DataComboBox(**kwargs)
+    qtbot.addWidget(combo)
+    with qtbot.waitSignal(combo.refreshed, timeout=5000):
+        pass
+    return combo
+
+
+def test_refresh_requests_are_coalesced(qtbot, monkeypatch):
+    calls = []
+
+    def discover(interpreters, venvs):
+        calls.append(len(calls))
+        return [(f"/venvs/env{len(calls)}/bin", f"env{len(calls)}", False)]
+
+    monkeypatch.setattr(installed_table, "_discover_entries", discover)
+    combo = _loaded_combo(qtbot, created_venv=True)
+    assert calls == [0]
+
+    with qtbot.waitSignal(combo.refreshed, timeout=5000):
+        for _ in range(5):
+            combo.update()
+
+    assert len(calls) == 2
+    assert combo.active_path == "/venvs/env2/bin"
+    metrics = combo.refresh_metrics
+    assert metrics["requests"] == 5
+    assert metrics["refreshes"] == 1
+    assert metrics["coalesced"] == 4
+    assert metrics["last_latency"] > 0
+
+
+def test_placeholder(qtbot, monkeypatch):
+    monkeypatch.setattr(installed_table, "_discover_entries", lambda *args: [])
+    combo = _loaded_combo(qtbot, created_venv=True)
+    assert combo.active_path == "None"
+
+    combo.add_entry("/venvs/env/bin", "env", False)
+    assert combo.count() == 1
+    assert combo.active_version == "env"
+
+    combo.remove_entry("/venvs/env/bin")
+    assert combo.active_path == "None"
+
+
+def test_filter_keeps_selection(qtbot, monkeypatch):
+    entries = [(f"/venvs/{name}/bin", name, False) for name in ("x1", "y1", "x2")]
+    monkeypatch.setattr(installed_table, "_discover_entries", lambda *args: entries)
+    combo = _loaded_combo(qtbot, created_venv=True)
+    combo.setCurrentIndex(2)
+
+    combo.set_filter_text("x")
+    assert combo.count() == 2
+    assert combo.active_path == "/venvs/x2/bin"
+
+    combo.set_filter_text("y")
+    assert combo.active_path == "/venvs/y1/bin"
+
+    combo.set_filter_text("")
+    assert combo.count() == 3
+    assert combo.active_path == "/venvs/y1/bin"
+
+
+def test_metadata_and_sort(qtbot, monkeypatch):
+    entries = [(f"/venvs/{name}/bin", name, False) for name in ("x1", "y1", "x2")]
+    monkeypatch.setattr(installed_table, "_discover_entries", lambda *args: entries)
+    combo = _loaded_combo(qtbot, created_venv=True)
+    combo.setCurrentIndex(1)
+
+    qtbot.waitUntil(lambda: "3 packages" in combo.itemText(2), timeout=5000)
+    assert combo.active_path == "/venvs/y1/bin"
+
+    combo.sort_by("size")
+    assert [combo.itemData(row)["version"] for row in range(3)] == ["x2", "y1", "x1"]
+    assert combo.active_path == "/venvs/y1/bin"
+
+
+def test_first_load_runs_in_the_background(qtbot, monkeypatch):
+    release = threading.Event()
+    threads = []
+
+    def discover(interpreters, venvs):
+        threads.append(threading.current_thread())
+        release.wait(5)
+        return [("/usr/bin/python3", "Python 3.12.1", False)]
+
+    monkeypatch.setattr(installed_table, "_discover_entries", discover)
+    combo = DataComboBox(installed_python=True)
+    qtbot.addWidget(combo)
+    assert combo.count() == 1
+    assert combo.active_path == "None"
+
+    with qtbot.waitSignal(combo.refreshed, timeout=5000):
+        release.set()
+    assert combo.count() == 1
+    assert combo.active_path == "/usr/bin/python3"
+    assert threading.main_thread() not in threads
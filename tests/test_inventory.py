@@ -0,0 +1,110 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+from ansys.tools.installer.find_python import scan_venv_dir
+from ansys.tools.installer.inventory import Inventory
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_records_follow_mtimes(tmp_path):
+    watched = tmp_path / "watched"
+    watched.mkdir()
+    missing = tmp_path / "missing"
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls), [str(watched), str(missing)]
+
+    inventory = Inventory(str(tmp_path / "inventory.json"))
+    assert inventory.get("key", compute) == 1
+    assert inventory.get("key", compute) == 1
+
+    _bump_mtime(watched)
+    assert inventory.get("key", compute) == 2
+
+    missing.mkdir()
+    assert inventory.get("key", compute) == 3
+    assert inventory.get("key", compute) == 3
+
+
+def test_records_are_persisted(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    watched = str(tmp_path / "watched")
+    os.mkdir(watched)
+    inventory = Inventory(path)
+    inventory.get("kept", lambda: (["a"], [watched]))
+    inventory.get("old", lambda: (["b"], [watched]))
+    inventory._records["old"]["used"] = 0
+    inventory.save()
+
+    inventory = Inventory(path)
+    assert inventory.get("kept", lambda: (None, [])) == ["a"]
+    # unused records are dropped
+    assert inventory.get("old", lambda: (None, [])) is None
+
+
+def test_hits_do_not_rewrite_the_inventory(tmp_path):
+    path = tmp_path / "inventory.json"
+    watched = str(tmp_path / "watched")
+    os.mkdir(watched)
+    inventory = Inventory(str(path))
+    inventory.get("key", lambda: (["a"], [watched]))
+    inventory.save()
+    path.unlink()
+
+    assert inventory.get("key", lambda: (None, [])) == ["a"]
+    inventory.save()
+    assert not path.exists()
+
+    # the time of use is still updated once in a while
+    inventory._records["key"]["used"] = 0
+    inventory.get("key", lambda: (None, []))
+    inventory.save()
+    assert path.exists()
+
+
+def test_scan_venv_dir(tmp_path):
+    (tmp_path / "venv" / "bin").mkdir(parents=True)
+    (tmp_path / "venv" / "bin" / "activate").write_text("")
+    (tmp_path / "conda_env" / "conda-meta").mkdir(parents=True)
+    (tmp_path / "creating" / "bin").mkdir(parents=True)
+
+    inventory = Inventory(str(tmp_path / "inventory" / "inventory.json"))
+
+    def scan():
+        return sorted(
+            inventory.get("venvs", lambda: scan_venv_dir(str(tmp_path), "bin"))
+        )
+
+    assert scan() == ["conda_env", "venv"]
+
+    # an environment completed after the scan is found on the next refresh
+    (tmp_path / "creating" / "bin" / "activate").write_text("")
+    _bump_mtime(tmp_path / "creating" / "bin")
+    assert scan() == ["conda_env", "creating", "venv"]
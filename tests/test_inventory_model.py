@@ -0,0 +1,263 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from PySide6 import QtWidgets
+import pytest
+
+from ansys.tools.installer.inventory_model import (
+    InventoryFilterModel,
+    InventoryModel,
+)
+
+
+def _entries(*names):
+    return [(f"/venvs/{name}/bin", name, False) for name in names]
+
+
+def test_set_entries_keeps_selection(qtbot):
+    model = InventoryModel()
+    combo = QtWidgets.QComboBox()
+    qtbot.addWidget(combo)
+    combo.setModel(model)
+
+    model.set_entries(_entries("a", "b", "c"))
+    combo.setCurrentIndex(1)
+    inserted = []
+    removed = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append(last))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append(first))
+
+    model.set_entries(_entries("b", "d", "c"))
+
+    assert [model.entry(row).version for row in range(model.rowCount())] == [
+        "b",
+        "c",
+        "d",
+    ]
+    assert combo.currentData()["path"] == "/venvs/b/bin"
+    assert inserted == [2]
+    assert removed == [0]
+
+
+def test_changed_entries_are_updated(qtbot):
+    model = InventoryModel()
+    model.set_entries([("/usr/bin/python3", "Python 3.11", True)])
+    changed = []
+    model.dataChanged.connect(lambda first, last: changed.append(first.row()))
+
+    model.set_entries([("/usr/bin/python3", "Python 3.12", True)])
+    model.set_entries([("/usr/bin/python3", "Python 3.12", True)])
+
+    assert changed == [0]
+    assert model.entry(0).label == "Python 3.12  [admin]  —  /usr/bin/python3"
+
+
+def test_placeholder(qtbot):
+    model = InventoryModel(placeholder=True)
+    assert model.rowCount() == 1
+    assert model.entry(0).to_dict() == {
+        "version": "None",
+        "admin": "None",
+        "path": "None",
+    }
+
+    model.add("/venvs/a/bin", "a", False)
+    assert model.rowCount() == 1
+    assert model.entry(0).version == "a"
+
+    model.set_entries([])
+    assert model.entry(0).path == "None"
+
+
+def test_loading_placeholder(qtbot):
+    model = InventoryModel()
+    assert model.rowCount() == 0
+
+    model.set_loading(True)
+    assert model.entry(0).path == "None"
+
+    model.set_entries([])
+    model.set_loading(False)
+    assert model.rowCount() == 0
+
+    model.set_loading(True)
+    model.set_entries(_entries("a"))
+    model.set_loading(False)
+    assert [entry.version for entry in model.entries] == ["a"]
+
+
+def test_large_inventory(qtbot):
+    model = InventoryModel()
+    names = [f"env{i}" for i in range(2000)]
+    model.set_entries(_entries(*names))
+
+    # drop every other environment and add new ones
+    model.set_entries(_entries(*names[::2], *[f"new{i}" for i in range(500)]))
+    assert model.rowCount() == 1500
+    assert model.row_of("/venvs/env2/bin") == 1
+    assert model.row_of("/venvs/new0/bin") == 1000
+
+
+def _paths(model):
+    return [model.data(model.index(row), 3) for row in range(model.rowCount())]
+
+
+def test_filter_fuzzy_terms(qtbot):
+    model = InventoryModel()
+    model.set_entries(
+        [
+            ("/venvs/pydyna-py311/bin", "pydyna-py311", False),
+            ("/venvs/mapdl/bin", "mapdl", False),
+            ("/usr/bin/python3.12", "Python 3.12.1", True),
+        ]
+    )
+    proxy = InventoryFilterModel(model)
+
+    proxy.set_filter_text("PYD311")
+    assert _paths(proxy) == ["/venvs/pydyna-py311/bin"]
+
+    proxy.set_filter_text("3.12")
+    assert _paths(proxy) == ["/usr/bin/python3.12"]
+
+    proxy.set_filter_text("venvs  pl")
+    assert _paths(proxy) == ["/venvs/mapdl/bin"]
+
+    proxy.set_filter_text("zz")
+    assert proxy.rowCount() == 0
+
+    proxy.set_filter_text("")
+    assert proxy.rowCount() == 3
+
+
+def test_filter_follows_source(qtbot):
+    def entries(*names):
+        return [(f"/data/{name}", name, False) for name in names]
+
+    model = InventoryModel()
+    model.set_entries(entries("env1", "other", "env2"))
+    proxy = InventoryFilterModel(model)
+    proxy.set_filter_text("env")
+    inserted = []
+    removed = []
+    proxy.rowsInserted.connect(lambda parent, first, last: inserted.append(first))
+    proxy.rowsRemoved.connect(lambda parent, first, last: removed.append(first))
+
+    model.set_entries(entries("other", "env2", "env3"))
+    assert _paths(proxy) == ["/data/env2", "/data/env3"]
+    assert removed == [0]
+    assert inserted == [1]
+
+    model.add("/opt/x/bin", "env4", False)
+    assert proxy.rowCount() == 3
+    model.remove("/data/env2")
+    assert _paths(proxy) == ["/data/env3", "/opt/x/bin"]
+
+
+def _is_subsequence(term, key):
+    chars = iter(key)
+    return all(char in chars for char in term)
+
+
+def test_filter_narrowing(qtbot):
+    model = InventoryModel()
+    model.set_entries(_entries(*[f"env{i}" for i in range(3000)]))
+    proxy = InventoryFilterModel(model)
+
+    for text in ("1", "12", "123", "123 b", "123 bin", "9", "99", "9"):
+        proxy.set_filter_text(text)
+        expected = [
+            entry.path
+            for entry in model.entries
+            if all(_is_subsequence(term, entry.search_key) for term in text.split())
+        ]
+        assert _paths(proxy) == expected
+
+
+def _metadata(python_version, packages, size):
+    return {"python_version": python_version, "packages": packages, "size": size}
+
+
+def test_set_metadata(qtbot):
+    model = InventoryModel()
+    model.set_entries(_entries("a", "b", "c"))
+    changed = []
+    model.dataChanged.connect(
+        lambda first, last: changed.append((first.row(), last.row()))
+    )
+
+    model.set_metadata(
+        {
+            "/venvs/a/bin": _metadata("3.11.4", 12, 2048),
+            "/venvs/b/bin": _metadata("3.12.1", None, None),
+            "/venvs/missing/bin": _metadata("3.10.0", 1, 1),
+        }
+    )
+    assert changed == [(0, 1)]
+    assert model.entry(0).label == (
+        "a  —  /venvs/a/bin  (Python 3.11.4, 12 packages, 2.0 KB)"
+    )
+    assert model.entry(1).label == "b  —  /venvs/b/bin  (Python 3.12.1)"
+
+    # metadata is kept when the entries are listed again
+    model.set_entries(_entries("a", "b", "c"))
+    assert model.entry(0).metadata["packages"] == 12
+    assert changed == [(0, 1)]
+
+
+@pytest.mark.parametrize(
+    "key, order",
+    [
+        (None, ["b", "a", "c"]),
+        ("name", ["a", "b", "c"]),
+        ("python_version", ["a", "b", "c"]),
+        ("packages", ["b", "a", "c"]),
+        ("size", ["a", "b", "c"]),
+    ],
+)
+def test_sort_by(qtbot, key, order):
+    model = InventoryModel()
+    model.set_entries(_entries("b", "a", "c"))
+    model.set_metadata(
+        {
+            "/venvs/a/bin": _metadata("3.12.1", 10, 3000),
+            "/venvs/b/bin": _metadata("3.9.18", 20, 2000),
+        }
+    )
+    proxy = InventoryFilterModel(model)
+    proxy.sort_by(key)
+    assert [entry.version for entry in proxy._rows] == order
+
+
+def test_sort_follows_metadata(qtbot):
+    model = InventoryModel()
+    model.set_entries(_entries("a", "b"))
+    proxy = InventoryFilterModel(model)
+    proxy.sort_by("size")
+    resets = []
+    proxy.modelReset.connect(lambda: resets.append(True))
+
+    model.set_metadata({"/venvs/b/bin": _metadata(None, None, 100)})
+    assert [entry.version for entry in proxy._rows] == ["b", "a"]
+    assert resets == [True]
+
+    with pytest.raises(ValueError):
+        proxy.sort_by("colour")
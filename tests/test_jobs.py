@@ -0,0 +1,183 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import sys
+import threading
+
+from ansys.tools.installer.commands import Command
+from ansys.tools.installer.job_queue import JobQueue
+from ansys.tools.installer.jobs import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    FINISHED_STATES,
+    Job,
+    JobHistory,
+    JobScheduler,
+)
+
+
+def _finished(*jobs):
+    return lambda: all(job.state in FINISHED_STATES for job in jobs)
+
+
+def test_dependencies_run_in_order(qtbot, tmp_path):
+    scheduler = JobScheduler(history=JobHistory(str(tmp_path / "history.json")))
+    download = Job("download", lambda job: "archive", resource="network")
+    build = Job(
+        "build", lambda job: job.depends_on[0].result + " built", depends_on=[download]
+    )
+    seed = Job(
+        "seed", lambda job: job.depends_on[0].result + " seeded", depends_on=[build]
+    )
+    scheduler.submit(download, build, seed)
+
+    qtbot.waitUntil(_finished(seed))
+    assert seed.state == DONE
+    assert seed.result == "archive built seeded"
+    assert build.started >= download.finished
+
+
+def test_failure_cancels_dependents(qtbot):
+    scheduler = JobScheduler()
+    called = []
+
+    def fail(job):
+        raise ValueError("boom")
+
+    download = Job("download", fail, resource="network")
+    build = Job("build", called.append, depends_on=[download])
+    scheduler.submit(download, build)
+
+    qtbot.waitUntil(_finished(download, build))
+    assert download.state == FAILED
+    assert isinstance(download.error, ValueError)
+    assert build.state == CANCELLED
+    assert called == []
+
+
+def test_resource_limits(qtbot):
+    scheduler = JobScheduler(limits={"network": 3, "cpu": 1})
+    lock = threading.Lock()
+    running = {"network": 0, "cpu": 0}
+    peaks = {"network": 0, "cpu": 0}
+    release = threading.Event()
+
+    def work(job):
+        with lock:
+            running[job.resource] += 1
+            peaks[job.resource] = max(peaks[job.resource], running[job.resource])
+        release.wait(0.2)
+        with lock:
+            running[job.resource] -= 1
+
+    jobs = [Job(f"download {i}", work, resource="network") for i in range(6)]
+    jobs += [Job(f"build {i}", work, resource="cpu") for i in range(3)]
+    scheduler.submit(*jobs)
+
+    qtbot.waitUntil(_finished(*jobs), timeout=10000)
+    assert peaks == {"network": 3, "cpu": 1}
+    assert all(job.state == DONE for job in jobs)
+
+
+def test_retries(qtbot):
+    scheduler = JobScheduler(retry_delay=0.01)
+    attempts = []
+
+    def flaky(job):
+        attempts.append(job.attempts)
+        if len(attempts) < 3:
+            raise OSError("connection reset")
+        return "ok"
+
+    job = Job("download", flaky, resource="network", retries=2)
+    scheduler.submit(job)
+
+    qtbot.waitUntil(_finished(job))
+    assert job.state == DONE
+    assert job.result == "ok"
+    assert attempts == [1, 2, 3]
+
+
+def test_cancel_running_command(qtbot):
+    scheduler = JobScheduler()
+    started = threading.Event()
+
+    def sleep(job):
+        command = Command([sys.executable, "-c", "import time; time.sleep(60)"])
+        command.start()
+        started.set()
+        return command.wait()
+
+    job = Job("sleep", sleep)
+    after = Job("after", lambda job: None, depends_on=[job])
+    scheduler.submit(job, after)
+    assert started.wait(10)
+
+    scheduler.cancel(job)
+    qtbot.waitUntil(_finished(job, after), timeout=15000)
+    assert job.state == CANCELLED
+    assert job.result is None
+    assert after.state == CANCELLED
+
+
+def test_command_output(qtbot):
+    scheduler = JobScheduler()
+    queue = JobQueue(scheduler=scheduler)
+    qtbot.addWidget(queue)
+    lines = []
+    scheduler.job_output.connect(lambda job, count, line: lines.append(line))
+    script = "import sys; print('first'); sys.stdout.flush(); print('second')"
+
+    job = Job(
+        "print", lambda job: Command([sys.executable, "-c", script]).start().wait()
+    )
+    scheduler.submit(job)
+    queue.table.selectRow(0)
+    qtbot.waitUntil(_finished(job))
+    qtbot.waitUntil(lambda: len(lines) == 2)
+    assert job.output == (["first\n", "second\n"], 2)
+    assert queue.output_view.toPlainText() == "first\nsecond"
+
+    queue.show_output(None)
+    assert queue.output_view.toPlainText() == ""
+    queue.show_output(job)
+    assert queue.output_view.toPlainText() == "first\nsecond"
+
+
+def test_history(qtbot, tmp_path):
+    path = tmp_path / "history.json"
+    scheduler = JobScheduler(history=JobHistory(str(path)))
+    jobs = [Job(f"venv {i}", lambda job: None, kind="venv") for i in range(3)]
+    scheduler.submit(*jobs)
+    qtbot.waitUntil(_finished(*jobs))
+
+    entries = json.loads(path.read_text())
+    assert [entry["name"] for entry in entries] == ["venv 0", "venv 1", "venv 2"]
+    assert scheduler.expected_duration(jobs[0]) is not None
+
+    history = JobHistory(str(path), max_entries=2)
+    assert history.average_duration("venv") is not None
+    assert history.average_duration("build") is None
+    history.record(jobs[0])
+    assert len(json.loads(path.read_text())) == 2
@@ -0,0 +1,57 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+import pytest
+
+from ansys.tools.installer.json_stream import iter_member_strings
+
+
+def _chunks(data, size=5):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+def test_object_keys_from_chunks():
+    doc = {
+        "info": {"description": 'mentions "releases": {"9.9": []} ' * 50},
+        "last_serial": 123456,
+        "releases": {"0.1.0": [{"size": 1}], "0.2.0": [], "1.0.0rc1": []},
+        "urls": [],
+    }
+    data = json.dumps(doc).encode()
+    assert list(iter_member_strings(_chunks(data), "releases")) == [
+        "0.1.0",
+        "0.2.0",
+        "1.0.0rc1",
+    ]
+
+
+def test_array_items_stop_reading_early():
+    data = b'{"meta": {"api-version": "1.1"}, "versions": ["1.0", "2.0"], "files": ['
+    # the truncated rest of the document is never read
+    assert list(iter_member_strings(_chunks(data), "versions")) == ["1.0", "2.0"]
+
+
+def test_missing_member():
+    with pytest.raises(KeyError):
+        list(iter_member_strings([b'{"files": []}'], "versions"))
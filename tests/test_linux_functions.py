@@ -20,12 +20,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import pytest
+
+from ansys.tools.installer import linux_functions
+from ansys.tools.installer.jobs import DONE, JobScheduler
 from ansys.tools.installer.linux_functions import (
     get_conda_url_and_filename,
     get_vanilla_url_and_filename,
     run_linux_command,
     run_linux_command_conda,
 )
+from ansys.tools.installer.package_managers import PackageManagerTracker
 
 
 def test_get_vanilla_url_and_filename():
@@ -52,3 +57,38 @@ def test_run_linux_command_accepts_working_dir():
 
     sig_conda = inspect.signature(run_linux_command_conda)
     assert "working_dir" in sig_conda.parameters
+
+
+@pytest.mark.parametrize("current", [True, False])
+def test_run_linux_command_upgrades_in_background(
+    qtbot, tmp_path, monkeypatch, current
+):
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=3600)
+    python = tmp_path / "python3"
+    python.write_text("#!/bin/sh\n")
+    python.chmod(0o755)
+    if current:
+        tracker.mark_upgraded(str(python))
+    scheduler = JobScheduler()
+    commands = []
+    monkeypatch.setattr(linux_functions, "get_package_manager_tracker", lambda: tracker)
+    monkeypatch.setattr(linux_functions, "get_job_scheduler", lambda: scheduler)
+    monkeypatch.setattr(
+        linux_functions,
+        "execute_linux_command",
+        lambda command, **kwargs: commands.append(command),
+    )
+
+    run_linux_command(str(python), "uv pip list")
+
+    if current:
+        assert not scheduler.jobs
+        assert len(commands) == 1
+    else:
+        # The window is not blocked by the upgrade
+        assert not commands
+        upgrade, terminal = scheduler.jobs
+        assert terminal.depends_on == [upgrade]
+        qtbot.waitUntil(lambda: terminal.state == DONE)
+        assert len(commands) == 1
+        assert tracker.is_current(str(python))
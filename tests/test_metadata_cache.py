@@ -0,0 +1,120 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from ansys.tools.installer.metadata_cache import MetadataCache
+
+
+class FakePyPIHandler(BaseHTTPRequestHandler):
+    """Serve ``/pypi/<pkg>/json`` documents with ETag revalidation."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"releases": {v: [] for v in server.versions}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", server.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def pypi():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakePyPIHandler)
+    httpd.requests = []
+    httpd.versions = ["0.1.0", "0.2.0"]
+    httpd.etag = '"v1"'
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(pypi):
+    return f"http://127.0.0.1:{pypi.server_port}/pypi/pyansys/json"
+
+
+def _releases(response):
+    return list(response.json()["releases"])
+
+
+def test_fresh_record_is_served_from_disk(pypi, tmp_path):
+    cache = MetadataCache(str(tmp_path), ttl=60)
+    assert cache.get(_url(pypi), _releases) == ["0.1.0", "0.2.0"]
+
+    # a new instance, as after a restart, does not hit the network
+    pypi.versions.append("0.3.0")
+    assert MetadataCache(str(tmp_path), ttl=60).get(_url(pypi), _releases) == [
+        "0.1.0",
+        "0.2.0",
+    ]
+    assert len(pypi.requests) == 1
+
+
+def test_expired_record_is_revalidated(pypi, tmp_path):
+    cache = MetadataCache(str(tmp_path), ttl=0, stale_ttl=0)
+    cache.get(_url(pypi), _releases)
+    assert cache.get(_url(pypi), _releases) == ["0.1.0", "0.2.0"]
+    assert pypi.requests[-1][1] == '"v1"'
+
+
+def test_stale_record_is_refreshed_in_background(pypi, tmp_path):
+    cache = MetadataCache(str(tmp_path), ttl=0, stale_ttl=60)
+    cache.get(_url(pypi), _releases)
+
+    pypi.versions.append("0.3.0")
+    pypi.etag = '"v2"'
+    refreshed = threading.Event()
+    data = cache.get(_url(pypi), _releases, on_refresh=lambda _: refreshed.set())
+
+    # stale data is returned immediately and refreshed afterwards
+    assert data == ["0.1.0", "0.2.0"]
+    assert refreshed.wait(5)
+    cache.ttl = 60
+    assert cache.get(_url(pypi), _releases) == ["0.1.0", "0.2.0", "0.3.0"]
+
+
+def test_cached_data_used_when_offline(pypi, tmp_path):
+    cache = MetadataCache(str(tmp_path), ttl=0, stale_ttl=0, timeout=1)
+    url = _url(pypi)
+    cache.get(url, _releases)
+    pypi.shutdown()
+    pypi.server_close()
+    time.sleep(0.1)
+
+    assert cache.get(url, _releases) == ["0.1.0", "0.2.0"]
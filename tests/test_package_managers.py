@@ -0,0 +1,132 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import threading
+
+import pytest
+
+from ansys.tools.installer import windows_functions
+from ansys.tools.installer.package_managers import PackageManagerTracker
+
+
+def _fake_python(tmp_path, returncode=0):
+    """Create an interpreter logging its calls."""
+    python = tmp_path / "python"
+    python.write_text(
+        f'#!/bin/sh\necho "$@" >> "{tmp_path / "calls.log"}"\nexit {returncode}\n'
+    )
+    python.chmod(0o755)
+    return str(python)
+
+
+def _calls(tmp_path):
+    path = tmp_path / "calls.log"
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def test_upgrade_is_skipped_when_current(tmp_path):
+    python = _fake_python(tmp_path)
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=3600)
+
+    assert not tracker.is_current(python)
+    assert tracker.upgrade(python)
+    assert tracker.upgrade(python)
+    assert _calls(tmp_path) == ["-m pip install -U pip uv"]
+
+    # Persisted across sessions
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=3600)
+    assert tracker.is_current(python)
+
+    assert tracker.upgrade(python, force=True)
+    assert len(_calls(tmp_path)) == 2
+
+
+def test_upgrade_expires(tmp_path):
+    python = _fake_python(tmp_path)
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=0)
+
+    tracker.upgrade(python)
+    tracker.upgrade(python)
+    assert len(_calls(tmp_path)) == 2
+
+
+def test_reinstalled_interpreter_is_upgraded(tmp_path):
+    python = _fake_python(tmp_path)
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=3600)
+    tracker.mark_upgraded(python)
+    assert tracker.is_current(python)
+
+    stat = os.stat(python)
+    os.utime(python, (stat.st_atime, stat.st_mtime + 10))
+    assert not tracker.is_current(python)
+
+    tracker.mark_upgraded(python)
+    tracker.forget(python)
+    assert not tracker.is_current(python)
+
+
+def test_failed_upgrade_is_not_recorded(tmp_path):
+    python = _fake_python(tmp_path, returncode=1)
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=3600)
+
+    assert not tracker.upgrade(python)
+    assert not tracker.is_current(python)
+    assert not tracker.upgrade(str(tmp_path / "missing"))
+
+
+def test_concurrent_upgrades_run_once(tmp_path):
+    python = _fake_python(tmp_path)
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=3600)
+
+    threads = [
+        threading.Thread(target=tracker.upgrade, args=(python,)) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert _calls(tmp_path) == ["-m pip install -U pip uv"]
+
+
+@pytest.mark.parametrize("returncode", [0, 1])
+def test_windows_upgrade_records_success_only(tmp_path, monkeypatch, returncode):
+    python = _fake_python(tmp_path)
+    tracker = PackageManagerTracker(str(tmp_path / "upgrades.json"), max_age=3600)
+    commands = []
+
+    def call(command, **kwargs):
+        commands.append(command)
+        return returncode
+
+    monkeypatch.setattr(
+        windows_functions, "get_package_manager_tracker", lambda: tracker
+    )
+    monkeypatch.setattr(windows_functions.subprocess, "call", call)
+
+    upgraded = windows_functions.upgrade_package_managers_windows(python)
+    assert upgraded == (not returncode)
+    assert tracker.is_current(python) == (not returncode)
+    assert "cmd /C" in commands[0]
+
+    windows_functions.upgrade_package_managers_windows(python)
+    assert len(commands) == (2 if returncode else 1)
@@ -0,0 +1,255 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import shutil
+import subprocess
+import tarfile
+
+import pytest
+
+from ansys.tools.installer import python_build
+from ansys.tools.installer.python_build import PythonBuild, build_jobs, c_compiler
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("make") is None or os.name != "posix",
+    reason="Requires make on a posix system",
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Build in a temporary cache directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setattr(python_build, "CACHE_DIR", str(path))
+    return path
+
+
+_CONFIGURE = """#!/bin/sh
+for arg in "$@"; do
+  case "$arg" in
+    --prefix=*) prefix=${arg#--prefix=} ;;
+    --cache-file=*) cache=${arg#--cache-file=} ;;
+  esac
+done
+printf %s "checking for gcc... "
+echo gcc
+printf %s "checking for make... "
+echo make
+if [ -n "$cache" ]; then
+  grep -q stale "$cache" 2>/dev/null && exit 1
+  echo "ac_cv_prog_cc=$CC" > "$cache"
+fi
+echo "prefix=$prefix" > Makefile.conf
+echo "options=$*" >> Makefile.conf
+cp Makefile.in Makefile
+"""
+
+# Counts three hits and a miss each time the statistics are printed
+_CCACHE = """#!/bin/sh
+if [ "$1" = "--print-stats" ]; then
+  calls=$(cat "$CCACHE_DIR/calls" 2>/dev/null || echo 0)
+  printf "direct_cache_hit\\t%s\\n" $((calls * 2))
+  printf "preprocessed_cache_hit\\t%s\\n" "$calls"
+  printf "cache_miss\\t%s\\n" "$calls"
+  echo $((calls + 1)) > "$CCACHE_DIR/calls"
+  exit 0
+fi
+exec "$@"
+"""
+
+_MAKEFILE = """include Makefile.conf
+
+all:
+\t@echo "jobs $(MAKEFLAGS)"
+\t@echo "gcc -c -O2 -o Objects/a.o Objects/a.c"
+\t@echo "gcc -c -O2 -o Python/b.o Python/b.c"
+\t@$(FAIL)
+
+install:
+\tmkdir -p $(prefix)/bin
+\tcp python.sh $(prefix)/bin/python3
+
+clean:
+\t@echo cleaned
+"""
+
+
+def _archive(tmp_path, fail=False):
+    source = tmp_path / "src" / "Python-3.99.0"
+    for name in ("Objects", "Python"):
+        (source / name).mkdir(parents=True)
+    (source / "Objects" / "a.c").write_text("")
+    (source / "Python" / "b.c").write_text("")
+    (source / "configure").write_text(_CONFIGURE)
+    (source / "configure").chmod(0o755)
+    makefile = _MAKEFILE.replace("$(FAIL)", "exit 3" if fail else "true")
+    (source / "Makefile.in").write_text(makefile)
+    (source / "python.sh").write_text("#!/bin/sh\n")
+    archive = tmp_path / "Python-3.99.0.tar.xz"
+    with tarfile.open(archive, "w:xz") as tar:
+        tar.add(source, arcname=source.name)
+    shutil.rmtree(tmp_path / "src")
+    return str(archive)
+
+
+def test_build_jobs():
+    assert build_jobs() >= 1
+
+
+def test_build(tmp_path):
+    archive = _archive(tmp_path)
+    prefix = str(tmp_path / "python-3.99.0")
+    progress = []
+    build = PythonBuild(
+        archive,
+        prefix,
+        profile="optimized",
+        jobs=3,
+        progress=lambda stage, percent: progress.append((stage, percent)),
+    )
+    timings = build.run()
+
+    assert list(timings) == ["extract", "configure", "build", "install", "total"]
+    assert os.path.isfile(os.path.join(prefix, "bin", "python"))
+    with open(build.log_path) as f:
+        log = f.read()
+    assert "--enable-optimizations" in log
+    assert "$ make -j3" in log
+
+    percents = [percent for _, percent in progress]
+    assert percents == sorted(percents)
+    assert percents[-1] == 100
+    # one step per configure check, and per compiled file out of the two
+    # expected for each of the instrumented and optimized builds
+    assert ("configure", 12) in progress
+    assert ("build", 37) in progress
+
+    # building again cleans the tree built before
+    timings = PythonBuild(archive, prefix).run()
+    assert "clean" in timings
+
+
+def test_build_tree_is_outside_the_archive_directory(tmp_path, cache_dir):
+    archive = _archive(tmp_path / "downloads")
+    build = PythonBuild(archive, str(tmp_path / "python"))
+    build.run()
+
+    assert build.source_dir == str(cache_dir / "build" / "Python-3.99.0")
+    assert os.listdir(tmp_path / "downloads") == ["Python-3.99.0.tar.xz"]
+    build.remove_tree()
+    assert os.listdir(cache_dir / "build") == ["Python-3.99.0-build.log"]
+
+
+def test_build_failure(tmp_path):
+    build = PythonBuild(_archive(tmp_path, fail=True), str(tmp_path / "python"))
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        build.run()
+    assert excinfo.value.returncode == 2
+    assert "Python/b.c" in excinfo.value.output
+    assert "install" not in build.timings
+
+
+def test_unknown_profile(tmp_path):
+    with pytest.raises(ValueError, match="standard"):
+        PythonBuild(str(tmp_path / "Python-3.99.0.tar.xz"), "", profile="fastest")
+
+
+def test_incremental_build(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "ccache").write_text(_CCACHE)
+    (bin_dir / "ccache").chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("CC", "gcc")
+    cache_dir = tmp_path / "cache"
+
+    build = PythonBuild(
+        _archive(tmp_path),
+        str(tmp_path / "python"),
+        incremental=True,
+        cache_dir=str(cache_dir),
+    )
+    build.run()
+    assert build.cache_stats == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+    configure_cache = cache_dir / "configure" / "3.99-standard.cache"
+    assert configure_cache.read_text() == f"ac_cv_prog_cc={bin_dir}/ccache gcc\n"
+    with open(build.log_path) as f:
+        assert "ccache hit rate 75.0% (3 hits, 1 misses)" in f.read()
+
+    # results cached by another version of the series which do not apply
+    configure_cache.write_text("stale")
+    build = PythonBuild(
+        _archive(tmp_path / "next"),
+        str(tmp_path / "python"),
+        incremental=True,
+        cache_dir=str(cache_dir),
+    )
+    build.run()
+    assert "stale" not in configure_cache.read_text()
+
+
+def test_incremental_build_without_ccache(tmp_path, monkeypatch):
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    build = PythonBuild(
+        _archive(tmp_path),
+        str(tmp_path / "python"),
+        incremental=True,
+        cache_dir=str(tmp_path / "cache"),
+    )
+    build.run()
+    assert build.cache_stats is None
+    assert (tmp_path / "cache" / "configure" / "3.99-standard.cache").exists()
+
+
+@pytest.mark.parametrize("ccache", [True, False])
+def test_default_compiler(tmp_path, monkeypatch, ccache):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    if ccache:
+        (bin_dir / "ccache").write_text(_CCACHE)
+        (bin_dir / "ccache").chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    else:
+        monkeypatch.setattr(shutil, "which", lambda name: None)
+    monkeypatch.delenv("CC", raising=False)
+    assert c_compiler() == "cc"
+
+    build = PythonBuild(
+        _archive(tmp_path),
+        str(tmp_path / "python"),
+        incremental=True,
+        cache_dir=str(tmp_path / "cache"),
+    )
+    build.run()
+    # the compiler of the cache key of the build
+    wrapper = f"{bin_dir}/ccache " if ccache else ""
+    configure_cache = tmp_path / "cache" / "configure" / "3.99-standard.cache"
+    assert configure_cache.read_text() == f"ac_cv_prog_cc={wrapper}cc\n"
+
+
+def test_cancelled_build(tmp_path):
+    build = PythonBuild(_archive(tmp_path), str(tmp_path / "python"))
+    build.cancel()
+    with pytest.raises(subprocess.CalledProcessError):
+        build.run()
+    assert not build.timings
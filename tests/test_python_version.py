@@ -0,0 +1,112 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import sys
+
+import pytest
+
+from ansys.tools.installer.python_version import get_python_version
+
+
+def _touch(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def test_pyvenv_cfg(tmp_path):
+    _touch(tmp_path / "venv" / "pyvenv.cfg", "home = /usr/bin\nversion = 3.11.4\n")
+    exe = _touch(tmp_path / "venv" / "bin" / "python")
+    assert get_python_version(str(exe), fallback=False) == "3.11.4"
+
+    # virtualenv and uv
+    _touch(tmp_path / "uv" / "pyvenv.cfg", "version_info = 3.12.1.final.0\n")
+    exe = _touch(tmp_path / "uv" / "bin" / "python")
+    assert get_python_version(str(exe), fallback=False) == "3.12.1"
+
+
+def test_conda_meta(tmp_path):
+    _touch(tmp_path / "conda-meta" / "python-dateutil-2.8.2-pyhd3eb1b0_0.json")
+    _touch(tmp_path / "conda-meta" / "python-3.10.13-h955ad1f_0.json")
+    exe = _touch(tmp_path / "bin" / "python")
+    assert get_python_version(str(exe), fallback=False) == "3.10.13"
+
+
+def test_patchlevel(tmp_path):
+    for version in ("3.10.12", "3.12.3"):
+        minor = version.rsplit(".", 1)[0]
+        _touch(
+            tmp_path / "include" / f"python{minor}" / "patchlevel.h",
+            f'#define PY_MINOR_VERSION 0\n#define PY_VERSION "{version}"\n',
+        )
+    exe = _touch(tmp_path / "bin" / "python3.12")
+    assert get_python_version(str(exe), fallback=False) == "3.12.3"
+
+    # ambiguous without the version in the executable name
+    exe = _touch(tmp_path / "bin" / "python3")
+    assert get_python_version(str(exe), fallback=False) is None
+
+
+def test_abi_suffix_patchlevel(tmp_path):
+    _touch(
+        tmp_path / "include" / "python3.7m" / "patchlevel.h",
+        '#define PY_VERSION "3.7.16"\n',
+    )
+    _touch(tmp_path / "lib" / "python3.7" / "os.py")
+    exe = _touch(tmp_path / "bin" / "python3.7")
+    assert get_python_version(str(exe), fallback=False) == "3.7.16"
+
+
+def test_windows_patchlevel(tmp_path):
+    _touch(tmp_path / "include" / "patchlevel.h", '#define PY_VERSION "3.10.11"\n')
+    exe = _touch(tmp_path / "python.exe")
+    assert get_python_version(str(exe), fallback=False) == "3.10.11"
+
+
+def test_stdlib_version(tmp_path):
+    _touch(tmp_path / "lib" / "python3.11" / "os.py")
+    # not a standard library
+    (tmp_path / "lib" / "python3").mkdir()
+    exe = _touch(tmp_path / "bin" / "python3")
+    assert get_python_version(str(exe), fallback=False) == "3.11"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires a shell script")
+def test_fallback(tmp_path):
+    exe = _touch(tmp_path / "bin" / "python3", "#!/bin/sh\necho Python 3.9.18\n")
+    os.chmod(exe, 0o755)
+    assert get_python_version(str(exe), fallback=False) is None
+    assert get_python_version(str(exe)) == "3.9.18"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires a shell script")
+def test_stdlib_version_falls_back(tmp_path):
+    _touch(tmp_path / "lib" / "python3.9" / "os.py")
+    exe = _touch(tmp_path / "bin" / "python3", "#!/bin/sh\necho Python 3.9.18\n")
+    os.chmod(exe, 0o755)
+    assert get_python_version(str(exe), fallback=False) == "3.9"
+    assert get_python_version(str(exe)) == "3.9.18"
+
+    # only X.Y when the interpreter cannot be run
+    os.chmod(exe, 0o644)
+    assert get_python_version(str(exe)) == "3.9"
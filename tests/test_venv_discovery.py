@@ -0,0 +1,137 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import sys
+
+import pytest
+
+from ansys.tools.installer import venv_discovery
+from ansys.tools.installer.inventory import Inventory
+from ansys.tools.installer.venv_discovery import discover_venvs, scan_root
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Linux only")
+
+
+def _venv(path, version="3.11.4"):
+    """Create the files identifying a virtual environment."""
+    (path / "bin").mkdir(parents=True)
+    (path / "bin" / "activate").write_text("")
+    (path / "pyvenv.cfg").write_text(f"home = /usr/bin\nversion = {version}\n")
+    return path
+
+
+def _conda(path):
+    """Create the files identifying a conda environment."""
+    (path / "conda-meta").mkdir(parents=True)
+    (path / "conda-meta" / "python-3.10.12-h1234_0.json").write_text("{}")
+    return path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "venvs"
+    _venv(root / "env1")
+    _conda(root / "conda1")
+    _conda(root / "miniforge")
+    (root / "miniforge" / "condabin").mkdir()
+    _venv(root / "project" / ".venv", "3.12.1")
+    _venv(root / "project" / "sub" / "env3")
+    _venv(root / "project" / "node_modules" / "env4")
+    (root / "incomplete" / "bin").mkdir(parents=True)
+    return root
+
+
+def test_scan_depth(tree):
+    names = {
+        depth: [r.name for r in scan_root(str(tree), depth)[0]] for depth in (1, 2, 3)
+    }
+    assert names[1] == ["conda1", "env1"]
+    assert names[2] == ["conda1", "env1", os.path.join("project", ".venv")]
+    assert names[3] == [
+        "conda1",
+        "env1",
+        os.path.join("project", ".venv"),
+        os.path.join("project", "sub", "env3"),
+    ]
+
+
+def test_scan_watch(tree):
+    records, watch = scan_root(str(tree), 2)
+    assert str(tree / "incomplete") in watch
+    assert str(tree / "incomplete" / "bin") in watch
+    assert str(tree / "project" / "sub") in watch
+    assert str(tree / "env1") not in watch
+
+
+def test_records(tree):
+    records = {r.name: r for r in scan_root(str(tree), 2, compute_size=True)[0]}
+
+    venv = records[os.path.join("project", ".venv")]
+    assert venv.kind == "venv"
+    assert venv.path == str(tree / "project" / ".venv")
+    assert venv.scripts == str(tree / "project" / ".venv" / "bin")
+    assert venv.python_version == "3.12.1"
+    assert venv.last_used >= os.stat(tree / "project" / ".venv" / "pyvenv.cfg").st_mtime
+    assert venv.size > 0
+
+    conda = records["conda1"]
+    assert conda.kind == "conda"
+    assert conda.python_version == "3.10.12"
+    assert conda.to_dict() == type(conda).from_dict(conda.to_dict()).to_dict()
+
+
+def test_discover_ignore_and_roots(tree, tmp_path):
+    other = tmp_path / "other"
+    _venv(other / "env5")
+
+    records = discover_venvs(
+        [str(tree), str(other), str(tree)],
+        max_depth=3,
+        ignore={str(tree): ["sub", "conda*"]},
+    )
+    assert [r.name for r in records] == [
+        "env1",
+        os.path.join("project", ".venv"),
+        "env5",
+    ]
+
+
+def test_discover_inventory(tree, tmp_path, monkeypatch):
+    inventory = Inventory(str(tmp_path / "inventory.json"))
+    calls = []
+    scan = venv_discovery.scan_root
+
+    def counting_scan(*args, **kwargs):
+        calls.append(args[0])
+        return scan(*args, **kwargs)
+
+    monkeypatch.setattr(venv_discovery, "scan_root", counting_scan)
+    first = discover_venvs([str(tree)], 2, inventory=inventory)
+    second = discover_venvs([str(tree)], 2, inventory=inventory)
+    assert [r.to_dict() for r in first] == [r.to_dict() for r in second]
+    assert len(calls) == 1
+
+    _venv(tree / "project" / "env6")
+    third = discover_venvs([str(tree)], 2, inventory=inventory)
+    assert len(calls) == 2
+    assert os.path.join("project", "env6") in [r.name for r in third]
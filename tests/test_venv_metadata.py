@@ -0,0 +1,86 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys
+
+import pytest
+
+from ansys.tools.installer.inventory import Inventory
+from ansys.tools.installer.venv_metadata import (
+    collect_venv_metadata,
+    format_size,
+    get_venv_metadata,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Linux only")
+
+
+@pytest.fixture
+def venv(tmp_path):
+    path = tmp_path / "env"
+    (path / "bin").mkdir(parents=True)
+    (path / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.11.4\n")
+    site_packages = path / "lib" / "python3.11" / "site-packages"
+    for name in ("numpy-1.26.4", "scipy-1.12.0", "pip-24.0"):
+        (site_packages / f"{name}.dist-info").mkdir(parents=True)
+        (site_packages / f"{name}.dist-info" / "RECORD").write_text("x" * 5000)
+    (site_packages / "numpy").mkdir()
+    # lib64 links to lib in environments created by venv
+    (path / "lib64").symlink_to("lib")
+    return path
+
+
+def test_collect_venv_metadata(venv):
+    metadata, watch = collect_venv_metadata(str(venv))
+    assert metadata["python_version"] == "3.11.4"
+    assert metadata["packages"] == 3
+    assert metadata["size"] >= 15000
+    assert str(venv / "lib" / "python3.11" / "site-packages") in watch
+
+
+def test_missing_venv(tmp_path):
+    metadata, watch = collect_venv_metadata(str(tmp_path / "missing"))
+    assert metadata == {"python_version": None, "packages": None, "size": None}
+
+
+def test_metadata_is_cached(venv, tmp_path, monkeypatch):
+    inventory = Inventory(str(tmp_path / "inventory.json"))
+    assert get_venv_metadata(str(venv), inventory)["packages"] == 3
+
+    monkeypatch.setattr(
+        "ansys.tools.installer.venv_metadata.collect_venv_metadata",
+        lambda path: pytest.fail("metadata computed again"),
+    )
+    assert get_venv_metadata(str(venv), inventory)["packages"] == 3
+
+    monkeypatch.undo()
+    site_packages = venv / "lib" / "python3.11" / "site-packages"
+    (site_packages / "pandas-2.2.0.dist-info").mkdir()
+    assert get_venv_metadata(str(venv), inventory)["packages"] == 4
+
+
+@pytest.mark.parametrize(
+    "size, text",
+    [(0, "0 B"), (1023, "1023 B"), (1536, "1.5 KB"), (3 * 1024**3, "3.0 GB")],
+)
+def test_format_size(size, text):
+    assert format_size(size) == text
@@ -0,0 +1,218 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import shutil
+import threading
+
+import pytest
+
+from ansys.tools.installer import configure_json, find_python
+from ansys.tools.installer import watcher as watcher_module
+from ansys.tools.installer.constants import (
+    PREFETCH_METADATA,
+    VENV_SEARCH_DEPTH,
+    VENV_SEARCH_PATH,
+)
+from ansys.tools.installer.watcher import InventoryWatcher
+
+
+def _create_venv(venv_dir, name):
+    scripts = os.path.join(venv_dir, name, "bin")
+    os.makedirs(scripts)
+    with open(os.path.join(scripts, "activate"), "w"):
+        pass
+    return scripts
+
+
+@pytest.mark.parametrize("poll_only", [False, True])
+def test_venvs_added_and_removed(qtbot, tmp_path, poll_only):
+    venv_dir = str(tmp_path / "venvs")
+    os.mkdir(venv_dir)
+    _create_venv(venv_dir, "existing")
+    watcher = InventoryWatcher(
+        search_paths=[venv_dir],
+        interpreters_path=None,
+        poll_interval=50,
+        poll_only=poll_only,
+    )
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+    if poll_only:
+        assert not watcher.watched_paths
+
+    with qtbot.waitSignal(watcher.venv_added, timeout=5000) as blocker:
+        scripts = _create_venv(venv_dir, "new")
+    assert blocker.args == [scripts, "new", False]
+
+    with qtbot.waitSignal(watcher.venv_removed, timeout=5000) as blocker:
+        shutil.rmtree(os.path.join(venv_dir, "existing"))
+    assert blocker.args == [os.path.join(venv_dir, "existing", "bin")]
+
+
+def test_incomplete_venv_is_watched(qtbot, tmp_path):
+    venv_dir = str(tmp_path / "venvs")
+    os.makedirs(os.path.join(venv_dir, "creating", "bin"))
+    watcher = InventoryWatcher(search_paths=[venv_dir], interpreters_path=None)
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+    assert os.path.join(venv_dir, "creating", "bin") in watcher.watched_paths
+
+    with qtbot.waitSignal(watcher.venv_added, timeout=5000):
+        with open(os.path.join(venv_dir, "creating", "bin", "activate"), "w"):
+            pass
+
+
+def test_missing_search_path_is_polled(qtbot, tmp_path):
+    venv_dir = str(tmp_path / "venvs")
+    watcher = InventoryWatcher(
+        search_paths=[venv_dir], interpreters_path=None, poll_interval=50
+    )
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+    assert watcher.polled_paths == [venv_dir]
+
+    with qtbot.waitSignal(watcher.venv_added, timeout=5000):
+        _create_venv(venv_dir, "first")
+    assert venv_dir in watcher.watched_paths
+
+
+def test_reload(qtbot, tmp_path):
+    first = str(tmp_path / "first")
+    second = str(tmp_path / "second")
+    _create_venv(first, "a")
+    _create_venv(second, "b")
+    watcher = InventoryWatcher(search_paths=[first], interpreters_path=None)
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+
+    with qtbot.waitSignals([watcher.venv_added, watcher.venv_removed]):
+        watcher.reload([second])
+
+
+def test_reload_depth(qtbot, tmp_path):
+    venv_dir = str(tmp_path / "venvs")
+    nested = os.path.join("project", "nested")
+    _create_venv(venv_dir, nested)
+    watcher = InventoryWatcher(search_paths=[venv_dir], interpreters_path=None)
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+    watcher.reload([venv_dir], max_depth=1, ignore={})
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+
+    with qtbot.waitSignal(watcher.venv_added, timeout=5000) as blocker:
+        watcher.reload([venv_dir], max_depth=2, ignore={})
+    assert blocker.args == [os.path.join(venv_dir, nested, "bin"), nested, False]
+
+    with qtbot.waitSignal(watcher.venv_added, timeout=5000) as blocker:
+        _create_venv(venv_dir, os.path.join("project", "other"))
+    assert blocker.args[1] == os.path.join("project", "other")
+
+    with qtbot.waitSignal(watcher.venv_removed, timeout=5000):
+        watcher.reload([venv_dir], max_depth=2, ignore={venv_dir: ["project"]})
+
+
+def test_follows_search_path_setting(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setattr(configure_json, "_CONFIGURE_JSON", None)
+    config = configure_json.get_configure_json()
+    venv_dir = str(tmp_path / "venvs")
+    scripts = _create_venv(venv_dir, "a")
+    watcher = InventoryWatcher(interpreters_path=None)
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+    reloads = []
+    watcher._reload_timer.timeout.connect(lambda: reloads.append(True))
+
+    config.rewrite_option(PREFETCH_METADATA, True)
+    qtbot.wait(50)
+    assert not reloads
+
+    with qtbot.waitSignal(watcher.venv_added, timeout=5000) as blocker:
+        config.rewrite_config(VENV_SEARCH_PATH, [venv_dir])
+        config.rewrite_option(VENV_SEARCH_DEPTH, 2)
+    assert blocker.args == [scripts, "a", False]
+    assert reloads == [True]
+
+
+def test_changes_are_listed_in_the_background(qtbot, tmp_path, monkeypatch):
+    venv_dir = str(tmp_path / "venvs")
+    os.mkdir(venv_dir)
+    watcher = InventoryWatcher(search_paths=[venv_dir], interpreters_path=None)
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+    threads = []
+
+    def scan_venv_dir(*args):
+        threads.append(threading.current_thread())
+        return find_python.scan_venv_dir(*args)
+
+    monkeypatch.setattr(watcher_module, "scan_venv_dir", scan_venv_dir)
+    with qtbot.waitSignal(watcher.venv_added, timeout=5000):
+        _create_venv(venv_dir, "new")
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_removed_search_path_ignores_pending_listing(qtbot, tmp_path):
+    venv_dir = str(tmp_path / "venvs")
+    _create_venv(venv_dir, "a")
+    watcher = InventoryWatcher(search_paths=[venv_dir], interpreters_path=None)
+    watcher.reload([])
+    with qtbot.assertNotEmitted(watcher.venv_added, wait=200):
+        pass
+    assert venv_dir not in watcher.watched_paths + watcher.polled_paths
+
+
+def test_interpreters_are_found_in_the_background(qtbot, tmp_path, monkeypatch):
+    interpreters_path = str(tmp_path / "ansys")
+    os.mkdir(interpreters_path)
+    release = threading.Event()
+    threads = []
+
+    def find_miniforge():
+        # Blocks like a slow conda start, until the test releases it
+        threads.append(threading.current_thread())
+        release.wait(5)
+        return {}
+
+    def find_installed():
+        return {
+            os.path.join(interpreters_path, name): (name.split("-")[1], False)
+            for name in os.listdir(interpreters_path)
+        }
+
+    monkeypatch.setattr(watcher_module, "find_miniforge", find_miniforge)
+    monkeypatch.setattr(
+        watcher_module, "find_ansys_installed_python_linux", find_installed
+    )
+    watcher = InventoryWatcher(search_paths=[], interpreters_path=interpreters_path)
+    assert watcher.refreshing
+    release.set()
+    qtbot.waitUntil(lambda: not watcher.refreshing)
+
+    release.clear()
+    os.mkdir(os.path.join(interpreters_path, "python-3.12.1"))
+    watcher._refresh_interpreters()
+    assert watcher.refreshing
+    with qtbot.waitSignal(watcher.interpreter_added, timeout=5000) as blocker:
+        release.set()
+    assert blocker.args == [
+        os.path.join(interpreters_path, "python-3.12.1"),
+        "Python 3.12.1",
+        False,
+    ]
+    assert threading.main_thread() not in threads
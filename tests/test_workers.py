@@ -0,0 +1,57 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+from ansys.tools.installer.workers import RequestDispatcher
+
+
+def test_superseded_request_is_discarded(qtbot):
+    dispatcher = RequestDispatcher(max_threads=2)
+    release = threading.Event()
+    results = []
+
+    def slow(value):
+        release.wait(5)
+        return value
+
+    dispatcher.submit("versions", slow, "first", on_result=results.append)
+    dispatcher.submit("versions", slow, "second", on_result=results.append)
+    release.set()
+
+    qtbot.waitUntil(lambda: not dispatcher.is_pending("versions"))
+    dispatcher.wait()
+    qtbot.wait(10)
+    assert results == ["second"]
+
+
+def test_errors_are_delivered(qtbot):
+    dispatcher = RequestDispatcher()
+    errors = []
+
+    def fail():
+        raise ValueError("boom")
+
+    dispatcher.submit("targets", fail, on_error=errors.append)
+
+    qtbot.waitUntil(lambda: len(errors) == 1)
+    assert isinstance(errors[0], ValueError)